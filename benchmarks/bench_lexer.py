@@ -0,0 +1,50 @@
+"""
+Lexer scaling bench.
+
+Multi-megabyte generated .jhand sources (lambi lines wale data tables aur
+normal code) ko lex karta hai aur MB/s + tokens/s print karta hai. Linear
+lexer mein size double karne par time bhi lagbhag double hona chahiye.
+
+    python -m benchmarks.bench_lexer [--sizes 1 2 4 8] [--line-tokens 20000]
+"""
+import argparse
+import time
+
+from jhand.lexer import Lexer
+
+from benchmarks.corpus import code_source, long_lines_source
+
+
+def bench(source: str, repeat: int):
+    best = float("inf")
+    ntokens = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ntokens = len(Lexer(source).tokenize())
+        best = min(best, time.perf_counter() - start)
+    return best, ntokens
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="bench_lexer", description="Lexer scaling bench")
+    ap.add_argument("--sizes", type=float, nargs="+", default=[1, 2, 4, 8], help="source sizes in MB")
+    ap.add_argument("--line-tokens", type=int, default=20000, help="dict entries per long line")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args(argv)
+
+    shapes = {
+        "long-lines": lambda b: long_lines_source(b, args.line_tokens),
+        "code": code_source,
+    }
+    print(f"{'shape':<12}{'MB':>6}{'tokens':>12}{'sec':>10}{'MB/s':>10}{'Mtok/s':>10}")
+    for name, make in shapes.items():
+        for mb in args.sizes:
+            source = make(int(mb * 1024 * 1024))
+            secs, ntokens = bench(source, args.repeat)
+            real_mb = len(source) / (1024 * 1024)
+            print(f"{name:<12}{real_mb:>6.1f}{ntokens:>12}{secs:>10.3f}"
+                  f"{real_mb / secs:>10.2f}{ntokens / secs / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Front-end + runtime pipeline bench.
+
+Har corpus shape (``benchmarks.corpus.SHAPES``) aur size ke liye har stage
+ka best-of-N time nikalta hai — ``Lexer.tokenize``, ``Parser.parse``,
+``Transpiler.transpile``, ``compile``, exec — aur tokens/s + lines/s print
+karta hai. ``--json`` se results file mein, ``--compare`` se purane run se
+milao; koi stage threshold se zyada slow ho to exit code 1 (CI ke liye).
+
+    python -m benchmarks.bench_pipeline [--sizes 0.25 1] [--shapes code long-lines]
+                                        [--repeat 5] [--json out.json]
+                                        [--compare base.json] [--threshold 0.10]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import jhand
+import jhand.runtime  # noqa: F401 — exec stage ko builtins.bol chahiye
+from jhand.lexer import Lexer
+from jhand.parser import Parser
+from jhand.transpiler import Transpiler
+
+from benchmarks.corpus import SHAPES
+
+STAGES = ("lex", "parse", "transpile", "compile", "exec")
+
+
+def _best(func, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_source(source: str, repeat: int, name: str = "<bench>") -> dict:
+    """Time every stage on ``source``; return a result dict."""
+    lex_s, tokens = _best(lambda: Lexer(source).tokenize(), repeat)
+    parse_s, ast = _best(lambda: Parser(tokens).parse(), repeat)
+    transpile_s, py_code = _best(
+        lambda: Transpiler(ast, preserve_lines=True).transpile(), repeat)
+    compile_s, code = _best(lambda: compile(py_code, name, "exec"), repeat)
+    exec_s, _ = _best(lambda: exec(code, {"__name__": "__bench__"}), repeat)
+
+    n_tokens = len(tokens)
+    n_lines = source.count("\n") or 1
+    seconds = dict(zip(STAGES, (lex_s, parse_s, transpile_s, compile_s, exec_s)))
+    return {
+        "bytes": len(source),
+        "lines": n_lines,
+        "tokens": n_tokens,
+        "seconds": seconds,
+        "tokens_per_s": {s: n_tokens / t for s, t in seconds.items() if t},
+        "lines_per_s": {s: n_lines / t for s, t in seconds.items() if t},
+    }
+
+
+def run(shapes, sizes, repeat: int) -> dict:
+    results = []
+    for shape in shapes:
+        for mb in sizes:
+            source = SHAPES[shape](int(mb * 1024 * 1024))
+            res = bench_source(source, repeat, name=f"<{shape}>")
+            res.update(shape=shape, size_mb=mb)
+            results.append(res)
+            _print_row(res)
+    return {
+        "jhand": jhand.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _print_header():
+    cols = "".join(f"{s + ' ms':>14}" for s in STAGES)
+    print(f"{'shape':<15}{'KB':>8}{'lines':>9}{'tokens':>10}{cols}{'Mtok/s':>9}{'lines/s':>11}")
+
+
+def _print_row(res):
+    sec = res["seconds"]
+    front = sec["lex"] + sec["parse"] + sec["transpile"] + sec["compile"]
+    cols = "".join(f"{sec[s] * 1000:>14.2f}" for s in STAGES)
+    # throughput = poora front end (lex → compile), exec ke bina
+    print(f"{res['shape']:<15}{res['bytes'] / 1024:>8.0f}{res['lines']:>9}{res['tokens']:>10}{cols}"
+          f"{res['tokens'] / front / 1e6:>9.2f}{res['lines'] / front:>11.0f}")
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> int:
+    """Print per-stage ratios vs ``baseline``; return the number of regressions."""
+    base = {(r["shape"], r["size_mb"]): r for r in baseline.get("results", [])}
+    regressions = 0
+    print(f"\n📊 vs baseline (jhand {baseline.get('jhand')}, python {baseline.get('python')}), "
+          f"ratio = new/old time")
+    for res in current["results"]:
+        old = base.get((res["shape"], res["size_mb"]))
+        if old is None:
+            continue
+        parts = []
+        for stage in STAGES:
+            before, after = old["seconds"].get(stage), res["seconds"][stage]
+            if not before:
+                continue
+            ratio = after / before
+            mark = ""
+            if ratio > 1 + threshold:
+                mark = " 🔴"
+                regressions += 1
+            elif ratio < 1 - threshold:
+                mark = " 🟢"
+            parts.append(f"{stage} {ratio:.2f}{mark}")
+        print(f"   {res['shape']:<15}{res['size_mb']:>6} MB  " + "  ".join(parts))
+    return regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="bench_pipeline", description="Lexer → exec pipeline bench")
+    ap.add_argument("--shapes", nargs="+", choices=sorted(SHAPES), default=sorted(SHAPES))
+    ap.add_argument("--sizes", type=float, nargs="+", default=[0.25, 1], help="source sizes in MB")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--json", metavar="FILE", help="results JSON file mein likho")
+    ap.add_argument("--compare", metavar="FILE", help="purane --json run se compare karo")
+    ap.add_argument("--threshold", type=float, default=0.10,
+                    help="itne fraction se slow = regression (default 0.10)")
+    args = ap.parse_args(argv)
+
+    _print_header()
+    report = run(args.shapes, args.sizes, args.repeat)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results: {args.json}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {regressions} stage(s) {args.threshold:.0%} se zyada slow")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Synthetic .jhand corpora for the benchmarks.
+
+Har generator ek target size (bytes) tak code repeat karta hai aur valid,
+exec-able JHAND return karta hai — top level par kuch print nahi hota,
+taaki exec stage ka time sirf definitions/imports ka ho.
+"""
+
+# Python 100 indentation levels se zyada allow nahi karta
+MAX_DEPTH = 90
+
+
+def _repeat(make_chunk, target_bytes: int) -> str:
+    parts = []
+    size = 0
+    n = 0
+    while size < target_bytes:
+        chunk = make_chunk(n)
+        parts.append(chunk)
+        size += len(chunk)
+        n += 1
+    return "".join(parts)
+
+
+def long_lines_source(target_bytes: int, entries_per_line: int = 2000) -> str:
+    """Generated config module: har line ek bada dict literal."""
+    row = ", ".join(f'"k{i}": {i}' for i in range(entries_per_line))
+    return _repeat(lambda n: f"table_{n} = {{{row}}}\n", target_bytes)
+
+
+def code_source(target_bytes: int) -> str:
+    """Normal-looking JHAND code: functions, loops, prints."""
+    block = (
+        "bhenchod kaam_{n}(x, y):\n"
+        "    agar x > y:\n"
+        "        leja x * 2 + y\n"
+        "    warna:\n"
+        "        bol(f\"chhota {{x}}\")\n"
+        "    leja y\n\n"
+    )
+    return _repeat(lambda n: block.format(n=n), target_bytes)
+
+
+def deep_nesting_source(target_bytes: int, depth: int = 40) -> str:
+    """Functions whose bodies nest ``depth`` levels of agar/haramkhor/jabtak."""
+    depth = min(depth, MAX_DEPTH)
+
+    def header(d):
+        # CPython max 20 nested loop blocks allow karta hai — har 5th level hi loop
+        if d % 5 != 4:
+            return f"agar x > {d}:"
+        return f"haramkhor i{d} in range(2):" if d % 10 == 4 else f"jabtak x < {d}:"
+
+    def chunk(n):
+        lines = [f"bhenchod gehra_{n}(x):"]
+        for d in range(depth):
+            lines.append("    " * (d + 1) + header(d))
+        lines.append("    " * (depth + 1) + "x = x + 1")
+        lines.append("    leja x")
+        return "\n".join(lines) + "\n\n"
+
+    return _repeat(chunk, target_bytes)
+
+
+def many_classes_source(target_bytes: int, methods: int = 5) -> str:
+    """Lots of small classes with decorated methods and comprehensions."""
+    def chunk(n):
+        lines = [f"madarchod Cls{n}:", f"    tag = {n}"]
+        lines.append("    bhenchod banao(self, a):")
+        lines.append("        self.a = a")
+        lines.append("        leja self")
+        lines.append("    @property")
+        lines.append("    bhenchod naam(self):")
+        lines.append(f"        leja \"cls{n}\"")
+        for m in range(methods):
+            lines.append(f"    bhenchod m{m}(self, x, y={m}):")
+            lines.append("        leja [self.a + x * i haramkhor i in range(y)]")
+        return "\n".join(lines) + "\n\n"
+
+    return _repeat(chunk, target_bytes)
+
+
+# Sirf stdlib — exec stage bina network/pip ke chale
+_STDLIB = ("os", "sys", "math", "json", "re", "time", "random", "itertools",
+           "functools", "collections", "string", "heapq", "bisect", "struct")
+_FROM = (("collections", "OrderedDict, deque"), ("os.path", "join, dirname"),
+         ("itertools", "chain, islice"), ("functools", "reduce, partial"))
+
+
+def heavy_imports_source(target_bytes: int) -> str:
+    """Import-heavy modules: plain, aliased and from-imports, plus a little code."""
+    def chunk(n):
+        mod = _STDLIB[n % len(_STDLIB)]
+        frm, names = _FROM[n % len(_FROM)]
+        return (f"laao {mod}\n"
+                f"laao {mod} as m{n}\n"
+                f"se_laao {frm} laao {names}\n"
+                f"x{n} = m{n}\n")
+
+    return _repeat(chunk, target_bytes)
+
+
+# name → generator(target_bytes) -> source
+SHAPES = {
+    "code": code_source,
+    "deep-nesting": deep_nesting_source,
+    "long-lines": long_lines_source,
+    "many-classes": many_classes_source,
+    "heavy-imports": heavy_imports_source,
+}
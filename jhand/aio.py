@@ -0,0 +1,230 @@
+"""
+``jhand --async``: JHAND program ek managed asyncio event loop par chalao.
+
+    laao asyncio
+
+    tez_bhenchod bhenchod main():
+        await asyncio.sleep(1)
+        bol("ho gaya")
+
+Is mode mein:
+
+* module body ``PyCF_ALLOW_TOP_LEVEL_AWAIT`` se compile hoti hai — top-level
+  ``await`` seedha likh sakte ho, body khud loop par chalti hai;
+* body ke baad agar ``main`` ek ``tez_bhenchod bhenchod`` hai aur body ne use
+  khud nahi bulaya, to runner use await karta hai — har script ko apna
+  ``asyncio.run`` nahi likhna padta;
+* poore program ke liye ek hi loop (``--uvloop`` ho aur installed ho to uvloop),
+  jo ``asyncio.get_event_loop()`` bhi wahi deta hai; aakhir mein bache tasks
+  cancel, async generators aur default executor band;
+* jo callback loop ko ``--slow-callback`` ms se zyada rokta hai (blocking
+  I/O, ``time.sleep``, bhaari CPU kaam) uski .jhand line turant stderr par.
+"""
+import asyncio
+import dis
+import inspect
+import sys
+import time
+
+from .runtime import main_module, report_runtime_error
+
+# body ke baad isi naam ka async function entry point hai
+ENTRY = "main"
+# itne seconds se lamba callback "loop-blocking" hai
+SLOW_CALLBACK = 0.1
+
+
+def new_event_loop(use_uvloop: bool = False):
+    """A fresh event loop; uvloop's when asked for and installed."""
+    if use_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            print("⚠️ uvloop install nahi hai — asyncio ka default loop chal raha hai 🐌",
+                  file=sys.stderr)
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def is_async_body(code) -> bool:
+    """True if ``code`` is a module body with top-level ``await`` (a coroutine code object)."""
+    return bool(code.co_flags & inspect.CO_COROUTINE)
+
+
+def _loads_name(code, name: str) -> bool:
+    # sirf module body ke instructions — functions ke code objects alag consts hain
+    for ins in dis.get_instructions(code):
+        if ins.argval == name and ins.opname in ("LOAD_NAME", "LOAD_GLOBAL"):
+            return True
+    return False
+
+
+def find_entry(code, env: dict, entry: str = ENTRY):
+    """The async entry point the runner should await after the body, or None."""
+    fn = env.get(entry)
+    if not inspect.iscoroutinefunction(fn):
+        return None
+    if _loads_name(code, entry):
+        # body ne khud main() chala diya (ya asyncio.run(main()))
+        return None
+    return fn
+
+
+# -------------------------
+# Slow callback instrumentation
+# -------------------------
+def _innermost_frame(coro):
+    """
+    Deepest suspended frame of ``coro``'s await chain — the deepest .jhand one
+    if any (``asyncio.sleep`` ka frame kisi kaam ka nahi). None once it finished.
+    """
+    frame = jhand_frame = None
+    while coro is not None:
+        f = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if f is None:
+            break
+        frame = f
+        if f.f_code.co_filename.endswith(".jhand"):
+            jhand_frame = f
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    return jhand_frame or frame
+
+
+def _task_of(handle):
+    callback = handle._callback
+    task = getattr(callback, "__self__", None)
+    return task if isinstance(task, asyncio.Task) else None
+
+
+class SlowCallbackMonitor:
+    """
+    Times every callback the loop runs and reports those taking longer than
+    ``threshold`` seconds. For a task step that's the .jhand ``await`` it
+    stopped at — the blocking code is just before it.
+
+    Pure-asyncio loops are instrumented by wrapping ``Handle._run`` (sirf ek
+    clock read per callback; location slow case mein hi nikalti hai); other
+    loops (uvloop) fall back to asyncio debug mode's ``slow_callback_duration``.
+    """
+
+    def __init__(self, threshold: float = SLOW_CALLBACK, out=None):
+        self.threshold = threshold
+        self.out = out
+        self._original = None
+
+    def install(self, loop):
+        if not isinstance(loop, asyncio.BaseEventLoop):
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.threshold
+            return
+        handle_cls = asyncio.events.Handle
+        original = self._original = handle_cls._run
+        report = self._report
+        threshold = self.threshold
+        clock = time.perf_counter
+
+        def _run(handle):
+            start = clock()
+            try:
+                return original(handle)
+            finally:
+                elapsed = clock() - start
+                if elapsed >= threshold:
+                    report(handle, elapsed)
+
+        handle_cls._run = _run
+
+    def uninstall(self):
+        if self._original is not None:
+            asyncio.events.Handle._run = self._original
+            self._original = None
+
+    def _report(self, handle, elapsed: float):
+        task = _task_of(handle)
+        if task is not None:
+            coro = task.get_coro()
+            frame = _innermost_frame(coro)
+            if frame is not None:
+                code = frame.f_code
+                where = f"{code.co_filename}:{frame.f_lineno} ({code.co_name}) wale await se pehle"
+            else:
+                # task isi step mein khatam ho gaya
+                code = getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+                where = (f"{code.co_name} ({code.co_filename}:{code.co_firstlineno}) ka aakhri hissa"
+                         if code is not None else f"task {task.get_name()}")
+        else:
+            callback = handle._callback
+            code = getattr(callback, "__code__", None)
+            name = getattr(callback, "__qualname__", repr(callback))
+            where = f"{name} ({code.co_filename}:{code.co_firstlineno})" if code else name
+        print(f"🐢 Loop {elapsed * 1000:.0f} ms tak ruka raha — {where}. "
+              f"Blocking kaam ko await wale API ya loop.run_in_executor() mein daal.",
+              file=self.out or sys.stderr)
+
+
+# -------------------------
+# Runner
+# -------------------------
+def _shutdown(loop):
+    # asyncio.run() jaisa cleanup: bache tasks cancel, asyncgens + executor band
+    try:
+        tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                loop.call_exception_handler({
+                    "message": "unhandled exception during jhand --async shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                })
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        if hasattr(loop, "shutdown_default_executor"):
+            loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+def execute(code, entry: str = ENTRY, use_uvloop: bool = False,
+            slow_callback: float = SLOW_CALLBACK):
+    """Run a compiled JHAND program on one managed event loop; exceptions propagate."""
+    loop = new_event_loop(use_uvloop)
+    asyncio.set_event_loop(loop)
+    monitor = SlowCallbackMonitor(slow_callback) if slow_callback else None
+    if monitor is not None:
+        monitor.install(loop)
+    try:
+        with main_module() as env:
+            if is_async_body(code):
+                loop.run_until_complete(eval(code, env))
+            else:
+                exec(code, env)
+            fn = find_entry(code, env, entry)
+            if fn is not None:
+                loop.run_until_complete(fn())
+    finally:
+        try:
+            _shutdown(loop)
+        finally:
+            if monitor is not None:
+                monitor.uninstall()
+            asyncio.set_event_loop(None)
+
+
+def run_program(code, entry: str = ENTRY, use_uvloop: bool = False,
+                slow_callback: float = SLOW_CALLBACK) -> bool:
+    """
+    Run a compiled JHAND program on one managed event loop (see module doc).
+
+    ``slow_callback`` is the blocking threshold in seconds (0 = off). Returns
+    False if the program raised (after roasting it), True otherwise.
+    """
+    try:
+        execute(code, entry, use_uvloop, slow_callback)
+        return True
+    except Exception as e:
+        report_runtime_error(e)
+        return False
@@ -1,19 +1,130 @@
 # astnode.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
 
 class ASTNode:
     """
-    ASTNode represents a node in the Abstract Syntax Tree (AST) for JHAND language.
-    Each node has a type, an optional value, and optional children nodes.
+    Base of the JHAND AST node classes. Every node type is its own slotted
+    class (no per-instance ``__dict__``) with typed fields, so the transpiler
+    can dispatch on ``type(node)`` instead of building a method name string.
+    ``line``/``col`` are the .jhand position of the statement's first token.
     """
-    def __init__(self, nodetype: str, value=None, children: Optional[List["ASTNode"]] = None):
-        self.nodetype = nodetype           # e.g., "Program", "Class", "Function", "Block", "Expr", "Print"
-        self.value = value                 # can be string, dict, or any other info depending on node type
-        self.children = children or []     # list of ASTNode children
+    __slots__ = ("line", "col")
+
+    nodetype = "Node"   # class-level name, debugging/repr ke liye
+    children = ()       # leaf nodes share one empty tuple, list allocate nahi hoti
+
+    def __init__(self, line: int = 0, col: int = 0):
+        self.line = line
+        self.col = col
+
+    def _fields(self) -> str:
+        return ""
+
+    def __repr__(self):
+        return f"{self.nodetype}({self._fields()}, children={len(self.children)})"
+
+
+class _Container(ASTNode):
+    """A node with a body of child statements."""
+    __slots__ = ("children",)
 
-    def add_child(self, child: "ASTNode"):
+    def __init__(self, children: Optional[List[ASTNode]] = None, line: int = 0, col: int = 0):
+        self.children = children if children is not None else []
+        self.line = line
+        self.col = col
+
+    def add_child(self, child: ASTNode):
         """Add a child node to this AST node."""
         self.children.append(child)
 
-    def __repr__(self):
-        return f"ASTNode({self.nodetype}, {self.value}, children={len(self.children)})"
+
+class Program(_Container):
+    __slots__ = ()
+    nodetype = "Program"
+
+
+class Function(_Container):
+    __slots__ = ("name", "params", "is_async")
+    nodetype = "Function"
+
+    def __init__(self, name: str, params: str = "", is_async: bool = False,
+                 children: Optional[List[ASTNode]] = None, line: int = 0, col: int = 0):
+        super().__init__(children, line, col)
+        self.name = name
+        self.params = params
+        self.is_async = is_async
+
+    def _fields(self):
+        return f"{self.name!r}, {self.params!r}, async={self.is_async}"
+
+
+class Class(_Container):
+    __slots__ = ("name",)
+    nodetype = "Class"
+
+    def __init__(self, name: str, children: Optional[List[ASTNode]] = None,
+                 line: int = 0, col: int = 0):
+        super().__init__(children, line, col)
+        self.name = name
+
+    def _fields(self):
+        return repr(self.name)
+
+
+class Block(_Container):
+    """if/elif/else/while/for/try/except/finally/with — header as written."""
+    __slots__ = ("header",)
+    nodetype = "Block"
+
+    def __init__(self, header: str, children: Optional[List[ASTNode]] = None,
+                 line: int = 0, col: int = 0):
+        super().__init__(children, line, col)
+        self.header = header
+
+    def _fields(self):
+        return repr(self.header)
+
+
+class Import(ASTNode):
+    """``import module [as alias]`` or ``from module import symbols``."""
+    __slots__ = ("module", "symbols", "alias")
+    nodetype = "Import"
+
+    def __init__(self, module: str, symbols: Optional[List[Tuple[str, Optional[str]]]] = None,
+                 alias: Optional[str] = None, line: int = 0, col: int = 0):
+        super().__init__(line, col)
+        self.module = module
+        self.symbols = symbols if symbols is not None else []   # [(name, alias or None)]
+        self.alias = alias
+
+    def _fields(self):
+        return f"{self.module!r}, {self.symbols!r}, alias={self.alias!r}"
+
+
+class Print(ASTNode):
+    __slots__ = ("content",)
+    nodetype = "Print"
+
+    def __init__(self, content: str, line: int = 0, col: int = 0):
+        super().__init__(line, col)
+        self.content = content   # bol(...) ke andar ka text
+
+    def _fields(self):
+        return repr(self.content)
+
+
+class Expr(ASTNode):
+    """Any other statement, kept as its Python source text."""
+    __slots__ = ("text",)
+    nodetype = "Expr"
+
+    def __init__(self, text: str, line: int = 0, col: int = 0):
+        super().__init__(line, col)
+        self.text = text
+
+    def _fields(self):
+        return repr(self.text)
+
+
+NODE_TYPES = (Program, Function, Class, Block, Import, Print, Expr)
@@ -0,0 +1,154 @@
+"""
+``jhand build <dir>`` — poore tree ke .jhand files ko parallel precompile karo.
+
+Har file ``cache.ensure_cached`` se ``__jhandcache__`` mein compile hoti hai
+(content hash same ho to skip), ``ProcessPoolExecutor`` ke workers mein.
+Aakhir mein ek JSON manifest likha jata hai jisme har file ki cache entry
+aur uska key (``-O`` par module aur entry-script dono ke) hota hai, aur jo
+files compile nahi huin unke errors.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import __version__
+from . import cache
+
+MANIFEST_NAME = "jhand-manifest.json"
+
+# Folders jinke andar dhoondna bekaar hai
+_SKIP_DIRS = {cache.CACHE_DIR, "__pycache__", "node_modules", "venv"}
+
+
+def find_sources(root: str):
+    """All .jhand files under ``root`` (sorted, hidden/cache folders skipped)."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS and not d.startswith("."))
+        for name in sorted(filenames):
+            if name.endswith(".jhand"):
+                found.append(os.path.join(dirpath, name))
+    return found
+
+
+def optimize_levels(optimize: int):
+    """
+    Optimizer levels to precompile for ``build -O``: ``jhand -O`` runs the
+    entry script at level 2 and the modules it imports at level 1 — koi bhi
+    file dono ho sakti hai, to dono entries banti hain.
+    """
+    return (1, 2) if optimize else (0,)
+
+
+# manifest mein optimize_levels() ke har level ke fields: (cache entry, uska key)
+_ENTRY_FIELDS = (("cache", "hash"), ("entry_cache", "entry_hash"))
+
+
+def _build_one(args):
+    """Worker: compile one file; return a result dict (never raises)."""
+    path, force, optimize, lazy_imports = args
+    try:
+        built = False
+        keys = []
+        for level in optimize_levels(optimize):
+            key, fresh_build = cache.ensure_cached(path, force=force, optimize=level,
+                                                   lazy_imports=lazy_imports)
+            keys.append(key)
+            built = built or fresh_build
+    except SyntaxError as se:
+        return {"path": path, "status": "error",
+                "error": f"{se.msg} (line {se.lineno})" if se.lineno else se.msg}
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        return {"path": path, "status": "error", "error": str(e)}
+    return {"path": path, "status": "built" if built else "fresh", "hashes": keys}
+
+
+def build_tree(root: str, jobs: int = None, force: bool = False, manifest: str = None,
+               optimize: int = 0, lazy_imports: bool = False):
+    """
+    Precompile every .jhand file under ``root``; return the manifest dict.
+
+    ``jobs`` defaults to ``os.cpu_count()``; ``jobs=1`` builds in-process.
+    ``optimize`` / ``lazy_imports`` build the ``jhand -O`` / ``--lazy-imports``
+    cache entries instead (with ``optimize``, the module and the entry-script
+    variants — see ``optimize_levels``).
+    The manifest is written to ``manifest`` (default: ``root/jhand-manifest.json``).
+    """
+    root = os.path.abspath(root)
+    sources = find_sources(root)
+    work = [(path, force, optimize, lazy_imports) for path in sources]
+
+    if jobs == 1 or len(work) < 2:
+        results = [_build_one(item) for item in work]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(work) // ((jobs or os.cpu_count() or 1) * 4))
+            results = list(pool.map(_build_one, work, chunksize=chunksize))
+
+    files = {}
+    errors = {}
+    for res in results:
+        rel = os.path.relpath(res["path"], root).replace(os.sep, "/")
+        if res["status"] == "error":
+            errors[rel] = res["error"]
+            continue
+        levels = optimize_levels(optimize)
+        entry = {"status": res["status"]}
+        # har level ki apni entry aur apna key (level bhi key mein hai)
+        for (name, hash_name), level, key in zip(_ENTRY_FIELDS, levels, res["hashes"]):
+            jhc_path = cache.cache_paths(res["path"], level, lazy_imports)[0]
+            entry[name] = os.path.relpath(jhc_path, root).replace(os.sep, "/")
+            entry[hash_name] = key
+        files[rel] = entry
+
+    data = {
+        "jhand_version": __version__,
+        "cache_tag": cache.CACHE_TAG,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "files": files,
+        "errors": errors,
+    }
+    manifest = manifest or os.path.join(root, MANIFEST_NAME)
+    with open(manifest, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="jhand build",
+        description="📦 Folder ke saare .jhand files ko parallel precompile karo"
+    )
+    parser.add_argument("dir", help="Folder jisme .jhand files hain")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Kitne worker processes (default: CPU count)")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="Up-to-date files ko bhi dobara compile karo")
+    parser.add_argument("-O", "--optimize", action="store_true",
+                        help="'jhand -O' wale optimized entries banao")
+    parser.add_argument("--lazy-imports", action="store_true",
+                        help="'jhand --lazy-imports' wale entries banao")
+    parser.add_argument("--manifest", default=None,
+                        help=f"Manifest ka path (default: <dir>/{MANIFEST_NAME})")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.dir):
+        print(f"❌ Folder nahi mila: {args.dir}")
+        return 1
+
+    start = time.perf_counter()
+    data = build_tree(args.dir, jobs=args.jobs, force=args.force, manifest=args.manifest,
+                      optimize=1 if args.optimize else 0, lazy_imports=args.lazy_imports)
+    elapsed = time.perf_counter() - start
+
+    built = sum(1 for f in data["files"].values() if f["status"] == "built")
+    fresh = len(data["files"]) - built
+    for rel, err in sorted(data["errors"].items()):
+        print(f"🔴 {rel}: {err}", file=sys.stderr)
+    print(f"✅ {len(data['files']) + len(data['errors'])} files in {elapsed:.2f}s — "
+          f"{built} compiled, {fresh} already fresh, {len(data['errors'])} errors")
+    return 1 if data["errors"] else 0
@@ -0,0 +1,250 @@
+"""
+``jhand bundle main.jhand`` — poora program ek executable zipapp (``main.pyz``) mein.
+
+Entry file se ``laao`` / ``se_laao`` graph follow karke har pahuchne wala
+.jhand module abhi compile hota hai aur archive mein zipimport wale layout
+mein ``.pyc`` ban ke jata hai (``player.jhand`` → ``player.pyc``,
+``pkg/__init__.jhand`` → ``pkg/__init__.pyc``). jhand ka runtime package bhi
+``.pyc`` ban ke saath jata hai. Target machine par::
+
+    ./main.pyz args...        # ya: python main.pyz args...
+
+sirf archive khulta hai — na transpile, na ``__jhandcache__``, na koi
+writable folder. ``.pyc`` files unchecked-hash hain (PEP 552): import par
+source dhoondha ya mtime check nahi hota.
+
+Bytecode Python version se bandha hai — bundle usi minor version par chalega
+jis par bana (``__main__.py`` galat version par saaf error deta hai). Plain
+``.py`` / third-party packages bundle nahi hote, wo target par installed hone
+chahiye.
+"""
+import argparse
+import importlib.util
+import marshal
+import os
+import stat
+import sys
+import time
+import zipfile
+from ast import PyCF_ALLOW_TOP_LEVEL_AWAIT
+
+from . import cache
+
+# entry program archive mein is module naam se rehta hai
+MAIN_MODULE = "__jhand_main__"
+
+_BOOTSTRAP = '''\
+# jhand bundle: {entry}
+import sys
+from importlib.util import MAGIC_NUMBER
+if MAGIC_NUMBER != {magic!r}:
+    sys.exit("❌ Ye bundle Python {version} ke liye bana hai, ye Python %d.%d hai — "
+             "usi version se chalao ya dobara 'jhand bundle' karo" % sys.version_info[:2])
+from jhand import {runner}, runtime
+runtime.OWN_MAIN = True
+ok = {call}(__loader__.get_code({main!r}){args})
+sys.exit(0 if ok else 1)
+'''
+
+# reproducible archives: har entry ka same timestamp
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+class BundleError(Exception):
+    """The program could not be bundled (syntax errors, module outside the root)."""
+
+
+def pyc_bytes(code, source: bytes) -> bytes:
+    """An unchecked hash-based ``.pyc`` (PEP 552) for ``code``."""
+    # flags = 0b01: hash-based, check_source off
+    return (importlib.util.MAGIC_NUMBER + (1).to_bytes(4, "little")
+            + importlib.util.source_hash(source) + marshal.dumps(code))
+
+
+def _archive_name(path: str, root: str) -> str:
+    rel = os.path.relpath(path, root)
+    if rel.startswith(os.pardir + os.sep) or os.path.isabs(rel):
+        raise BundleError(f"{path}: bundle root ({root}) ke bahar hai")
+    return os.path.splitext(rel)[0].replace(os.sep, "/") + ".pyc"
+
+
+def _compile(path: str, root: str, optimize: int, lazy_imports: bool, top_level_await: bool):
+    """Front end for one module; return ``(code, jhand_imports, source_bytes)``."""
+    with open(path, "rb") as f:
+        data = f.read()
+    source = data.decode("utf-8")
+    compiled = cache.compile_source(source, path, optimize, lazy_imports, top_level_await)
+    # tracebacks mein root-relative naam (bundle ka asli path build time par pata nahi)
+    filename = os.path.relpath(path, root).replace(os.sep, "/")
+    flags = PyCF_ALLOW_TOP_LEVEL_AWAIT if top_level_await else 0
+    code = compile(compiled.py_code, filename, "exec", flags)
+    return code, compiled.jhand_imports, data
+
+
+def collect(entry: str, optimize: int = 0, lazy_imports: bool = False, async_mode: bool = False):
+    """
+    Compile ``entry`` and every .jhand module it reaches; return
+    ``{archive name: pyc bytes}``. Raises ``BundleError`` listing every
+    module that failed.
+    """
+    entry = os.path.abspath(entry)
+    root = os.path.dirname(entry)
+    files = {}
+    errors = []
+    # entry par level 2 (unused imports bhi), modules par 1 — jaise `jhand -O`
+    try:
+        code, pending, source = _compile(entry, root, 2 if optimize else 0, lazy_imports,
+                                         async_mode)
+        files[MAIN_MODULE + ".pyc"] = pyc_bytes(code, source)
+    except (SyntaxError, OSError, UnicodeDecodeError) as e:
+        raise BundleError(_describe(entry, root, e)) from None
+
+    seen = set()
+    pending = list(pending)
+    while pending:
+        path = os.path.abspath(pending.pop())
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            name = _archive_name(path, root)
+            code, imports, source = _compile(path, root, 1 if optimize else 0, lazy_imports, False)
+        except BundleError as e:
+            errors.append(str(e))
+            continue
+        except (SyntaxError, OSError, UnicodeDecodeError) as e:
+            errors.append(_describe(path, root, e))
+            continue
+        files[name] = pyc_bytes(code, source)
+        pending.extend(imports)
+        pending.extend(_parent_packages(path, root))
+    if errors:
+        raise BundleError("\n".join(sorted(errors)))
+    return files
+
+
+def _parent_packages(path: str, root: str):
+    # `laao pkg.util` pehle pkg/__init__.jhand chalata hai — graph mein wo nahi aata
+    directory = os.path.dirname(path)
+    while len(directory) > len(root):
+        init = os.path.join(directory, "__init__.jhand")
+        if os.path.isfile(init):
+            yield init
+        directory = os.path.dirname(directory)
+
+
+def _describe(path: str, root: str, exc: Exception) -> str:
+    rel = os.path.relpath(path, root)
+    if isinstance(exc, SyntaxError):
+        return f"{rel}: {exc.msg} (line {exc.lineno})" if exc.lineno else f"{rel}: {exc.msg}"
+    return f"{rel}: {exc}"
+
+
+def runtime_files() -> dict:
+    """The ``jhand`` package itself as ``{archive name: pyc bytes}``."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    files = {}
+    for name in sorted(os.listdir(here)):
+        if not name.endswith(".py"):
+            continue
+        with open(os.path.join(here, name), "rb") as f:
+            source = f.read()
+        code = compile(source, f"jhand/{name}", "exec", dont_inherit=True)
+        files[f"jhand/{name[:-3]}.pyc"] = pyc_bytes(code, source)
+    return files
+
+
+def bootstrap(entry: str, async_mode: bool = False, uvloop: bool = False) -> str:
+    """Source of the archive's ``__main__.py``."""
+    if async_mode:
+        runner, call, args = "aio", "aio.run_program", f", use_uvloop={uvloop!r}"
+    else:
+        runner, call, args = "runtime", "runtime.run_compiled", ""
+    return _BOOTSTRAP.format(entry=os.path.basename(entry), magic=importlib.util.MAGIC_NUMBER,
+                             version="%d.%d" % sys.version_info[:2], runner=runner, call=call,
+                             main=MAIN_MODULE, args=args)
+
+
+def bundle(entry: str, output: str = None, optimize: int = 0, lazy_imports: bool = False,
+           async_mode: bool = False, uvloop: bool = False,
+           interpreter: str = "/usr/bin/env python3", compress: bool = False):
+    """
+    Write the zipapp for ``entry``; return ``(output path, program module count)``.
+
+    ``interpreter`` goes in the shebang (None = no shebang). Entries are
+    stored uncompressed unless ``compress`` — cold start par inflate ka kharcha nahi.
+    """
+    program = collect(entry, optimize, lazy_imports, async_mode)
+    output = output or os.path.splitext(entry)[0] + ".pyz"
+    method = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+
+    entries = {"__main__.py": bootstrap(entry, async_mode, uvloop).encode("utf-8")}
+    entries.update(runtime_files())
+    entries.update(program)
+    # folder entries bhi — bina __init__ wale folders zipimport mein namespace packages banein
+    for name in list(entries):
+        parts = name.split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            entries.setdefault("/".join(parts[:i]) + "/", b"")
+
+    tmp = output + ".tmp"
+    with open(tmp, "wb") as f:
+        if interpreter:
+            f.write(b"#!" + interpreter.encode("utf-8") + b"\n")
+        with zipfile.ZipFile(f, "w", method) as zf:
+            for name in sorted(entries):
+                info = zipfile.ZipInfo(name, _ZIP_DATE)
+                info.compress_type = method
+                info.external_attr = (0o40755 << 16 | 0x10) if name.endswith("/") else 0o644 << 16
+                zf.writestr(info, entries[name])
+    os.replace(tmp, output)
+    if interpreter:
+        mode = os.stat(output).st_mode
+        os.chmod(output, mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return output, len(program)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="jhand bundle",
+        description="📦 Entry file + saare laao kiye .jhand modules ek executable zipapp mein"
+    )
+    parser.add_argument("file", help="Entry .jhand file")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Archive ka path (default: <file>.pyz)")
+    parser.add_argument("-O", "--optimize", action="store_true",
+                        help="'jhand -O' jaisa optimize karke bundle karo")
+    parser.add_argument("--lazy-imports", action="store_true",
+                        help="'jhand --lazy-imports' jaisa bundle karo")
+    parser.add_argument("--async", dest="async_mode", action="store_true",
+                        help="'jhand --async' jaisa chalao (top-level await, async main)")
+    parser.add_argument("--uvloop", action="store_true",
+                        help="--async mein uvloop use karo (target par installed ho to)")
+    parser.add_argument("-p", "--python", default="/usr/bin/env python3",
+                        help="Shebang interpreter (default: /usr/bin/env python3)")
+    parser.add_argument("--no-shebang", action="store_true",
+                        help="Shebang mat likho (tab 'python app.pyz' se chalao)")
+    parser.add_argument("-c", "--compress", action="store_true",
+                        help="Deflate se compress karo (chhota archive, thoda slow start)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.file):
+        print(f"❌ File nahi mili: {args.file}")
+        return 1
+
+    start = time.perf_counter()
+    try:
+        output, count = bundle(args.file, args.output, optimize=1 if args.optimize else 0,
+                               lazy_imports=args.lazy_imports, async_mode=args.async_mode,
+                               uvloop=args.uvloop,
+                               interpreter=None if args.no_shebang else args.python,
+                               compress=args.compress)
+    except BundleError as e:
+        for line in str(e).splitlines():
+            print(f"🔴 {line}", file=sys.stderr)
+        print("❌ Bundle nahi bana — upar wale errors theek karo", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(output)
+    print(f"✅ {output} — {count} .jhand modules, {size / 1024:.0f} KB, {elapsed:.2f}s")
+    return 0
@@ -0,0 +1,267 @@
+"""
+On-disk cache for transpiled JHAND programs (``__jhandcache__``).
+
+Har .jhand file ke saath ek ``__jhandcache__`` folder banta hai, bilkul
+``__pycache__`` ki tarah. Usme do files hoti hain:
+
+    <name>.<cache_tag>.jhc   marshal kiya hua code object + cache key
+    <name>.<cache_tag>.py    transpiled Python (debugging ke liye)
+    <name>.<cache_tag>.map   .py line → .jhand line/col source map
+
+``jhand -O`` / ``--lazy-imports`` / ``--async`` ka output alag files mein jata hai
+(``<name>.<cache_tag>.opt-1.jhc``, ``.lazy.jhc``, ``.async.jhc``), jaise ``__pycache__``
+mein ``.opt-1.pyc``.
+
+Cache key = source ka sha256 + jhand ``__version__`` + Python magic number
+(+ front-end modules ka fingerprint), to source, jhand ya Python version
+badalte hi entry apne aap stale ho jati hai.
+
+Entry likhne (aur miss par compile karne) ke time ``<name>.<cache_tag>.lock``
+par file lock rehta hai: kai threads/processes (``jhand build``, server workers)
+same file par ek saath aayein to ek compile karta hai, baaki uski entry padhte
+hain, aur ``.jhc``/``.py``/``.map`` kabhi alag alag versions ke nahi hote.
+"""
+import contextlib
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import tempfile
+from collections import namedtuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+from ast import PyCF_ALLOW_TOP_LEVEL_AWAIT
+
+from . import __version__
+from . import sourcemap
+from .lexer import Lexer
+from .optimizer import optimize as _optimize
+from .parser import Parser
+from .transpiler import Transpiler
+
+CACHE_DIR = "__jhandcache__"
+CACHE_TAG = sys.implementation.cache_tag or "jhand"
+
+# Result of one full front-end run
+Compiled = namedtuple("Compiled", "py_code code jhand_imports source_map")
+
+
+_frontend_stamp = None
+
+
+def _frontend_fingerprint() -> bytes:
+    # Front-end modules ki mtime/size bhi key mein — dev mein lexer/parser edit karo to cache stale ho jaye
+    global _frontend_stamp
+    if _frontend_stamp is None:
+        here = os.path.dirname(os.path.abspath(__file__))
+        parts = []
+        for name in ("lexer.py", "parser.py", "astnode.py", "optimizer.py", "transpiler.py", "cache.py"):
+            try:
+                st = os.stat(os.path.join(here, name))
+                parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+            except OSError:
+                parts.append(name)
+        _frontend_stamp = ";".join(parts).encode("utf-8")
+    return _frontend_stamp
+
+
+def _variant(optimize: int = 0, lazy_imports: bool = False, top_level_await: bool = False) -> str:
+    """Cache file suffix for non-default front-end options ('' for the default)."""
+    variant = f".opt-{optimize}" if optimize else ""
+    if lazy_imports:
+        variant += ".lazy"
+    if top_level_await:
+        variant += ".async"
+    return variant
+
+
+def source_key(source: str, optimize: int = 0, lazy_imports: bool = False,
+               top_level_await: bool = False) -> str:
+    """Cache key for ``source`` under the current jhand + Python versions."""
+    h = hashlib.sha256()
+    h.update(__version__.encode("ascii"))
+    h.update(importlib.util.MAGIC_NUMBER)
+    h.update(_frontend_fingerprint())
+    h.update(_variant(optimize, lazy_imports, top_level_await).encode("ascii"))
+    h.update(source.encode("utf-8"))
+    return h.hexdigest()
+
+
+def cache_paths(path: str, optimize: int = 0, lazy_imports: bool = False,
+                top_level_await: bool = False):
+    """Return ``(jhc_path, py_path, map_path)`` for the cache entry of ``path``."""
+    directory, name = os.path.split(os.path.abspath(path))
+    stem = os.path.splitext(name)[0]
+    base = os.path.join(directory, CACHE_DIR, f"{stem}.{CACHE_TAG}")
+    base += _variant(optimize, lazy_imports, top_level_await)
+    return base + ".jhc", base + ".py", base + ".map"
+
+
+def compile_source(source: str, path: str, optimize: int = 0, lazy_imports: bool = False,
+                   top_level_await: bool = False):
+    """
+    Run the full front end; return a ``Compiled`` tuple.
+
+    The Python is emitted line-preserving, so the code object's line numbers
+    are the .jhand file's own. ``optimize`` is the ``optimizer`` level (0 = off).
+    ``top_level_await`` compiles with ``PyCF_ALLOW_TOP_LEVEL_AWAIT`` (``jhand
+    --async``): a module body that awaits becomes a coroutine code object.
+    """
+    try:
+        ast = Parser(Lexer(source).iter_tokens()).parse()
+    except SyntaxError as se:
+        if se.text is None and se.lineno:
+            # parser ke paas source nahi hota — report ke liye line yahin bhar do
+            lines = source.splitlines()
+            if se.lineno <= len(lines):
+                se.text = lines[se.lineno - 1]
+        raise
+    if optimize:
+        _optimize(ast, optimize)
+    t = Transpiler(ast, source_path=path, preserve_lines=True, lazy_imports=lazy_imports)
+    py_code = t.transpile()
+    flags = PyCF_ALLOW_TOP_LEVEL_AWAIT if top_level_await else 0
+    code = compile(py_code, path, "exec", flags)
+    # isi variant ka map — tracebacks -O / --async code ke liye bhi sahi lines dikhayen
+    sourcemap.register(path, t.source_map)
+    return Compiled(py_code, code, t.jhand_imports, t.source_map)
+
+
+def _read_entry(jhc_path: str, key: str):
+    try:
+        with open(jhc_path, "rb") as f:
+            entry = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, tuple) or len(entry) != 3 or entry[0] != key:
+        return None
+    return entry
+
+
+def _write_atomic(path: str, data: bytes):
+    # Unique temp file + os.replace: parallel processes ek doosre ki half-written file nahi padhenge
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".jhand-", suffix=".tmp")
+    except OSError:
+        # Read-only folder ya permission issue — cache ke bina bhi kaam chalega
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+@contextlib.contextmanager
+def entry_lock(jhc_path: str):
+    """
+    Exclusive lock on the cache entry ``jhc_path`` (threads and processes).
+
+    Creates ``__jhandcache__`` if needed. Jahan lock nahi mil sakta (read-only
+    folder, koi locking API nahi) wahan bina lock ke chalta hai — tab bhi har
+    file ``os.replace`` se atomic hai.
+    """
+    try:
+        os.makedirs(os.path.dirname(jhc_path), exist_ok=True)
+        fd = os.open(os.path.splitext(jhc_path)[0] + ".lock", os.O_RDWR | os.O_CREAT, 0o666)
+    except OSError:
+        yield
+        return
+    try:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        except OSError:
+            pass
+        yield
+    finally:
+        # fd band hote hi lock chhoot jata hai (flock aur msvcrt dono)
+        os.close(fd)
+
+
+def _write_entry(path: str, key: str, compiled: Compiled, optimize: int, lazy_imports: bool,
+                 top_level_await: bool = False):
+    jhc_path, py_path, map_path = cache_paths(path, optimize, lazy_imports, top_level_await)
+    if not os.path.isdir(os.path.dirname(jhc_path)):
+        return
+    _write_atomic(py_path, compiled.py_code.encode("utf-8"))
+    _write_atomic(map_path, compiled.source_map.to_bytes())
+    _write_atomic(jhc_path, marshal.dumps((key, compiled.code, list(compiled.jhand_imports))))
+
+
+def store(path: str, key: str, compiled: Compiled, optimize: int = 0, lazy_imports: bool = False,
+          top_level_await: bool = False):
+    """Write a cache entry for ``path`` under its lock; failures are silently ignored."""
+    with entry_lock(cache_paths(path, optimize, lazy_imports, top_level_await)[0]):
+        _write_entry(path, key, compiled, optimize, lazy_imports, top_level_await)
+
+
+def _build_locked(path: str, source: str, key: str, force: bool, optimize: int, lazy_imports: bool,
+                  top_level_await: bool = False):
+    """Under the entry lock: reuse an entry another worker just wrote, else compile + store.
+    Returns ``(code, built)``."""
+    jhc_path = cache_paths(path, optimize, lazy_imports, top_level_await)[0]
+    with entry_lock(jhc_path):
+        if not force:
+            entry = _read_entry(jhc_path, key)
+            if entry is not None:
+                sourcemap.register_cached(path, cache_paths(path, optimize, lazy_imports,
+                                                            top_level_await)[2])
+                return entry[1], False
+        compiled = compile_source(source, path, optimize, lazy_imports, top_level_await)
+        _write_entry(path, key, compiled, optimize, lazy_imports, top_level_await)
+        return compiled.code, True
+
+
+def get_code(path: str, source: str = None, optimize: int = 0, lazy_imports: bool = False,
+             top_level_await: bool = False):
+    """
+    Return the compiled code object for the .jhand file at ``path``.
+
+    Warm runs load the marshalled code from ``__jhandcache__`` and skip
+    lexing, parsing, transpiling and ``compile()`` entirely. Raises
+    ``SyntaxError`` if the source does not compile.
+    """
+    path = os.path.abspath(path)
+    if source is None:
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+    key = source_key(source, optimize, lazy_imports, top_level_await)
+    jhc_path, _, map_path = cache_paths(path, optimize, lazy_imports, top_level_await)
+
+    entry = _read_entry(jhc_path, key)
+    if entry is not None:
+        sourcemap.register_cached(path, map_path)
+        return entry[1]
+    return _build_locked(path, source, key, False, optimize, lazy_imports, top_level_await)[0]
+
+
+def ensure_cached(path: str, force: bool = False, optimize: int = 0, lazy_imports: bool = False):
+    """
+    Make sure ``path`` has a fresh cache entry; return ``(key, built)``.
+
+    ``built`` is False when an up-to-date entry already existed. Raises
+    ``SyntaxError`` if the source does not compile.
+    """
+    path = os.path.abspath(path)
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    key = source_key(source, optimize, lazy_imports)
+    if not force and _read_entry(cache_paths(path, optimize, lazy_imports)[0], key) is not None:
+        return key, False
+    return key, _build_locked(path, source, key, force, optimize, lazy_imports)[1]
@@ -2,6 +2,8 @@ import argparse
 import sys
 import os
 from . import transpiler
+from . import cache
+from . import importer
 from . import runtime  # ✅ Required for run_jhand
 
 # Ensure current working directory is on sys.path so relative imports work
@@ -9,10 +11,54 @@ if os.getcwd() not in sys.path:
     sys.path.insert(0, os.getcwd())
 
 
-def main():
+def _cmd_build(argv):
+    from . import build
+    return build.main(argv)
+
+
+def _cmd_bundle(argv):
+    from . import bundle
+    return bundle.main(argv)
+
+
+def _cmd_deps(argv):
+    from . import deps
+    return deps.main(argv)
+
+
+def _cmd_serve(argv):
+    from . import server
+    return server.main(argv)
+
+
+def _cmd_watch(argv):
+    from . import watch
+    return watch.main(argv)
+
+
+# `jhand <command> ...` subcommands; baaki sab `jhand file.jhand` hai
+COMMANDS = {
+    "build": _cmd_build,
+    "bundle": _cmd_bundle,
+    "deps": _cmd_deps,
+    "serve": _cmd_serve,
+    "watch": _cmd_watch,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in COMMANDS:
+        sys.exit(COMMANDS[argv[0]](argv[1:]))
+
     parser = argparse.ArgumentParser(
         prog="jhand",
-        description="🔥 JHAND Language CLI — transpile & run .jhand code like a boss"
+        description="🔥 JHAND Language CLI — transpile & run .jhand code like a boss",
+        epilog="Commands: jhand build <dir>  (saare .jhand files precompile karo), "
+               "jhand bundle <file>  (executable .pyz zipapp banao), "
+               "jhand deps <file>  (saare imports abhi check/install karo), "
+               "jhand serve  (warm daemon; 'jhand-client file.jhand' se chalao), "
+               "jhand watch <file>  (save par dobara chalao)"
     )
     parser.add_argument("file", help="Path to the .jhand file to run")
     parser.add_argument(
@@ -20,13 +66,137 @@ def main():
         action="store_true",
         help="Sirf transpile karo, run mat karo (Python code print karega)"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="__jhandcache__ ko ignore karo, har baar poora transpile karo"
+    )
+    parser.add_argument(
+        "-O", "--optimize",
+        action="store_true",
+        help="Constant folding, dead branches/unreachable code aur unused imports hatao"
+    )
+    parser.add_argument(
+        "--lazy-imports",
+        action="store_true",
+        help="'laao x' ko lazy banao — module pehli baar use hone par hi import hoga"
+    )
+    parser.add_argument(
+        "--eager",
+        metavar="MODULE",
+        action="append",
+        default=[],
+        help="--lazy-imports mein bhi is module ko turant import karo (repeat kar sakte ho)"
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Managed asyncio loop par chalao: top-level await, async main() khud chalega"
+    )
+    parser.add_argument(
+        "--uvloop",
+        action="store_true",
+        help="--async mein uvloop use karo (installed ho to)"
+    )
+    parser.add_argument(
+        "--slow-callback",
+        metavar="MS",
+        type=float,
+        default=100.0,
+        help="--async mein jo callback loop ko itne ms se zyada roke uski line batao (0 = band)"
+    )
+    parser.add_argument(
+        "--check-deps",
+        action="store_true",
+        help="Chalane se pehle saare imports check karo; missing hon to ek saath install (ya ruk jao)"
+    )
+    parser.add_argument(
+        "--no-auto-install",
+        action="store_true",
+        help="Missing module par pip mat chalao (JHAND_AUTO_INSTALL=0 jaisa)"
+    )
+    parser.add_argument(
+        "--buffered-output",
+        action="store_true",
+        help="bol ka output 1 MiB buffer mein, batches mein likho (TTY par line-buffered)"
+    )
+    parser.add_argument(
+        "--flush-interval",
+        metavar="SEC",
+        type=float,
+        default=1.0,
+        help="--buffered-output mein har itne seconds par flush (0 = sirf buffer bharne/exit par)"
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Alag child process mein chalao aur wall/CPU time, peak RSS, exit status batao"
+    )
+    parser.add_argument(
+        "--cpu-limit",
+        metavar="SEC",
+        type=float,
+        default=None,
+        help="Itne CPU seconds ke baad program maar do (implies --isolate)"
+    )
+    parser.add_argument(
+        "--wall-limit",
+        metavar="SEC",
+        type=float,
+        default=None,
+        help="Itne asli seconds ke baad program (aur uske child processes) maar do (implies --isolate)"
+    )
+    parser.add_argument(
+        "--mem-limit",
+        metavar="MB",
+        type=float,
+        default=None,
+        help="Address space itne MB tak — zyada maange to MemoryError (implies --isolate)"
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        default=None,
+        help="Run report JSON mein save karo ('-' = stdout) (implies --isolate)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Phase timings (lex/parse/transpile/compile) + cProfile hotspots .jhand lines par"
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="FILE",
+        default=None,
+        help="Profile data save karo: *.json = speedscope, baaki = pstats (implies --profile)"
+    )
+    args = parser.parse_args(argv)
 
     # ✅ Validate file path
     if not os.path.isfile(args.file):
         print(f"❌ File nahi mili: {args.file}")
         sys.exit(1)
 
+    # entry script par level 2 (unused imports bhi), imported modules par 1
+    optimize = 2 if args.optimize else 0
+
+    if args.transpile:
+        # ✅ Transpile JHAND code into Python code (statement by statement, file se stream karke)
+        print("\n=== 📜 Transpiled Python Code ===")
+        with open(args.file, "r", encoding="utf-8") as f:
+            if optimize:
+                # optimizer ko poora module chahiye (unused imports)
+                sys.stdout.write(transpiler.transpile(f.read(), os.path.abspath(args.file),
+                                                      optimize=optimize,
+                                                      lazy_imports=args.lazy_imports) + "\n")
+            else:
+                for chunk in transpiler.iter_transpile(f, source_path=os.path.abspath(args.file),
+                                                       lazy_imports=args.lazy_imports):
+                    sys.stdout.write(chunk)
+        print("=================================\n")
+        return
+
     # ✅ Read file with UTF-8 encoding
     try:
         with open(args.file, "r", encoding="utf-8") as f:
@@ -35,17 +205,84 @@ def main():
         print(f"❌ File read karte waqt error: {e}")
         sys.exit(1)
 
-    # ✅ Transpile JHAND code into Python code
-    py_code = transpiler.transpile(source, source_path=os.path.abspath(args.file))
+    # ✅ Script ka folder sys.path par, aur .jhand imports ke liye import hook
+    script_dir = os.path.dirname(os.path.abspath(args.file))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    importer.install(optimize=1 if optimize else 0, lazy_imports=args.lazy_imports)
+    # process program ka hai — uska __main__ run ke baad bhi rahe (pickle, atexit)
+    runtime.OWN_MAIN = True
+    if args.eager:
+        from . import lazy
+        lazy.EAGER.update(args.eager)
+    if args.no_auto_install:
+        runtime.AUTO_INSTALL = False
+    if args.check_deps:
+        # program chalne se pehle — missing deps request ke beech nahi milne chahiye
+        from . import deps
+        if not deps.check(args.file, install=runtime.auto_install_enabled(), out=sys.stderr,
+                          quiet=True):
+            sys.exit(1)
+    if args.buffered_output:
+        from . import output
+        output.buffer_stdout(interval=args.flush_interval)
 
-    if args.transpile:
-        print("\n=== 📜 Transpiled Python Code ===")
-        print(py_code)
-        print("=================================\n")
-    else:
-        # ✅ Run transpiled code through runtime (with roasting 🥵)
-        runtime.run_jhand(py_code, filename=args.file)
+    isolated = (args.isolate or args.cpu_limit or args.wall_limit or args.mem_limit
+                or args.report)
+    if args.profile or args.profile_out:
+        if isolated:
+            print("❌ --profile ko --isolate / --cpu-limit / --wall-limit / --mem-limit / --report "
+                  "ke saath nahi chala sakte — profiler program ke process mein hi chalta hai",
+                  file=sys.stderr)
+            sys.exit(2)
+        from . import profiler
+        options = {}
+        if args.async_mode:
+            options = {"use_uvloop": args.uvloop, "slow_callback": args.slow_callback / 1000}
+        profiler.profile_file(args.file, source, out=args.profile_out, optimize=optimize,
+                              lazy_imports=args.lazy_imports, async_mode=args.async_mode,
+                              **options)
+        return
 
+    # ✅ Compile (ya __jhandcache__ se uthao) aur run karo (with roasting 🥵)
+    try:
+        if args.no_cache:
+            compiled = cache.compile_source(source, os.path.abspath(args.file), optimize,
+                                            args.lazy_imports, args.async_mode).code
+        else:
+            compiled = cache.get_code(args.file, source, optimize, args.lazy_imports,
+                                      args.async_mode)
+    except SyntaxError as se:
+        runtime.report_syntax_error(se)
+        if not args.async_mode and "await" in str(se.msg):
+            print("💡 Top-level await ke liye: jhand --async " + args.file)
+        return
+    if isolated:
+        sys.exit(_run_isolated(compiled, args))
+    if args.async_mode:
+        from . import aio
+        aio.run_program(compiled, use_uvloop=args.uvloop,
+                        slow_callback=args.slow_callback / 1000)
+        return
+    runtime.run_compiled(compiled)
+
+
+def _run_isolated(compiled, args) -> int:
+    from . import isolate
+    memory = int(args.mem_limit * (1 << 20)) if args.mem_limit else None
+    options = {}
+    if args.async_mode:
+        options = {"use_uvloop": args.uvloop, "slow_callback": args.slow_callback / 1000}
+    try:
+        report = isolate.run_isolated(compiled, cpu=args.cpu_limit, wall=args.wall_limit,
+                                      memory=memory, async_mode=args.async_mode, **options)
+    except isolate.IsolationError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    print(isolate.summary(report, args.cpu_limit, args.wall_limit, memory), file=sys.stderr)
+    if args.report:
+        isolate.write_report(report, args.report)
+    return report.exit_code
 
 if __name__ == "__main__":
     main()
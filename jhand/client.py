@@ -0,0 +1,86 @@
+"""
+Thin client for ``jhand serve``.
+
+    jhand-client [--socket PATH] file.jhand [args...]
+
+Sirf stdlib ke chhote modules import karta hai (jhand runtime/transpiler
+nahi), file path + argv + cwd + env server ko bhejta hai, aur apne
+stdin/stdout/stderr file descriptors ``SCM_RIGHTS`` se pass karta hai —
+script ka output seedha isi terminal/pipe mein aata hai. Exit code wahi
+hota hai jo script ka.
+"""
+import array
+import json
+import os
+import socket
+import sys
+
+
+def default_socket_path() -> str:
+    """``$JHAND_SOCKET``, else a per-user socket in the runtime/temp dir."""
+    path = os.environ.get("JHAND_SOCKET")
+    if path:
+        return path
+    base = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(base, f"jhand-{os.getuid()}.sock")
+
+
+def send_request(sock: socket.socket, request: dict, fds):
+    """Send one JSON request line with ``fds`` attached."""
+    data = json.dumps(request).encode("utf-8") + b"\n"
+    ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds).tobytes())]
+    sent = sock.sendmsg([data], ancillary)
+    if sent < len(data):
+        sock.sendall(data[sent:])
+
+
+def read_line(sock: socket.socket, initial: bytes = b"") -> bytes:
+    buf = initial
+    while b"\n" not in buf:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buf += chunk
+    return buf.split(b"\n", 1)[0]
+
+
+def run(path: str, args=(), socket_path: str = None) -> int:
+    """Run ``path`` on the server; return the script's exit status."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path or default_socket_path())
+    try:
+        send_request(sock, {
+            "file": os.path.abspath(path),
+            "argv": list(args),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        }, [0, 1, 2])
+        reply = read_line(sock)
+    finally:
+        sock.close()
+    if not reply:
+        print("❌ jhand server ne beech mein connection kaat diya", file=sys.stderr)
+        return 2
+    return int(json.loads(reply.decode("utf-8")).get("status", 1))
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    socket_path = None
+    if len(argv) >= 2 and argv[0] == "--socket":
+        socket_path, argv = argv[1], argv[2:]
+    if not argv or argv[0] in ("-h", "--help"):
+        print("usage: jhand-client [--socket PATH] file.jhand [args...]")
+        sys.exit(0 if argv else 2)
+
+    try:
+        status = run(argv[0], argv[1:], socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ jhand server nahi chal raha ({socket_path or default_socket_path()}). "
+              f"Pehle 'jhand serve' chalao.", file=sys.stderr)
+        status = 2
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
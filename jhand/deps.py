@@ -0,0 +1,198 @@
+"""
+``jhand deps main.jhand`` — program ke saare imports deploy par hi check karo.
+
+Entry file aur uske ``laao`` kiye har .jhand module ke ``laao`` / ``se_laao``
+statically padhe jate hain (kuch chalaya nahi jata), har top-level module
+``importlib.util.find_spec`` se dhoondha jata hai, aur jo nahi mile wo sab
+ek saath report hote hain — request ke beech ``pip install`` nahi::
+
+    jhand deps main.jhand                          # sirf check (missing hon to exit 1)
+    jhand deps main.jhand --install                # missing ek hi pip call mein
+    jhand deps main.jhand --install --wheelhouse wheels/   # sirf local wheels, no network
+
+``koshish`` (try) / ``phaansi`` (except) ke andar wale imports optional maane
+jate hain — report hote hain par fail nahi karte. ``__import__`` /
+``importlib`` wale dynamic imports static scan mein nahi dikhte.
+"""
+import argparse
+import importlib
+import importlib.util
+import os
+import sys
+from collections import namedtuple
+
+from . import importer
+from .astnode import Block, Import
+from .lexer import Lexer
+from .parser import Parser
+from .transpiler import import_targets
+
+# ek import statement: kaunsa module, kahan, aur try ke andar hai ya nahi
+Requirement = namedtuple("Requirement", "module path line optional")
+
+# import naam → pip package naam, jahan dono alag hain
+PIP_NAMES = {
+    "bs4": "beautifulsoup4",
+    "cv2": "opencv-python",
+    "Crypto": "pycryptodome",
+    "dateutil": "python-dateutil",
+    "dotenv": "python-dotenv",
+    "jwt": "PyJWT",
+    "PIL": "pillow",
+    "serial": "pyserial",
+    "skimage": "scikit-image",
+    "sklearn": "scikit-learn",
+    "yaml": "pyyaml",
+}
+
+
+def pip_name(module: str) -> str:
+    """The pip package that provides top-level module ``module``."""
+    top = module.partition(".")[0]
+    return PIP_NAMES.get(top, top)
+
+
+def _collect(nodes, optional: bool, out: list):
+    for node in nodes:
+        if node.__class__ is Import:
+            out.append((node, optional))
+        elif node.children:
+            inner = optional
+            if node.__class__ is Block and node.header.lstrip().startswith(("try", "except")):
+                inner = True
+            _collect(node.children, inner, out)
+
+
+def scan(entry: str):
+    """
+    Statically collect the imports of ``entry`` and every .jhand module it
+    reaches. Returns ``(requirements, errors)`` — ``errors`` are modules
+    that could not be read or parsed, as ``"file: message"`` strings.
+    """
+    entry = os.path.abspath(entry)
+    root = os.path.dirname(entry)
+    requirements = []
+    errors = []
+    pending = [entry]
+    seen = set()
+    while pending:
+        path = os.path.abspath(pending.pop())
+        if path in seen:
+            continue
+        seen.add(path)
+        rel = os.path.relpath(path, root)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                tree = Parser(Lexer(f.read()).iter_tokens()).parse()
+        except SyntaxError as se:
+            errors.append(f"{rel}: {se.msg}")
+            continue
+        except (OSError, UnicodeDecodeError) as e:
+            errors.append(f"{rel}: {e}")
+            continue
+        found = []
+        _collect(tree.children, False, found)
+        for node, optional in found:
+            pending.extend(import_targets(node, path))
+            if node.module.startswith("."):
+                # relative import — package ke andar ki .jhand/.py file
+                continue
+            requirements.append(Requirement(node.module, rel, node.line, optional))
+    return requirements, errors
+
+
+def missing(requirements, root: str):
+    """
+    The requirements whose top-level module ``find_spec`` can't find, with
+    ``root`` (the entry's folder) on ``sys.path`` and the .jhand import hook
+    installed — exactly how ``jhand`` resolves them when running.
+    """
+    importer.install()
+    added = root not in sys.path
+    if added:
+        sys.path.insert(0, root)
+    try:
+        importlib.invalidate_caches()
+        found = {}
+        result = []
+        for req in requirements:
+            top = req.module.partition(".")[0]
+            if top not in found:
+                try:
+                    found[top] = importlib.util.find_spec(top) is not None
+                except (ImportError, ValueError):
+                    found[top] = False
+            if not found[top]:
+                result.append(req)
+        return result
+    finally:
+        if added:
+            sys.path.remove(root)
+
+
+def check(entry: str, install: bool = False, wheelhouse: str = None, out=None,
+          quiet: bool = False) -> bool:
+    """
+    Scan ``entry``, report every missing module in one go and, with
+    ``install``, pip install the required ones in a single call. Returns
+    True when nothing required is missing (afterwards). ``quiet`` skips the
+    report when that's the case.
+    """
+    from .runtime import pip_install
+    out = out or sys.stdout
+    wheelhouse = wheelhouse or os.environ.get("JHAND_WHEELHOUSE")
+    root = os.path.dirname(os.path.abspath(entry))
+    requirements, errors = scan(entry)
+    for err in errors:
+        print(f"🔴 {err}", file=out)
+    absent = missing(requirements, root)
+    if install and any(not req.optional for req in absent):
+        packages = sorted({pip_name(req.module) for req in absent if not req.optional})
+        print(f"📦 Installing {', '.join(packages)}"
+              + (f" (wheelhouse: {wheelhouse})" if wheelhouse else "") + " ... 🚀", file=out)
+        pip_install(packages, wheelhouse)
+        absent = missing(requirements, root)
+    ok = not errors and all(req.optional for req in absent)
+    if not (quiet and ok):
+        _report(requirements, absent, out)
+    return ok
+
+
+def _report(requirements, absent, out):
+    modules = {req.module.partition(".")[0] for req in requirements}
+    by_module = {}
+    for req in absent:
+        by_module.setdefault(req.module.partition(".")[0], []).append(req)
+    required = {m: reqs for m, reqs in by_module.items() if not all(r.optional for r in reqs)}
+    print(f"🔍 {len(modules)} modules import hote hain, {len(required)} missing", file=out)
+    for module in sorted(by_module):
+        reqs = by_module[module]
+        where = ", ".join(f"{r.path}:{r.line}" for r in reqs)
+        if module in required:
+            print(f"❌ {module}  (pip: {pip_name(module)})  — {where}", file=out)
+        else:
+            print(f"⚠️ {module}  (optional, koshish ke andar)  — {where}", file=out)
+    if required:
+        print(f"💡 Install: pip install {' '.join(sorted(pip_name(m) for m in required))}"
+              f"  (ya: jhand deps <file> --install [--wheelhouse DIR])", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="jhand deps",
+        description="🔍 Program ke saare imports abhi check karo — runtime par pip nahi"
+    )
+    parser.add_argument("file", help="Entry .jhand file")
+    parser.add_argument("--install", action="store_true",
+                        help="Missing modules ek hi pip call mein install karo")
+    parser.add_argument("--wheelhouse", metavar="DIR", default=None,
+                        help="Sirf is folder ke wheels se install karo (--no-index, network nahi)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.file):
+        print(f"❌ File nahi mili: {args.file}")
+        return 1
+    if args.wheelhouse and not os.path.isdir(args.wheelhouse):
+        print(f"❌ Wheelhouse folder nahi mila: {args.wheelhouse}")
+        return 1
+    return 0 if check(args.file, install=args.install, wheelhouse=args.wheelhouse) else 1
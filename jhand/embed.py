@@ -0,0 +1,289 @@
+"""
+Embedding API: JHAND snippets ko Python service ke andar baar baar chalao.
+
+    from jhand import embed
+
+    total = embed.compile("c = a + b\\nc * 2")
+    total(a=1, b=2)                 # → 6 (aakhri expression ki value)
+    total.run({"a": 5, "b": 5})     # → 20
+
+    helpers = {"math": math}         # har call mein copy hone wala template
+    area = embed.compile("math.pi * r ** 2", globals=helpers)
+    ns = {}
+    area.run({"r": 2}, namespace=ns) # apna namespace do — state call ke baad bhi rahe
+
+Snippet ek baar compile hota hai (lex → parse → transpile → ``compile()``);
+har call sirf template dict ki copy + ``exec`` hai. Errors print nahi hote,
+raise hote hain: ``JhandSyntaxError`` (``SyntaxError`` bhi hai) aur
+``JhandRuntimeError`` — dono mein .jhand line/col, aur runtime error mein
+original exception (``__cause__`` bhi wahi).
+"""
+import ast
+import builtins
+import contextlib
+import itertools
+import linecache
+import os
+import re
+import sys
+import threading
+import weakref
+
+from . import importer
+from . import sourcemap
+from .lexer import Lexer
+from .optimizer import optimize as _optimize
+from .parser import Parser
+from .runtime import program_globals
+from .transpiler import Transpiler
+
+# aakhri expression statement ki value yahan aati hai
+_RESULT = "__jhand_result__"
+# lexer/parser errors: "... at 3:7"
+_POSITION = re.compile(r"at (\d+):(\d+)")
+
+_counter = itertools.count(1)
+
+
+# -------------------------
+# Errors
+# -------------------------
+class JhandError(Exception):
+    """Base class of errors raised by the embedding API."""
+
+
+class JhandSyntaxError(SyntaxError, JhandError):
+    """Snippet did not compile. ``lineno``/``offset``/``text`` are .jhand positions."""
+
+
+class JhandRuntimeError(JhandError):
+    """
+    Snippet raised while running.
+
+    ``original`` is the exception itself (also ``__cause__``), ``type_name``
+    its class name, ``filename``/``line``/``col`` the .jhand position of the
+    innermost snippet frame. ``jhand_traceback`` is the traceback with .jhand
+    positions, formatted on first access.
+    """
+
+    def __init__(self, original: BaseException, filename: str, line: int = None, col: int = None):
+        super().__init__(f"{type(original).__name__}: {original}")
+        self.original = original
+        self.type_name = type(original).__name__
+        self.filename = filename
+        self.line = line
+        self.col = col
+        self._formatted = None
+
+    @property
+    def jhand_traceback(self) -> str:
+        if self._formatted is None:
+            exc = self.original
+            self._formatted = "".join(
+                sourcemap.format_exception(type(exc), exc, exc.__traceback__))
+        return self._formatted
+
+    def __str__(self):
+        where = f"{self.filename}:{self.line}" if self.line else self.filename
+        return f"{self.type_name} at {where}: {self.original}"
+
+
+# -------------------------
+# Snippets
+# -------------------------
+class Snippet:
+    """A compiled JHAND snippet; call it (or ``run``) as many times as you like."""
+
+    __slots__ = ("source", "filename", "code", "source_map", "_template", "_has_result",
+                 "_import_dir", "__weakref__")
+
+    def __init__(self, source: str, filename: str, code, source_map, template: dict,
+                 has_result: bool, import_dir: str = None):
+        self.source = source
+        self.filename = filename
+        self.code = code
+        self.source_map = source_map
+        self._template = template
+        self._has_result = has_result
+        self._import_dir = import_dir
+
+    def new_namespace(self, inputs=None) -> dict:
+        """A fresh namespace (template copy + ``inputs``) for ``run(namespace=...)``."""
+        ns = self._template.copy()
+        if inputs:
+            ns.update(inputs)
+        return ns
+
+    def run(self, inputs=None, namespace=None):
+        """
+        Execute the snippet; return the value of its last expression (or None).
+
+        Without ``namespace`` every call gets a fresh copy of the template;
+        with one, the snippet runs in it (missing template names are filled in)
+        and its variables stay there afterwards.
+        """
+        if namespace is None:
+            ns = self._template.copy()
+        else:
+            ns = namespace
+            for key, value in self._template.items():
+                if key not in ns:
+                    ns[key] = value
+        if inputs:
+            ns.update(inputs)
+        try:
+            if self._import_dir is None:
+                exec(self.code, ns)
+            else:
+                with _on_path(self._import_dir):
+                    exec(self.code, ns)
+        except Exception as exc:
+            raise self._runtime_error(exc) from exc
+        if self._has_result:
+            return ns.pop(_RESULT, None)
+        return None
+
+    def __call__(self, **inputs):
+        return self.run(inputs)
+
+    def _runtime_error(self, exc: Exception) -> JhandRuntimeError:
+        line = col = None
+        tb = exc.__traceback__
+        while tb is not None:
+            if tb.tb_frame.f_code.co_filename == self.filename:
+                line = tb.tb_lineno
+            tb = tb.tb_next
+        if line is not None:
+            pos = self.source_map.lookup(line)
+            if pos is not None:
+                line, col = pos
+        return JhandRuntimeError(exc, self.filename, line, col)
+
+    def __repr__(self):
+        return f"<jhand Snippet {self.filename}>"
+
+
+# folder → kitne runs use kar rahe hain (threads); sys.path mein tabhi tak rehta hai
+_path_users = {}
+_path_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _on_path(directory: str):
+    """``directory`` on ``sys.path`` while the block runs (if it wasn't already)."""
+    with _path_lock:
+        owned = directory in _path_users or directory not in sys.path
+        if owned:
+            if directory not in _path_users:
+                sys.path.insert(0, directory)
+            _path_users[directory] = _path_users.get(directory, 0) + 1
+    try:
+        yield
+    finally:
+        if owned:
+            with _path_lock:
+                _path_users[directory] -= 1
+                if not _path_users[directory]:
+                    del _path_users[directory]
+                    if directory in sys.path:
+                        sys.path.remove(directory)
+
+
+def _forget(filename: str, smap, lines):
+    # same filename par naya snippet aa chuka ho to uski entries mat chhedo
+    if sourcemap._registry.get(filename) is smap:
+        del sourcemap._registry[filename]
+    if lines is not None and linecache.cache.get(filename) is lines:
+        del linecache.cache[filename]
+
+
+def _syntax_error(se: SyntaxError, filename: str, source: str, smap=None,
+                  py_code: str = None) -> JhandSyntaxError:
+    lineno, offset = se.lineno, se.offset
+    if lineno is None:
+        match = _POSITION.search(str(se.msg))
+        if match:
+            lineno, offset = int(match.group(1)), int(match.group(2)) + 1
+    elif smap is not None:
+        pos = smap.lookup(lineno)
+        if pos is not None:
+            # Python ka column rakho, bas generated indent → .jhand indent shift karo
+            py_lines = py_code.splitlines() if py_code else []
+            if offset and lineno <= len(py_lines):
+                generated = py_lines[lineno - 1]
+                start = len(generated) - len(generated.lstrip())
+                offset = max(pos[1] + 1, offset - start + pos[1])
+            else:
+                offset = pos[1] + 1
+            lineno = pos[0]
+    lines = source.splitlines()
+    text = lines[lineno - 1] if lineno and 0 < lineno <= len(lines) else None
+    if text is not None and offset:
+        # generated code tokens ke beech space daalta hai — line se bahar mat jao
+        offset = min(offset, len(text.rstrip()) + 1)
+    return JhandSyntaxError(se.msg, (filename, lineno, offset, text))
+
+
+def _capture_last_expression(tree: ast.Module) -> bool:
+    """Rewrite a trailing expression statement into ``__jhand_result__ = <expr>``."""
+    if not tree.body or not isinstance(tree.body[-1], ast.Expr):
+        return False
+    last = tree.body[-1]
+    target = ast.Name(_RESULT, ast.Store())
+    tree.body[-1] = ast.copy_location(ast.Assign([target], last.value), last)
+    ast.fix_missing_locations(tree)
+    return True
+
+
+def compile(source: str, filename: str = None, globals: dict = None, optimize: int = 0) -> Snippet:
+    """
+    Compile JHAND ``source`` into a reusable ``Snippet``.
+
+    ``globals`` is a template namespace copied into every call (put
+    preloaded modules/helpers there). ``filename`` defaults to a unique
+    ``<jhand:N>``; with a real ``.jhand`` path, ``laao`` of sibling .jhand
+    (and .py) modules resolves against its folder while the snippet runs.
+    Raises ``JhandSyntaxError``.
+    """
+    if filename is None:
+        filename = f"<jhand:{next(_counter)}>"
+    try:
+        tree = Parser(Lexer(source).iter_tokens()).parse()
+        if optimize:
+            _optimize(tree, optimize)
+        t = Transpiler(tree, source_path=filename, preserve_lines=True)
+        py_code = t.transpile()
+    except SyntaxError as se:
+        raise _syntax_error(se, filename, source) from None
+
+    smap = t.source_map
+    try:
+        py_tree = ast.parse(py_code, filename)
+        has_result = _capture_last_expression(py_tree)
+        code = builtins.compile(py_tree, filename, "exec")
+    except SyntaxError as se:
+        raise _syntax_error(se, filename, source, smap, py_code) from None
+
+    template = program_globals("__jhand__")
+    if globals:
+        template.update(globals)
+
+    import_dir = None
+    if filename.endswith(".jhand") and not filename.startswith("<"):
+        importer.install()
+        import_dir = os.path.dirname(os.path.abspath(filename))
+    snippet = Snippet(source, filename, code, smap, template, has_result, import_dir)
+    # tracebacks mein .jhand text dikhe; snippet ke saath hi hat jaye
+    smap.source = filename
+    sourcemap.register(filename, smap)
+    lines = None
+    if filename.startswith("<"):
+        lines = (len(source), None, source.splitlines(True), filename)
+        linecache.cache[filename] = lines
+    weakref.finalize(snippet, _forget, filename, smap, lines)
+    return snippet
+
+
+def run(source: str, inputs=None, **kwargs):
+    """One-off: ``compile(source, **kwargs).run(inputs)``."""
+    return compile(source, **kwargs).run(inputs)
@@ -0,0 +1,101 @@
+"""
+Import hook for .jhand modules.
+
+``install()`` ke baad ``laao hello`` / ``se_laao pkg.sub laao cheez`` seedha
+``importlib`` ke through chalte hain: ``hello.jhand`` (ya ``pkg/__init__.jhand``)
+``sys.path`` / package ``__path__`` mein dhoondi jati hai, pehli import par
+lazily compile hoti hai aur bytecode ``__jhandcache__`` mein cache hota hai.
+Lookup ``sys.path_hooks`` ke ``FileFinder`` se hota hai, to path ka order
+(aur stdlib) waisa hi rehta hai jaisa ``.py`` files ke liye.
+"""
+import importlib
+import importlib.abc
+import sys
+
+from . import cache
+from .runtime import utf8_open
+
+JHAND_SUFFIX = ".jhand"
+
+
+class JhandLoader(importlib.abc.FileLoader, importlib.abc.SourceLoader):
+    """Loads a .jhand file, compiling it through the on-disk cache."""
+
+    optimize = 0
+    lazy_imports = False
+
+    def get_code(self, fullname):
+        return cache.get_code(self.get_filename(fullname), optimize=self.optimize,
+                              lazy_imports=self.lazy_imports)
+
+    def exec_module(self, module):
+        # program jaisa UTF-8 open() .jhand modules ke globals mein bhi (builtins patch nahi)
+        if not sys.flags.utf8_mode:
+            module.__dict__.setdefault("open", utf8_open)
+        super().exec_module(module)
+
+
+def loader_details():
+    """
+    ``FileFinder`` loader details: .jhand first, then the interpreter's own
+    (extension, .py, .pyc) — ek hi folder mein ``hello.jhand`` aur uska dump
+    kiya ``hello.py`` ho to .jhand chalta hai.
+    """
+    from importlib.machinery import (BYTECODE_SUFFIXES, EXTENSION_SUFFIXES, SOURCE_SUFFIXES,
+                                     ExtensionFileLoader, SourceFileLoader, SourcelessFileLoader)
+    return [
+        (JhandLoader, [JHAND_SUFFIX]),
+        (ExtensionFileLoader, EXTENSION_SUFFIXES),
+        (SourceFileLoader, SOURCE_SUFFIXES),
+        (SourcelessFileLoader, BYTECODE_SUFFIXES),
+    ]
+
+
+_hook = None
+
+
+def _reset_finders():
+    # purane FileFinders (bina .jhand ke) cache mein pade hain — naye hook se dobara banne do
+    from importlib.machinery import FileFinder
+    for entry, finder in list(sys.path_importer_cache.items()):
+        if finder is None or isinstance(finder, FileFinder):
+            del sys.path_importer_cache[entry]
+    importlib.invalidate_caches()
+
+
+def install(optimize: int = None, lazy_imports: bool = None):
+    """Put the .jhand-aware ``FileFinder`` hook on ``sys.path_hooks`` (idempotent).
+
+    Har ``sys.path`` entry (aur package ``__path__``) apni jagah par dekhi
+    jati hai — pehle wali entry ka ``.py`` / stdlib module baad wali entry
+    ke ``.jhand`` se pehle milta hai, bilkul normal import jaisa.
+    ``optimize`` / ``lazy_imports`` are the front-end options for imported
+    modules (``jhand -O`` / ``--lazy-imports``); None keeps the current ones.
+    """
+    global _hook
+    if optimize is not None:
+        JhandLoader.optimize = optimize
+    if lazy_imports is not None:
+        JhandLoader.lazy_imports = lazy_imports
+    if _hook is not None and _hook in sys.path_hooks:
+        return _hook
+    from importlib.machinery import FileFinder
+    _hook = FileFinder.path_hook(*loader_details())
+    # default FileFinder hook ki jagah se pehle (zipimport wagaira usse pehle hi rahen)
+    for i, hook in enumerate(sys.path_hooks):
+        if getattr(hook, "__qualname__", "").startswith("FileFinder.path_hook"):
+            sys.path_hooks.insert(i, _hook)
+            break
+    else:
+        sys.path_hooks.append(_hook)
+    _reset_finders()
+    return _hook
+
+
+def uninstall():
+    """Remove the .jhand path hook."""
+    global _hook
+    if _hook is not None and _hook in sys.path_hooks:
+        sys.path_hooks.remove(_hook)
+        _reset_finders()
+    _hook = None
@@ -0,0 +1,289 @@
+"""
+Incremental re-transpilation for files that are edited again and again
+(watch mode, editor integrations).
+
+Source text top-level "chunks" mein bantta hai: har wo line jo column 0 par
+kisi code character se shuru ho (space, ``#`` ya khali line nahi), naya
+chunk shuru karti hai. Har chunk ka output — AST se bana Python aur source
+map — chunk ke text par cache hota hai, lines chunk ke start se relative,
+to upar lines judne/hatne se cache nahi tootta. Agli run mein sirf wahi
+chunks lex/parse/transpile hote hain jinka text badla.
+
+Parser kabhi kabhi statement ko column 0 ke aage tak le jata hai (``bol(``
+ka ``)`` agli line ke column 0 par, ya header ke baad body bhi column 0
+par), aur multi-line strings ke andar bhi column 0 wali lines ho sakti
+hain. Isliye cache miss par parser chunk ke start se aage ke stream par
+chalta hai aur jahan ruke (agle chunk ka pehla token), wahan tak ke chunks
+ek "unit" ban jate hain — result bilkul poore-file parse jaisa, aur kaam
+sirf us unit jitna.
+"""
+import re
+from array import array
+
+from .astnode import Import
+from .lexer import EOF, STRING, Lexer, Token
+from .parser import Parser
+from .sourcemap import SourceMap
+from .transpiler import Transpiler, import_targets
+
+# column 0 par code — naya top-level chunk
+_CHUNK_START = re.compile(r"^[^\s#]", re.MULTILINE)
+
+
+class _UnitTranspiler(Transpiler):
+    """
+    ``Transpiler`` for one unit that doesn't pad: it notes where
+    ``preserve_lines`` would pad (``anchors``: lines index, physical line,
+    node line). Padding assemble ke waqt lagti hai — pichla unit apni lines se
+    zyada emit kare to poore-file transpile jaisa hi padding kam ho.
+    """
+
+    def __init__(self, record: bool):
+        super().__init__(None)
+        self.anchors = [] if record else None
+
+    def visit(self, node):
+        if self.anchors is not None and node is not None and node.line:
+            self.anchors.append((len(self.lines), self.line_count, node.line))
+        return super().visit(node)
+
+
+class _Entry:
+    """Cached output of one unit (one or more chunks)."""
+
+    __slots__ = ("lines", "map_lines", "map_cols", "anchors", "imports")
+
+    def __init__(self, nodes, t: _UnitTranspiler):
+        self.lines = t.lines
+        self.map_lines = t.source_map.lines   # relative to the unit's first line
+        self.map_cols = t.source_map.cols
+        self.anchors = t.anchors or ()
+        self.imports = [n for n in _walk(nodes) if n.__class__ is Import]
+
+
+def _extend(out_lines, map_lines, map_cols, entry, start, stop, physical, at, shift, line_count):
+    """Append ``entry.lines[start:stop]`` (physical lines ``physical:at``); new line count."""
+    out_lines.extend(entry.lines[start:stop])
+    map_lines.extend([line + shift if line else 0 for line in entry.map_lines[physical:at]])
+    map_cols.extend(entry.map_cols[physical:at])
+    return line_count + at - physical
+
+
+def _walk(nodes):
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children)
+
+
+def split_chunks(source: str):
+    """``(offsets, lines)``: start offset and 1-based line of every chunk."""
+    offsets = [m.start() for m in _CHUNK_START.finditer(source)]
+    if not offsets or offsets[0] != 0:
+        offsets.insert(0, 0)  # shuru ki khali/comment/indented lines
+    lines = [1]
+    count = source.count
+    for k in range(1, len(offsets)):
+        lines.append(lines[-1] + count("\n", offsets[k - 1], offsets[k]))
+    return offsets, lines
+
+
+def _broken_triple(prev, tok) -> bool:
+    """``""`` turant ``"...`` ke baad: ek triple-quoted string jo band nahi hui
+    aur regex ne do chhoti strings bana di. Aise tokens aage ke text par
+    depend karte hain (kahin ``\"\"\"`` mil gaya to poori string ban jayegi)."""
+    if (tok.type is STRING and prev is not None and prev.type is STRING
+            and prev.line == tok.line and prev.col + len(prev.value) == tok.col):
+        body = prev.value.lstrip("fFrRbB")
+        return len(body) == 2 and tok.value.lstrip("fFrRbB")[:1] == body[0]
+    return False
+
+
+def _lex_chunk(text: str, line: int):
+    """Tokens of one chunk (starting at ``line``) lexed on its own, or None if
+    that isn't safe (lex error — string agle chunk tak jaati hai — ya
+    ``_broken_triple``)."""
+    lexer = Lexer(text)
+    lexer.line = line
+    try:
+        tokens = lexer.tokenize()
+    except SyntaxError:
+        return None
+    tokens.pop()  # EOF
+    prev = None
+    for tok in tokens:
+        if _broken_triple(prev, tok):
+            return None
+        prev = tok
+    return tokens
+
+
+class IncrementalTranspiler:
+    """
+    Transpile successive versions of one file, reusing per-statement work.
+
+        inc = IncrementalTranspiler("app.jhand", preserve_lines=True)
+        py = inc.transpile(source)     # full run
+        py = inc.transpile(edited)     # sirf badle statements dobara
+        inc.source_map, inc.jhand_imports, inc.stats
+
+    Output (and source map) is identical to ``Transpiler`` on the whole file.
+    """
+
+    def __init__(self, source_path=None, preserve_lines: bool = False):
+        self.source_path = source_path
+        self.preserve_lines = preserve_lines
+        # chunk text → _Entry, ya int hint (unit itne chunks ka hai; entry tuple(texts) par)
+        self._cache = {}
+        self._volatile = False  # current unit ke tokens file ke baaki text par depend karte hain
+        self.source_map = SourceMap(source_path)
+        self.jhand_imports = []
+        self.stats = {"units": 0, "reused": 0, "rebuilt": 0}
+
+    # ---------------- per unit ----------------
+    def _tokens_from(self, source, texts, offsets, lines, lexed, i: int):
+        """Absolute-line tokens from chunk ``i`` to the end of the file.
+
+        ``lexed`` keeps chunks lexed during this run: parser agle chunk ka
+        pehla token dekh kar rukta hai, wahi chunk agle unit mein phir chahiye.
+        """
+        for k in range(i, len(texts)):
+            if k in lexed:
+                tokens = lexed[k]
+            else:
+                tokens = lexed[k] = _lex_chunk(texts[k], lines[k])
+            if tokens is None:
+                # yahan se aage ek saath lex karo (errors bhi sahi line ke saath)
+                lexer = Lexer(source[offsets[k]:])
+                lexer.line = lines[k]
+                prev = None
+                for tok in lexer.iter_tokens():
+                    if _broken_triple(prev, tok):
+                        self._volatile = True
+                    prev = tok
+                    yield tok
+                return
+            yield from tokens
+        yield Token(EOF, "", source.count("\n") + 1, 0)
+
+    def _parse_unit(self, source, texts, offsets, lines, chunk_at, lexed, i: int):
+        """Parse from chunk ``i`` until the next statement starts a later chunk.
+
+        Returns ``(nodes, j)``: the statements and the first chunk after the unit.
+        """
+        self._volatile = False
+        p = Parser(self._tokens_from(source, texts, offsets, lines, lexed, i))
+        nodes = []
+        while True:
+            tok = p.current()
+            if tok.type == "NEWLINE":
+                p.eat("NEWLINE")
+                continue
+            if tok.type == EOF:
+                return nodes, len(texts)
+            if tok.col == 0:
+                j = chunk_at.get(tok.line, i)
+                if j > i:
+                    for k in range(i, j):
+                        lexed.pop(k, None)
+                    return nodes, j
+            nodes.append(p.parse_statement(0))
+
+    def _emit(self, nodes, base: int) -> _Entry:
+        for node in _walk(nodes):
+            if node.line:
+                node.line -= base
+        t = _UnitTranspiler(self.preserve_lines)
+        for node in nodes:
+            t.visit(node)
+        return _Entry(nodes, t)
+
+    # ---------------- whole file ----------------
+    def transpile(self, source) -> str:
+        """Return the Python for ``source`` (a string or file object)."""
+        if not isinstance(source, str):
+            source = source.read()
+        offsets, lines = split_chunks(source)
+        n = len(offsets)
+        texts = [source[offsets[k]:offsets[k + 1]] for k in range(n - 1)]
+        texts.append(source[offsets[-1]:])
+
+        old = self._cache
+        new_cache = {}
+        chunk_at = None  # line → chunk index, pehle miss par banta hai
+        lexed = {}
+        out_lines = []
+        map_lines = array("I")
+        map_cols = array("I")
+        line_count = 0
+        imports = []
+        stats = {"units": 0, "reused": 0, "rebuilt": 0}
+
+        i = 0
+        while i < n:
+            entry = None
+            hint = old.get(texts[i])
+            if isinstance(hint, int):
+                j = i + hint
+                if j <= n:
+                    entry = old.get(tuple(texts[i:j]))
+            elif hint is not None:
+                entry, j = hint, i + 1
+
+            cacheable = True
+            if entry is None:
+                if chunk_at is None:
+                    chunk_at = {line: k for k, line in enumerate(lines)}
+                nodes, j = self._parse_unit(source, texts, offsets, lines, chunk_at, lexed, i)
+                entry = self._emit(nodes, lines[i] - 1)
+                cacheable = not self._volatile
+                stats["rebuilt"] += 1
+            else:
+                stats["reused"] += 1
+            # EOF par khatam unit shayad EOF ki wajah se hi ruka ho (jaise column 0
+            # par body wala header) — aage lines judne par wo lamba ho sakta hai
+            if cacheable and j < n:
+                if j - i == 1:
+                    new_cache[texts[i]] = entry
+                else:
+                    new_cache[texts[i]] = j - i
+                    new_cache[tuple(texts[i:j])] = entry
+            stats["units"] += 1
+
+            # ---- assemble (Transpiler.visit jaisi padding, har anchor par) ----
+            shift = lines[i] - 1
+            start = physical = 0
+            for index, at, line in entry.anchors:
+                missing = line + shift - 1 - (line_count + at - physical)
+                if missing > 0:
+                    line_count = _extend(out_lines, map_lines, map_cols, entry, start, index,
+                                         physical, at, shift, line_count)
+                    start, physical = index, at
+                    out_lines.extend([""] * missing)
+                    map_lines.extend([0] * missing)
+                    map_cols.extend([0] * missing)
+                    line_count += missing
+            line_count = _extend(out_lines, map_lines, map_cols, entry, start, len(entry.lines),
+                                 physical, len(entry.map_lines), shift, line_count)
+            imports.extend(entry.imports)
+            i = j
+
+        self._cache = new_cache
+        self.stats = stats
+        self.source_map = SourceMap(self.source_path, map_lines, map_cols)
+        self.jhand_imports = []
+        if self.source_path:
+            # har run par resolve — nayi .jhand file ban gayi ho to pata chale
+            for node in imports:
+                for candidate in import_targets(node, self.source_path):
+                    if candidate not in self.jhand_imports:
+                        self.jhand_imports.append(candidate)
+        return "\n".join(out_lines)
+
+    def compile(self, source):
+        """Transpile ``source`` and compile it; return a ``cache.Compiled``."""
+        from .cache import Compiled
+        py_code = self.transpile(source)
+        code = compile(py_code, self.source_path or "<jhand>", "exec")
+        return Compiled(py_code, code, self.jhand_imports, self.source_map)
@@ -0,0 +1,284 @@
+"""
+``jhand --isolate``: program ek alag child process mein, limits ke saath chalao.
+
+    jhand --cpu-limit 2 --wall-limit 10 --mem-limit 256 script.jhand
+    jhand --isolate --report run.json script.jhand
+
+Compile parent mein hota hai (``__jhandcache__`` wahi), phir ``fork``: child
+apne process group mein ``resource.setrlimit`` lagata hai aur program
+chalata hai; parent uska intezaar karta hai:
+
+* ``cpu`` — CPU seconds (``RLIMIT_CPU``); khatam hote hi kernel SIGXCPU bhejta hai,
+* ``wall`` — asli seconds; deadline par poora process group SIGKILL
+  (``milke_karo`` ke workers bhi),
+* ``memory`` — bytes of address space (``RLIMIT_AS``); zyada maanga to
+  program mein ``MemoryError``.
+
+Har run ka ek ``RunReport`` milta hai — status, exit code, signal, wall/CPU
+time, peak RSS (``wait4`` ke rusage se) aur exception (type, message, .jhand
+line, traceback) agar aayi. Sirf Unix (``fork`` + ``resource``) par.
+"""
+import atexit
+import errno
+import json
+import os
+import select
+import signal
+import sys
+import time
+import traceback
+from collections import namedtuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# status: "ok" | "exit" (non-zero sys.exit) | "error" | "memory" | "cpu_limit" | "timeout" | "killed"
+RunReport = namedtuple("RunReport",
+                       "status exit_code signal wall_time cpu_time peak_rss exception")
+
+# child ke exit ka poll (jab uske forked workers pipe khula rakhein)
+POLL_INTERVAL = 0.1
+
+
+class IsolationError(Exception):
+    """Isolated execution isn't available on this platform."""
+
+
+def supported() -> bool:
+    return hasattr(os, "fork") and resource is not None
+
+
+def _exception_info(exc: BaseException) -> dict:
+    from . import sourcemap
+    stack = sourcemap.remap_stack(traceback.extract_tb(exc.__traceback__))
+    where = [fs for fs in stack if fs.filename.endswith(".jhand")] or list(stack)
+    return {
+        "type": type(exc).__name__,
+        "message": str(exc),
+        "file": where[-1].filename if where else None,
+        "line": where[-1].lineno if where else None,
+        "traceback": "".join(sourcemap.format_exception(type(exc), exc, exc.__traceback__)),
+    }
+
+
+def _foreground(pgrp: int) -> bool:
+    """Give the terminal to process group ``pgrp`` (shell jaisa job control)."""
+    try:
+        if not os.isatty(0):
+            return False
+        old = signal.signal(signal.SIGTTOU, signal.SIG_IGN)
+        try:
+            os.tcsetpgrp(0, pgrp)
+        finally:
+            signal.signal(signal.SIGTTOU, old)
+        return True
+    except OSError:
+        return False
+
+
+def _set_limits(cpu, memory):
+    if cpu:
+        # soft par SIGXCPU; hard ek second baad (agar SIGXCPU pakda gaya) SIGKILL
+        seconds = max(1, int(cpu + 0.999))
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+    if memory:
+        resource.setrlimit(resource.RLIMIT_AS, (int(memory), int(memory)))
+
+
+def _run_child(code, write_fd, cpu, memory, roast, async_mode, async_options, terminal):
+    status = 1
+    info = None
+    try:
+        os.setpgid(0, 0)
+        if terminal:
+            # input() aur Ctrl-C program tak pahunchein
+            _foreground(os.getpgrp())
+        _set_limits(cpu, memory)
+        from . import runtime
+        runtime.OWN_MAIN = True
+        if async_mode:
+            from . import aio
+            aio.execute(code, **async_options)
+        else:
+            runtime.execute(code)
+        status = 0
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        if e.code is not None and not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+    except BaseException as e:
+        try:
+            info = _exception_info(e)
+            if roast:
+                from .runtime import report_runtime_error
+                report_runtime_error(e)
+        except BaseException:
+            # MemoryError ke baad roast bhi fail ho sakta hai — type to bacha lo
+            info = info or {"type": type(e).__name__, "message": "", "file": None,
+                            "line": None, "traceback": ""}
+    finally:
+        try:
+            # normal interpreter exit jaisa: atexit (buffered stdout, pools) phir flush
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.write(write_fd, json.dumps({"exception": info}).encode("utf-8"))
+        finally:
+            os._exit(status)
+
+
+def _wait(pid: int, fd: int, deadline):
+    """
+    Collect the child's report pipe and reap it; ``(data, status, usage)``,
+    or ``(data, None, None)`` once ``deadline`` passes. Polls ``wait4`` too —
+    forked grandchildren can keep the pipe open after the child is gone.
+    """
+    chunks = []
+    eof = False
+    while True:
+        if eof:
+            _, status, usage = os.wait4(pid, 0)
+            return b"".join(chunks), status, usage
+        now = time.monotonic()
+        if deadline is not None and now >= deadline:
+            return b"".join(chunks), None, None
+        timeout = POLL_INTERVAL if deadline is None else min(POLL_INTERVAL, deadline - now)
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if ready:
+            chunk = os.read(fd, 65536)
+            eof = not chunk
+            chunks.append(chunk)
+            continue
+        reaped, status, usage = os.wait4(pid, os.WNOHANG)
+        if reaped:
+            # child ja chuka — pipe mein jo bacha hai wo le lo
+            while select.select([fd], [], [], 0)[0]:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks), status, usage
+
+
+def _kill_group(pid: int):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except OSError as e:
+        if e.errno != errno.ESRCH:
+            raise
+
+
+def run_isolated(code, cpu: float = None, wall: float = None, memory: int = None,
+                 roast: bool = True, async_mode: bool = False, **async_options) -> RunReport:
+    """
+    Run compiled program ``code`` in a forked child under the given limits
+    (CPU seconds, wall seconds, address-space bytes; None = no limit) and
+    return its ``RunReport``. With ``async_mode`` it runs on ``aio.execute``
+    (``async_options``: ``entry``, ``use_uvloop``, ``slow_callback``).
+    ``roast`` prints the usual runtime error report from the child.
+    """
+    if not supported():
+        raise IsolationError("Isolated run ke liye fork + resource chahiye (sirf Unix) 🥲")
+    read_fd, write_fd = os.pipe()
+    try:
+        # terminal hamare paas (foreground) hai to child ko do, baad mein wapas lo
+        terminal = os.isatty(0) and os.tcgetpgrp(0) == os.getpgrp()
+    except OSError:
+        terminal = False
+    sys.stdout.flush()
+    sys.stderr.flush()
+    start = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        _run_child(code, write_fd, cpu, memory, roast, async_mode, async_options,
+                   terminal)  # never returns
+    os.close(write_fd)
+    try:
+        # child ka apna group ho — race na ho isliye parent bhi set karta hai
+        os.setpgid(pid, pid)
+    except OSError:
+        pass
+
+    try:
+        data, status, usage = _wait(pid, read_fd, start + wall if wall else None)
+        timed_out = status is None
+        if timed_out:
+            _kill_group(pid)
+            _, status, usage = os.wait4(pid, 0)
+    except BaseException:
+        # parent ko signal/exception — child ko akela mat chhodo
+        _kill_group(pid)
+        os.waitpid(pid, 0)
+        raise
+    finally:
+        os.close(read_fd)
+        if terminal:
+            _foreground(os.getpgrp())
+    elapsed = time.monotonic() - start
+    # bache hue grandchildren (milke_karo workers) bhi
+    _kill_group(pid)
+
+    try:
+        exception = json.loads(data.decode("utf-8"))["exception"] if data else None
+    except (ValueError, KeyError):
+        exception = None
+    sig = os.WTERMSIG(status) if os.WIFSIGNALED(status) else None
+    exit_code = os.WEXITSTATUS(status) if sig is None else 128 + sig
+    cpu_time = usage.ru_utime + usage.ru_stime
+    # Linux par ru_maxrss KB mein, macOS par bytes mein
+    peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+    if timed_out:
+        state = "timeout"
+    elif sig == getattr(signal, "SIGXCPU", None) or (sig == signal.SIGKILL and cpu
+                                                     and cpu_time >= cpu):
+        state = "cpu_limit"
+    elif sig is not None:
+        state = "killed"
+    elif exception is not None:
+        state = "memory" if exception["type"] == "MemoryError" else "error"
+    else:
+        state = "ok" if exit_code == 0 else "exit"
+    return RunReport(state, exit_code, sig, elapsed, cpu_time, peak_rss, exception)
+
+
+# -------------------------
+# Reporting
+# -------------------------
+_VERDICTS = {
+    "timeout": "⏰ Wall limit ({wall:g}s) khatam — program maar diya gaya",
+    "cpu_limit": "🔥 CPU limit ({cpu:g}s) khatam — program maar diya gaya",
+    "memory": "🐘 Memory limit ({memory_mb:g} MB) se zyada maanga — MemoryError",
+    "killed": "💀 Program signal {signal} se mara",
+}
+
+
+def summary(report: RunReport, cpu: float = None, wall: float = None, memory: int = None) -> str:
+    """One human line for ``report`` (plus a verdict line when a limit hit)."""
+    line = (f"📊 wall {report.wall_time:.3f}s · cpu {report.cpu_time:.3f}s · "
+            f"peak RSS {report.peak_rss / (1 << 20):.1f} MB · exit {report.exit_code} "
+            f"({report.status})")
+    verdict = _VERDICTS.get(report.status)
+    if verdict:
+        name = report.signal
+        if name is not None:
+            try:
+                name = signal.Signals(name).name
+            except ValueError:
+                pass
+        line = verdict.format(wall=wall or 0, cpu=cpu or 0, memory_mb=(memory or 0) / (1 << 20),
+                              signal=name) + "\n" + line
+    return line
+
+
+def write_report(report: RunReport, path: str):
+    """Save ``report`` as JSON (``-`` = stdout)."""
+    data = json.dumps(report._asdict(), indent=2, ensure_ascii=False)
+    if path == "-":
+        print(data)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data + "\n")
@@ -0,0 +1,42 @@
+"""
+Lazy module proxies for ``jhand --lazy-imports``.
+
+Is mode mein ``laao tkinter`` ban jata hai::
+
+    tkinter = __import__("jhand.lazy", fromlist=["_"]).module("tkinter")
+
+Module dhoondha abhi jata hai (``find_spec`` — galat naam par error usi line
+par aur auto-installer waise hi chalta hai), lekin uska code pehli attribute
+access par chalta hai (``importlib.util.LazyLoader``). Jo program kabhi
+``tkinter.Tk`` tak nahi pahunchta wo tkinter import ka kharcha nahi deta.
+
+Kuch modules ko import hote hi chalna chahiye (side effects) — wo ``EAGER``
+mein hain; ``jhand --eager naam`` se aur jode ja sakte hain.
+"""
+import importlib
+import importlib.util
+import sys
+
+# import par side effects chahiye — inhe kabhi lazy mat karo
+EAGER = {"__future__", "readline", "rlcompleter", "faulthandler", "tracemalloc"}
+
+
+def module(name: str):
+    """Return ``name`` as a module that executes on first attribute access."""
+    mod = sys.modules.get(name)
+    if mod is not None:
+        return mod
+    if name in EAGER or name.partition(".")[0] in EAGER:
+        return importlib.import_module(name)
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+        # namespace packages / purane loaders — LazyLoader inhe nahi sambhalta
+        return importlib.import_module(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    loader.exec_module(mod)
+    return mod
@@ -1,16 +1,42 @@
 import re
-from dataclasses import dataclass
-from typing import List
+import sys
+from typing import Iterator, List
+
+# ==============================
+# Token types (shared string objects, compared by identity-fast ==)
+# ==============================
+NUMBER = sys.intern("NUMBER")
+STRING = sys.intern("STRING")
+NAME = sys.intern("NAME")
+NEWLINE = sys.intern("NEWLINE")
+OP = sys.intern("OP")
+EOF = sys.intern("EOF")
+
 
 # ==============================
 # Token class
 # ==============================
-@dataclass
 class Token:
-    type: str
-    value: str
-    line: int
-    col: int
+    """
+    A single token. Slotted (no per-instance ``__dict__``) because large
+    files produce millions of these; ``type`` is always one of the shared
+    type strings above and NAME/OP values are interned.
+    """
+    __slots__ = ("type", "value", "line", "col")
+
+    def __init__(self, type: str, value: str, line: int, col: int):
+        self.type = type
+        self.value = value
+        self.line = line
+        self.col = col
+
+    def __eq__(self, other):
+        if other.__class__ is not Token:
+            return NotImplemented
+        return (self.type == other.type and self.value == other.value
+                and self.line == other.line and self.col == other.col)
+
+    __hash__ = None
 
     def __repr__(self):
         return f"<{self.type}('{self.value}') @{self.line}:{self.col}>"
@@ -20,7 +46,8 @@ class Token:
 # Token specifications (regex)
 # ==============================
 _TOKEN_SPEC = [
-    ("NUMBER",   r"\d+(\.\d+)?"),  # integers and floats
+    # ints, floats, hex/octal/binary, exponents, underscores, imaginary (1e5, 0x1F, 1_000, .5, 2j)
+    ("NUMBER",   r"0[xX][0-9a-fA-F_]+|0[oO][0-7_]+|0[bB][01_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d[\d_]*)?[jJ]?"),
     ("STRING",   r"(?:[fFrRbB]{0,2})(\"\"\"[\s\S]*?\"\"\"|'''[\s\S]*?'''|\"([^\"\\]|\\.)*\"|'([^'\\]|\\.)*')"),
     ("NAME",     r"[^\W\d_][\w]*"),  # unicode identifiers allowed
     ("NEWLINE",  r"\n"),  # newline
@@ -70,6 +97,8 @@ KEYWORD_MAP = {
     "ya": "or",
     "nahi": "not",
     "tez_bhenchod": "async",
+    "milke_karo": "pmap",
+    "milke_karte_jao": "pimap",
     # extra fun keywords
     "agar_na_mana": "elif",
     "bas_kar": "break",
@@ -88,37 +117,83 @@ KEYWORD_MAP = {
 # Lexer
 # ==============================
 class Lexer:
-    def __init__(self, text: str):
+    """
+    Tokenizes JHAND source. ``text`` can be a ``str`` or a file-like object
+    with ``read(n)``; file objects are consumed in chunks by ``iter_tokens``.
+    """
+    # chars a match must stay clear of the buffer end before we trust it
+    # (``1.`` + ``5``, ``**`` + ``=`` jaise tokens chunk boundary par na tootein)
+    _MARGIN = 4
+
+    def __init__(self, text, chunk_size: int = 64 * 1024):
         self.text = text
+        self.chunk_size = chunk_size
         self.line = 1
         self.col = 0
 
     def tokenize(self) -> List[Token]:
-        tokens: List[Token] = []
+        return list(self.iter_tokens())
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """Yield tokens lazily; only the unconsumed tail of a stream stays in memory."""
+        source = self.text
+        if isinstance(source, str):
+            buf, reader, eof = source, None, True
+        else:
+            buf, reader, eof = "", source, False
+        base = 0        # absolute offset of buf[0]
+        pos = 0         # current position inside buf
+        line_start = 0  # absolute offset of the first character of the current line
+        match = _TOKEN_RE.match
+        intern = sys.intern
+
+        while True:
+            if not eof:
+                mo = match(buf, pos) if pos < len(buf) else None
+                if mo is None or self._needs_more(mo, buf):
+                    # refill: unconsumed tail + next chunk (at least as big as the tail)
+                    chunk = reader.read(max(self.chunk_size, len(buf) - pos))
+                    if not chunk:
+                        eof = True
+                    base += pos
+                    buf = buf[pos:] + chunk
+                    pos = 0
+                    continue
+            elif pos >= len(buf):
+                break
+            else:
+                mo = match(buf, pos)
 
-        for mo in _TOKEN_RE.finditer(self.text):
             kind = mo.lastgroup
             value = mo.group()
-            start_index = mo.start()
+            start_index = base + mo.start()
+            pos = mo.end()
 
-            # calculate current column relative to the last newline
-            prev_newline = self.text.rfind("\n", 0, start_index)
-            col = start_index - (prev_newline + 1) if prev_newline != -1 else start_index
+            # column relative to the last newline, tracked incrementally (no rfind per token)
+            col = start_index - line_start
 
-            if kind == "NUMBER":
-                tokens.append(Token("NUMBER", value, self.line, col))
+            if kind == "NAME":
+                yield Token(NAME, intern(KEYWORD_MAP.get(value, value)), self.line, col)
 
-            elif kind == "STRING":
-                tokens.append(Token("STRING", value, self.line, col))
+            elif kind == "OP":
+                yield Token(OP, intern(value), self.line, col)
+
+            elif kind == "NUMBER":
+                yield Token(NUMBER, value, self.line, col)
 
-            elif kind == "NAME":
-                mapped = KEYWORD_MAP.get(value, value)
-                tokens.append(Token("NAME", mapped, self.line, col))
+            elif kind == "STRING":
+                yield Token(STRING, value, self.line, col)
+                # multi-line strings move the line counter too
+                newlines = value.count("\n")
+                if newlines:
+                    self.line += newlines
+                    line_start = start_index + value.rfind("\n") + 1
 
             elif kind == "NEWLINE":
-                tokens.append(Token("NEWLINE", "\n", self.line, col))
+                yield Token(NEWLINE, "\n", self.line, col)
                 self.line += 1
                 self.col = 0  # reset col after newline
+                line_start = base + pos
 
             elif kind == "SKIP":
                 continue  # just ignore spaces
@@ -126,14 +201,31 @@ class Lexer:
             elif kind == "COMMENT":
                 continue  # ignore comments too
 
-            elif kind == "OP":
-                tokens.append(Token("OP", value, self.line, col))
-
             elif kind == "MISMATCH":
-                raise SyntaxError(f"Unexpected character {value!r} at {self.line}:{col}")
+                # position bhi do — report_syntax_error "Line: None" na dikhaye
+                text_start = max(0, line_start - base)
+                text_end = buf.find("\n", mo.start())
+                text = buf[text_start:text_end if text_end != -1 else len(buf)]
+                raise SyntaxError(f"Unexpected character {value!r} at {self.line}:{col}",
+                                  (None, self.line, col + 1, text))
+
+        yield Token(EOF, "", self.line, 0)
 
-        tokens.append(Token("EOF", "", self.line, 0))
-        return tokens
+    def _needs_more(self, mo, buf: str) -> bool:
+        """True if ``mo`` could change once more of the stream is read."""
+        end = mo.end()
+        if end + self._MARGIN > len(buf) or mo.lastgroup == "MISMATCH":
+            # token buffer ke end ko chhoo raha hai, ya string abhi band nahi hui
+            return True
+        kind = mo.lastgroup
+        if kind == "STRING":
+            # '""' + '"' = triple-quoted string jiska closing agle chunk mein hai
+            body = mo.group().lstrip("fFrRbB")
+            return len(body) == 2 and buf[end] == body[0]
+        if kind == "NAME":
+            # f"... ka closing quote abhi buffer mein nahi aaya, isliye STRING match nahi hua
+            return buf[end] in "\"'"
+        return False
 
 
 # ==============================
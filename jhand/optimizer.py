@@ -0,0 +1,530 @@
+"""
+Optional optimisation pass between ``Parser.parse`` and ``Transpiler``
+(``jhand -O``).
+
+Level 1 (har module):
+  * constant folding — ``60 * 60 * 24``, ``"ab" * 3``, ``1 < 2``,
+    ``haaan aur naaa``, ``x if haaan warna y``
+  * dead branches — ``agar naaa:`` / ``jabtak naaa:`` hat jate hain,
+    ``agar haaan:`` ki body seedha bahar aa jati hai (baaki ``ele``/``warna`` gaye)
+  * unreachable code — ``leja`` / ``utha`` / ``nikalja`` / ``lagateraha`` ke
+    baad usi body ke statements
+
+  Jo dead code scope badalta hai (``yield`` / ``await`` / ``global`` /
+  ``nonlocal`` ya koi naam bind karna) wo hatta nahi, ``if False:`` ke andar
+  rehta hai — jaise CPython karta hai: function generator hi rahe, naam local
+  hi rahe. Bytecode mein wo phir bhi nahi jata.
+Level 2 (sirf entry script): top-level imports jinka naam module mein kahin
+use nahi hota. Library modules mein import re-export ho sakta hai
+(``util.math``), isliye wahan nahi.
+
+Expressions Python ke ``ast`` se fold hote hain, aur sirf tab jab text mein
+constant-operator-constant jaisa kuch dikhe — baaki statements bilkul
+nahi chhuye jate.
+"""
+import ast
+import operator
+import re
+
+from .astnode import Block, Class, Expr, Function, Import, Print, Program
+
+# fold ke baad string/bytes/tuple itne se lambe na hon, int itne bits se bade na hon
+_MAX_SEQ = 4096
+_MAX_INT_BITS = 128
+# isse lambe statements generated tables hote hain — regex scan mehenga, aur
+# unka arithmetic CPython ka compile() khud fold kar deta hai
+_MAX_TEXT = 4096
+
+_BINOPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow, ast.LShift: operator.lshift, ast.RShift: operator.rshift,
+    ast.BitOr: operator.or_, ast.BitXor: operator.xor, ast.BitAnd: operator.and_,
+}
+_UNARYOPS = {
+    ast.UAdd: operator.pos, ast.USub: operator.neg,
+    ast.Invert: operator.invert, ast.Not: operator.not_,
+}
+_CMPOPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+    ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b, ast.NotIn: lambda a, b: a not in b,
+}
+
+# constant OP constant (ya ``haaan aur ...`` / ``if haaan`` / ``not 0``) dikhe tabhi
+# ast.parse ka kharcha uthao; pehle sasta substring check, lambi lines ke liye
+_CONST = r"""(?:(?<![\w.])\d[\w.]*|\b(?:True|False|None)\b|["'])"""
+_CONST_START = r"""(?:\.?\d|(?:True|False|None)\b|[rRbBuU]{0,2}["'])"""
+_FOLDABLE = re.compile(
+    rf"""{_CONST}\s*(?:\*\*|//|<<|>>|[=!<>]=|[-+*/%&|^<>])\s*[-+~]?{_CONST_START}"""
+    rf"""|\b(?:True|False|None|\d[\w.]*)\s+(?:and|or)\b|\b(?:if|not)\s+{_CONST_START}"""
+)
+_OP_CHARS = frozenset("+-*/%&|^<>=!")
+
+
+def _has_hint(text: str) -> bool:
+    return (not _OP_CHARS.isdisjoint(text) or "True" in text or "False" in text
+            or "None" in text or "not " in text)
+_FSTRING = re.compile(r"""(?<![\w])[rRbB]?[fF][rR]?["']""")
+_NUMBER = re.compile(r"\d[\d_]*(?:\.\d*)?")
+_TERMINAL = re.compile(r"(?:return|raise|break|continue)\b")
+_NAME = re.compile(r"[^\W\d]\w*")
+# inke rehte module ke naam dynamically use ho sakte hain — imports mat chhuo
+_DYNAMIC = re.compile(r"\b(?:globals|locals|vars|exec|eval|__import__|__all__|__getattr__)\b")
+
+
+def _ok_value(value) -> bool:
+    if isinstance(value, int):
+        return value.bit_length() <= _MAX_INT_BITS
+    if isinstance(value, (str, bytes, tuple)):
+        return len(value) <= _MAX_SEQ
+    return isinstance(value, (float, complex)) or value is None
+
+
+class _Folder(ast.NodeTransformer):
+    """Folds constant sub-expressions; ``changed`` tells if anything was folded."""
+
+    def __init__(self):
+        self.changed = False
+
+    def _const(self, value, node):
+        self.changed = True
+        return ast.copy_location(ast.Constant(value), node)
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        func = _BINOPS.get(type(node.op))
+        if func and isinstance(node.left, ast.Constant) and isinstance(node.right, ast.Constant):
+            left, right = node.left.value, node.right.value
+            if isinstance(node.op, ast.Pow) and isinstance(right, int) and abs(right) > _MAX_INT_BITS:
+                return node
+            if isinstance(node.op, ast.LShift) and isinstance(right, int) and right > _MAX_INT_BITS:
+                return node
+            if isinstance(node.op, ast.Mult) and any(
+                    isinstance(v, (str, bytes, tuple)) for v in (left, right)):
+                count = right if isinstance(left, (str, bytes, tuple)) else left
+                if isinstance(count, int) and count > _MAX_SEQ:
+                    return node
+            try:
+                value = func(left, right)
+            except Exception:
+                return node  # 1/0 jaisa — runtime par hi phatne do
+            if _ok_value(value):
+                return self._const(value, node)
+        return node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.operand, ast.Constant):
+            if isinstance(node.op, (ast.USub, ast.UAdd)) and isinstance(node.operand.value, (int, float, complex)):
+                return node  # -1 to pehle se constant jaisa hi hai
+            try:
+                value = _UNARYOPS[type(node.op)](node.operand.value)
+            except Exception:
+                return node
+            if _ok_value(value):
+                return self._const(value, node)
+        return node
+
+    def visit_BoolOp(self, node):
+        self.generic_visit(node)
+        is_and = isinstance(node.op, ast.And)
+        values = []
+        for i, value in enumerate(node.values):
+            last = i == len(node.values) - 1
+            if isinstance(value, ast.Constant) and not last and not values:
+                # pehla operand constant: ya to wahi result hai ya skip hota hai
+                if bool(value.value) != is_and:
+                    self.changed = True
+                    return value
+                self.changed = True
+                continue
+            values.append(value)
+        if len(values) == 1:
+            return values[0]
+        node.values = values
+        return node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        operands = [node.left] + node.comparators
+        if not all(isinstance(o, ast.Constant) for o in operands):
+            return node
+        result = True
+        try:
+            for op, a, b in zip(node.ops, operands, operands[1:]):
+                func = _CMPOPS.get(type(op))
+                if func is None:
+                    return node  # is / is not — constants par bhi mat chhuo
+                if not func(a.value, b.value):
+                    result = False
+                    break
+        except Exception:
+            return node
+        return self._const(result, node)
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.test, ast.Constant):
+            self.changed = True
+            return node.body if node.test.value else node.orelse
+        return node
+
+
+def fold_expression(text: str) -> str:
+    """``text`` (a Python statement) with constant sub-expressions folded."""
+    # f-strings: unparse quotes/escapes badal deta hai — inhe chhodo
+    if len(text) > _MAX_TEXT or "\n" in text or not _has_hint(text) or not _FOLDABLE.search(text) or _FSTRING.search(text):
+        return text
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return text
+    folder = _Folder()
+    tree = folder.visit(tree)
+    if not folder.changed:
+        return text
+    try:
+        new = ast.unparse(tree)
+        ast.parse(new)
+    except (SyntaxError, ValueError, RecursionError):
+        return text
+    return text if "\n" in new else new
+
+
+def _fold_call_args(content: str) -> str:
+    call = f"_({content})"
+    folded = fold_expression(call)
+    if folded is not call and folded.startswith("_(") and folded.endswith(")"):
+        return folded[2:-1]
+    return content
+
+
+def condition_value(cond: str):
+    """True/False if ``cond`` is a constant expression, else None."""
+    cond = cond.strip()
+    if cond in ("True", "False", "None"):
+        return cond == "True"
+    if not _NUMBER.fullmatch(cond) and not (_has_hint(cond) and _FOLDABLE.search(cond)):
+        return None
+    try:
+        tree = _Folder().visit(ast.parse(cond, mode="eval"))
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+    if isinstance(tree.body, ast.Constant):
+        return bool(tree.body.value)
+    return None
+
+
+def _keyword(header: str) -> str:
+    return header.split(None, 1)[0].rstrip(":") if header.strip() else ""
+
+
+def _split_header(block: Block):
+    """``(keyword, condition)`` of an if/elif/while header, or None.
+
+    ``agar x: kaam()`` jaise ek line wale header mein condition alag nahi
+    hoti — unhe None.
+    """
+    header = block.header.strip()
+    if not header.endswith(":"):
+        return None
+    parts = header[:-1].split(None, 1)
+    if len(parts) != 2 or parts[0] not in ("if", "elif", "while"):
+        return None
+    return parts[0], parts[1]
+
+
+def _condition(block: Block):
+    """Constant truth value of an if/elif/while header, else None."""
+    parts = _split_header(block)
+    return condition_value(parts[1]) if parts else None
+
+
+_SCOPE_NODES = (ast.Yield, ast.YieldFrom, ast.Await, ast.Global, ast.Nonlocal, ast.NamedExpr,
+                ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _tree_affects_scope(tree) -> bool:
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _SCOPE_NODES):
+            return True
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            return True
+        if getattr(node, "name", None) and isinstance(node, ast.ExceptHandler):
+            return True
+        if node.__class__.__name__ in ("MatchAs", "MatchStar") and node.name:
+            return True
+        if node.__class__.__name__ == "MatchMapping" and node.rest:
+            return True
+        if isinstance(node, ast.Lambda):
+            continue  # apna scope
+        if isinstance(node, ast.comprehension):
+            # target comprehension ka apna naam hai; walrus upar pakda jata hai
+            stack.append(node.iter)
+            stack.extend(node.ifs)
+            continue
+        stack.extend(ast.iter_child_nodes(node))
+    return False
+
+
+def _header_source(header: str):
+    kw = _keyword(header)
+    if kw in ("else", "try", "finally"):
+        return None
+    if kw == "elif":
+        return "if" + header.strip()[4:] + "\n pass"
+    if kw == "except":
+        return "try:\n pass\n" + header.strip() + "\n pass"
+    if kw == "case":
+        return "match _:\n " + header.strip() + "\n  pass"
+    return header.strip() + "\n pass"
+
+
+def _text_affects_scope(text: str) -> bool:
+    try:
+        return _tree_affects_scope(ast.parse(text))
+    except (SyntaxError, ValueError, RecursionError):
+        return True  # samajh nahi aaya — hatao mat
+
+
+def affects_scope(nodes) -> bool:
+    """
+    True if dropping ``nodes`` could change the enclosing scope: they
+    contain ``yield`` / ``await`` / ``global`` / ``nonlocal`` or bind a name.
+    """
+    for node in nodes:
+        if isinstance(node, (Function, Class, Import)):
+            return True
+        if isinstance(node, Expr):
+            if _text_affects_scope(node.text):
+                return True
+        elif isinstance(node, Print):
+            if _text_affects_scope(f"_({node.content})"):
+                return True
+        elif isinstance(node, Block):
+            header = _header_source(node.header)
+            if header is not None and _text_affects_scope(header):
+                return True
+            if affects_scope(node.children):
+                return True
+    return False
+
+
+def _dead_block(nodes, line: int = 0, col: int = 0):
+    """
+    Dropped ``nodes`` kept as ``if False:`` when they affect scope, else None.
+
+    ``line``/``col`` is the dropped header (``agar naaa:`` / ``jabtak naaa:``)
+    the new one stands in for; 0 = no line of its own (preserve_lines mein
+    padding nahi), taaki body apni .jhand lines par hi rahe.
+    """
+    if not nodes or not affects_scope(nodes):
+        return None
+    return Block("if False:", list(nodes), line, col)
+
+
+def _dead_branch(block: Block, constant: bool):
+    # branch ki body; header tabhi jab wo bhi kuch bind kar sakta hai (walrus)
+    kw = _keyword(block.header)
+    if kw == "else" or constant:
+        return block.children
+    header = "if" + block.header.strip()[4:] if kw == "elif" else block.header
+    return [Block(header, block.children, block.line, block.col)]
+
+
+class Optimizer:
+    """Rewrites a ``Program`` in place; see the module docstring for the passes."""
+
+    def __init__(self, level: int = 1):
+        self.level = level
+        self.stats = {"folded": 0, "branches": 0, "unreachable": 0, "imports": 0}
+
+    def optimize(self, program: Program) -> Program:
+        program.children = self._body(program.children)
+        if self.level >= 2:
+            program.children = self._prune_imports(program.children)
+        return program
+
+    # ---------------- statements ----------------
+    def _node(self, node):
+        if isinstance(node, Expr):
+            folded = fold_expression(node.text)
+            if folded is not node.text:
+                node.text = folded
+                self.stats["folded"] += 1
+        elif isinstance(node, Print):
+            folded = _fold_call_args(node.content)
+            if folded is not node.content:
+                node.content = folded
+                self.stats["folded"] += 1
+        elif isinstance(node, Block):
+            self._fold_header(node)
+            node.children = self._body(node.children) or [Expr("pass")]
+        elif isinstance(node, (Function, Class)):
+            node.children = self._body(node.children)
+        return node
+
+    def _body(self, nodes):
+        out = []
+        i, n = 0, len(nodes)
+        while i < n:
+            node = nodes[i]
+            if isinstance(node, Block):
+                kw = _keyword(node.header)
+                if kw == "if":
+                    j = i + 1
+                    while j < n and isinstance(nodes[j], Block) and _keyword(nodes[j].header) in ("elif", "else"):
+                        j += 1
+                        if _keyword(nodes[j - 1].header) == "else":
+                            break
+                    out.extend(self._if_chain(nodes[i:j]))
+                    i = j
+                    if out and isinstance(out[-1], Expr) and _TERMINAL.match(out[-1].text):
+                        self._unreachable(nodes[i:], out)
+                        break
+                    continue
+                if kw == "while" and _condition(node) is False:
+                    # loop kabhi nahi chalega; uska ``warna`` ek baar chalta hai
+                    self.stats["branches"] += 1
+                    dead = _dead_block(node.children, node.line, node.col)
+                    if dead is not None:
+                        out.append(dead)
+                    i += 1
+                    if i < n and isinstance(nodes[i], Block) and _keyword(nodes[i].header) == "else":
+                        out.extend(self._body(nodes[i].children))
+                        i += 1
+                    continue
+            out.append(self._node(node))
+            i += 1
+            if isinstance(node, Expr) and _TERMINAL.match(node.text):
+                self._unreachable(nodes[i:], out)
+                break
+        return out
+
+    def _unreachable(self, nodes, out):
+        self.stats["unreachable"] += len(nodes)
+        dead = _dead_block(nodes)
+        if dead is not None:
+            out.append(dead)
+
+    def _if_chain(self, chain):
+        live = []
+        dropped = []
+        lead = None  # dropped leading ``agar`` (dead block uski line leta hai)
+        for index, block in enumerate(chain):
+            kw = _keyword(block.header)
+            truth = None if kw == "else" else _condition(block)
+            if truth is False:
+                self.stats["branches"] += 1
+                if index == 0:
+                    lead = block
+                dropped.extend(_dead_branch(block, True))
+                continue
+            if truth is True or kw == "else":
+                rest = chain[index + 1:]
+                self.stats["branches"] += len(rest)
+                for other in rest:
+                    dropped.extend(_dead_branch(other, False))
+                if not live:
+                    # pehli zinda branch pakki chalegi — body seedha bahar
+                    live = self._body(block.children)
+                    break
+                if kw != "else":
+                    block.header = "else:"
+                live.append(block)
+                self._finish(live)
+                break
+            if not live and kw == "elif":
+                block.header = "if" + block.header.strip()[4:]
+            live.append(block)
+        else:
+            self._finish(live)
+        # scope badalne wala dead code pehle rakho — aakhri statement ``leja`` hi rahe.
+        # Pehla ``agar`` hi gira ho to naya header usi ki line par
+        if lead is not None:
+            dead = _dead_block(dropped, lead.line, lead.col)
+        else:
+            dead = _dead_block(dropped)
+        return live if dead is None else [dead] + live
+
+    def _finish(self, live):
+        for block in live:
+            self._fold_header(block)
+            block.children = self._body(block.children) or [Expr("pass")]
+
+    def _fold_header(self, block: Block):
+        parts = _split_header(block)
+        if parts is None:
+            return
+        kw, cond = parts
+        folded = fold_expression(cond)
+        if folded is not cond:
+            block.header = f"{kw} {folded}:"
+            self.stats["folded"] += 1
+
+    # ---------------- imports ----------------
+    def _prune_imports(self, nodes):
+        if not any(isinstance(node, Import) for node in nodes):
+            return nodes
+        used = set()
+        dynamic = False
+        for node in _walk(nodes):
+            if isinstance(node, Import):
+                continue
+            for text in _texts(node):
+                if _DYNAMIC.search(text):
+                    dynamic = True
+                used.update(_NAME.findall(text))
+        if dynamic:
+            return nodes
+
+        out = []
+        for node in nodes:
+            if isinstance(node, Import) and node.module != "__future__":
+                if node.symbols:
+                    symbols = [s if isinstance(s, tuple) else (s, None) for s in node.symbols]
+                    if any(name == "*" for name, _ in symbols):
+                        out.append(node)
+                        continue
+                    keep = [(name, alias) for name, alias in symbols if (alias or name) in used]
+                    self.stats["imports"] += len(node.symbols) - len(keep)
+                    if not keep:
+                        continue
+                    node.symbols = keep
+                else:
+                    bound = node.alias or node.module.split(".")[0]
+                    if bound not in used:
+                        self.stats["imports"] += 1
+                        continue
+            out.append(node)
+        return out
+
+
+def _texts(node):
+    if isinstance(node, Expr):
+        return (node.text,)
+    if isinstance(node, Print):
+        return (node.content,)
+    if isinstance(node, Block):
+        return (node.header,)
+    if isinstance(node, Function):
+        return (node.name, node.params)
+    if isinstance(node, Class):
+        return (node.name,)
+    return ()
+
+
+def _walk(nodes):
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(node.children)
+
+
+def optimize(program: Program, level: int = 1) -> Program:
+    """Run the optimiser over ``program`` (in place) and return it."""
+    return Optimizer(level).optimize(program)
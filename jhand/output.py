@@ -0,0 +1,126 @@
+"""
+``jhand --buffered-output``: ``bol`` ka output bade buffer mein, batches mein likho.
+
+Container mein aksar ``PYTHONUNBUFFERED=1`` hota hai (ya stdout line-buffered
+hai) — tab har ``bol`` ek ``write`` syscall hai, aur lakhon lines chhapne
+wale scripts ka bada time wahi kha jata hai. Is mode mein ``sys.stdout`` ek
+naye stream se badla jata hai jo:
+
+* ``size`` bytes (default 1 MiB) bharte hi likhta hai,
+* har ``interval`` seconds (default 1s) background thread se flush hota hai —
+  pipe ke doosri taraf wala zyada der intezaar nahi karta,
+* exit par, runtime error report se pehle, SIGTERM par aur ``fork`` se pehle
+  (warna child process parent ka buffer dobara likh deta) flush hota hai,
+* TTY par line-buffered rehta hai (terminal mein line turant dikhe) —
+  ``line_buffered=True/False`` se badlo.
+
+API::
+
+    from jhand import output
+    output.buffer_stdout(size=4 << 20, interval=0.5)
+    ...
+    output.restore()
+"""
+import atexit
+import io
+import os
+import signal
+import sys
+import threading
+
+BUFFER_SIZE = 1 << 20
+FLUSH_INTERVAL = 1.0
+
+# (original sys.stdout, naya stream, flusher thread ka stop event)
+_state = None
+
+
+def _flush():
+    stream = sys.stdout
+    if stream is not None:
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+
+
+def _flusher(stream, interval: float, stop: threading.Event):
+    while not stop.wait(interval):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            return
+
+
+def _on_sigterm(signum, frame):
+    # default handler jaisa hi marna hai, bas pehle buffer likh do
+    _flush()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def buffer_stdout(size: int = BUFFER_SIZE, interval: float = FLUSH_INTERVAL,
+                  line_buffered: bool = None):
+    """
+    Replace ``sys.stdout`` with a ``size``-byte buffered stream over the same
+    file descriptor; return it. ``interval`` seconds between background
+    flushes (0 = only on size/exit). ``line_buffered`` defaults to "stdout
+    is a TTY". Calling it again reconfigures.
+    """
+    global _state
+    restore()
+    old = sys.stdout
+    try:
+        fd = old.fileno()
+    except (AttributeError, OSError, ValueError):
+        # stdout koi file nahi (StringIO, IDE) — jaisa hai waisa chhodo
+        return old
+    old.flush()
+    if line_buffered is None:
+        line_buffered = os.isatty(fd)
+
+    raw = io.FileIO(fd, "w", closefd=False)
+    stream = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=size),
+                              encoding=old.encoding or "utf-8",
+                              errors=old.errors or "strict",
+                              line_buffering=line_buffered)
+    sys.stdout = stream
+
+    stop = threading.Event()
+    if interval and not line_buffered:
+        threading.Thread(target=_flusher, args=(stream, interval, stop), daemon=True,
+                         name="jhand-stdout-flush").start()
+    _state = (old, stream, stop)
+    if threading.current_thread() is threading.main_thread():
+        try:
+            if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+                signal.signal(signal.SIGTERM, _on_sigterm)
+        except (AttributeError, ValueError, OSError):
+            pass
+    return stream
+
+
+def restore():
+    """Flush and put the original ``sys.stdout`` back (no-op if not buffered)."""
+    global _state
+    if _state is None:
+        return
+    old, stream, stop = _state
+    _state = None
+    stop.set()
+    try:
+        stream.flush()
+    except (OSError, ValueError):
+        pass
+    if sys.stdout is stream:
+        sys.stdout = old
+    try:
+        if signal.getsignal(signal.SIGTERM) is _on_sigterm:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    except (AttributeError, ValueError, OSError):
+        pass
+
+
+atexit.register(_flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush)
@@ -0,0 +1,189 @@
+"""
+``milke_karo`` / ``milke_karte_jao``: JHAND ka desi parallel map.
+
+    bhenchod square(n):
+        leja n * n
+
+    results = milke_karo(square, range(100))                   # threads, list
+    results = milke_karo(square, range(10**6), processes=haaan) # CPU-bound: saare cores
+    haramkhor r in milke_karte_jao(fetch, urls, ordered=naaa):  # jo pehle ho jaye
+        bol(r)
+
+* Pool ek hi baar (pehli call par) banta hai aur poore program mein share hota
+  hai — threads ke liye ``ThreadPoolExecutor``, ``processes=haaan`` par
+  ``ProcessPoolExecutor`` (``fork`` se, taaki program ke functions workers mein
+  mil jayein; jahan fork nahi wahan threads).
+* Items ``chunksize`` ke chunks mein jate hain (default: length pata ho to
+  ~4 chunks per worker, warna 1 item).
+* Ek waqt mein sirf ``buffer`` chunks (default 2 × pool workers) hawa mein rehte
+  hain — generator ko poora nahi khaya jata, consumer ke saath saath padha jata hai.
+* ``ordered=naaa`` par results chunk poora hote hi milte hain.
+* Worker ki exception usi result par raise hoti hai; baaki pending kaam cancel.
+"""
+import atexit
+import functools
+import inspect
+import itertools
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+# shared pools: "thread" / "process" → executor
+_pools = {}
+# process pool ke fork ke waqt ka (__main__ module, uske naam) — workers yahi dekhte hain
+_snapshots = {}
+_pools_lock = threading.Lock()
+# pool ke worker thread ke andar se nested call — pool ko khud ka wait na karna pade
+_local = threading.local()
+
+
+def _fork_context():
+    import multiprocessing
+    try:
+        return multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+
+
+def _pool(processes: bool, fn=None):
+    kind = "process" if processes else "thread"
+    pool = _pools.get(kind)
+    if pool is not None and (not processes or _resolvable(fn, _snapshots.get(kind))):
+        return pool
+    with _pools_lock:
+        pool = _pools.get(kind)
+        if pool is not None and processes and not _resolvable(fn, _snapshots.get(kind)):
+            # workers ke paas fork ke waqt ka __main__ hai — baad mein bana function
+            # wahan nahi milega; naya pool (naya fork) banao, purana apna kaam khatam kare
+            del _pools[kind]
+            pool.shutdown(wait=False)
+            pool = None
+        if pool is None:
+            if processes:
+                pool = ProcessPoolExecutor(os.cpu_count() or 1, mp_context=_fork_context())
+                _snapshots[kind] = _main_snapshot()
+            else:
+                pool = ThreadPoolExecutor(min(32, (os.cpu_count() or 1) + 4),
+                                          thread_name_prefix="jhand-milke")
+            _pools[kind] = pool
+    return pool
+
+
+def _main_snapshot():
+    main = sys.modules.get("__main__")
+    return main, dict(getattr(main, "__dict__", {}))
+
+
+def _resolvable(fn, snapshot) -> bool:
+    """True if pickling ``fn`` by reference works against the workers' ``__main__``."""
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    if inspect.ismethod(fn):
+        owner = fn.__self__
+        fn = owner if isinstance(owner, type) else type(owner)
+    if getattr(fn, "__module__", None) != "__main__":
+        return True
+    qualname = getattr(fn, "__qualname__", "")
+    if not qualname or "<locals>" in qualname or "<lambda>" in qualname:
+        return True  # by-reference pickle waise bhi nahi hoga — pickle ki apni error aaye
+    if snapshot is None:
+        return False
+    main, names = snapshot
+    if sys.modules.get("__main__") is not main:
+        return False
+    first, _, rest = qualname.partition(".")
+    obj = names.get(first)
+    for part in rest.split(".") if rest else ():
+        obj = getattr(obj, part, None)
+    return obj is fn
+
+
+def shutdown(wait: bool = True):
+    """Shut the shared pools down (they are recreated on next use)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown)
+if hasattr(os, "register_at_fork"):
+    # fork hua child parent ke pools use nahi kar sakta
+    os.register_at_fork(after_in_child=lambda: (_pools.clear(), _snapshots.clear()))
+
+
+def _run_chunk(fn, chunk):
+    _local.worker = True
+    try:
+        return [fn(item) for item in chunk]
+    finally:
+        _local.worker = False
+
+
+def _chunks(iterable, size: int):
+    it = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def pimap(fn, iterable, processes: bool = False, chunksize: int = None, ordered: bool = True,
+          buffer: int = None):
+    """
+    Lazily yield ``fn(item)`` for every item, computed on the shared pool.
+
+    At most ``buffer`` chunks (default 2 × pool workers) are submitted
+    ahead of the consumer — back-pressure for large or endless generators,
+    and a cap on how many run at once.
+    """
+    if processes and _fork_context() is None:
+        print("⚠️ Is platform par fork nahi hai — milke_karo threads se chalega", file=sys.stderr)
+        processes = False
+    if getattr(_local, "worker", False):
+        # milke_karo ke andar milke_karo: yahin chala do, pool deadlock nahi
+        yield from map(fn, iterable)
+        return
+
+    pool = _pool(processes, fn)
+    workers = pool._max_workers
+    if chunksize is None:
+        try:
+            chunksize = max(1, len(iterable) // (workers * 4))
+        except TypeError:
+            chunksize = 1
+    limit = buffer or workers * 2
+    chunks = _chunks(iterable, chunksize)
+    pending = deque() if ordered else set()
+    add = pending.append if ordered else pending.add
+
+    try:
+        for chunk in itertools.islice(chunks, limit):
+            add(pool.submit(_run_chunk, fn, chunk))
+        while pending:
+            if ordered:
+                done = (pending.popleft(),)
+            else:
+                done = wait(pending, return_when=FIRST_COMPLETED).done
+                pending.difference_update(done)
+            for future in done:
+                results = future.result()
+                # pehle naya kaam bhejo, phir results do — pool khaali na baithe
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    add(pool.submit(_run_chunk, fn, chunk))
+                yield from results
+    finally:
+        # error ya consumer ne beech mein chhod diya — baaki kaam cancel
+        for future in pending:
+            future.cancel()
+
+
+def pmap(fn, iterable, processes: bool = False, chunksize: int = None, ordered: bool = True,
+         buffer: int = None) -> list:
+    """``list(pimap(...))`` — every result, in input order unless ``ordered=False``."""
+    return list(pimap(fn, iterable, processes, chunksize, ordered, buffer))
@@ -1,50 +1,84 @@
-from typing import List, Optional
+from collections import deque
+from typing import Iterable, Iterator, Optional
 from .lexer import Token
-from .astnode import ASTNode
+from .astnode import ASTNode, Block, Class, Expr, Function, Import, Print, Program
+
+
+def _error(msg: str, tok: Token) -> SyntaxError:
+    """SyntaxError at ``tok`` (1-based offset) — reports show the .jhand line/column."""
+    return SyntaxError(msg, (None, tok.line, tok.col + 1, None))
 
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
+    """
+    Recursive-descent parser over a token iterable. Tokens are pulled lazily
+    through a small lookahead buffer, so a generator such as
+    ``Lexer.iter_tokens()`` is never materialised as a whole list.
+    """
+    def __init__(self, tokens: Iterable[Token]):
+        self._tokens = iter(tokens)
+        self._buffer = deque()
+        self._last = Token("EOF", "", 1, 0)
         self.pos = 0
 
+    def _fill(self, n: int) -> bool:
+        """Make sure ``n + 1`` tokens are buffered; False if the stream ran dry."""
+        while len(self._buffer) <= n:
+            tok = next(self._tokens, None)
+            if tok is None:
+                return False
+            self._buffer.append(tok)
+            self._last = tok
+        return True
+
     def current(self) -> Token:
-        if self.pos >= len(self.tokens):
-            return Token("EOF", "")
-        return self.tokens[self.pos]
+        if self._buffer or self._fill(0):
+            return self._buffer[0]
+        return Token("EOF", "", self._last.line, 0)
 
     def lookahead(self, n=1) -> Optional[Token]:
-        idx = self.pos + n
-        return self.tokens[idx] if idx < len(self.tokens) else None
+        return self._buffer[n] if self._fill(n) else None
 
     def eat(self, ttype=None, tval=None) -> Token:
         tok = self.current()
+        if tok.type == "EOF" and ttype != "EOF":
+            raise _error(f"Unexpected end of file at {tok.line}:{tok.col}", tok)
         if ttype and tok.type != ttype:
-            raise SyntaxError(f"Expected {ttype}, got {tok.type} ({tok.value}) at {tok.line}:{tok.col}")
+            raise _error(f"Expected {ttype}, got {tok.type} ({tok.value}) at {tok.line}:{tok.col}", tok)
         if tval and tok.value != tval:
-            raise SyntaxError(f"Expected {tval}, got {tok.value} at {tok.line}:{tok.col}")
+            raise _error(f"Expected {tval}, got {tok.value} at {tok.line}:{tok.col}", tok)
+        if self._buffer:
+            self._buffer.popleft()
         self.pos += 1
         return tok
 
-    def parse(self) -> ASTNode:
-        program = ASTNode("Program", children=[])
+    def parse(self) -> Program:
+        return Program(list(self.iter_statements()))
+
+    def iter_statements(self) -> Iterator[ASTNode]:
+        """Yield top-level statements one at a time."""
         while self.current().type != "EOF":
             if self.current().type == "NEWLINE":
                 self.eat("NEWLINE")
                 continue
-            program.children.append(self.parse_statement(0))
-        return program
+            yield self.parse_statement(0)
 
     # ------------------------ STATEMENT ------------------------
     def parse_statement(self, parent_indent: int) -> ASTNode:
         tok = self.current()
+        node = self._parse_statement(tok, parent_indent)
+        node.line, node.col = tok.line, tok.col
+        return node
+
+    def _parse_statement(self, tok: Token, parent_indent: int) -> ASTNode:
         if tok.type == "NAME":
             if tok.value == "def":
                 return self.parse_function(parent_indent)
             if tok.value == "async":
                 self.eat("NAME")
                 if self.current().value != "def":
-                    raise SyntaxError(f"Expected 'def' after 'async', got {self.current().value}")
+                    raise _error(f"Expected 'def' after 'async', got {self.current().value}",
+                                 self.current())
                 return self.parse_function(parent_indent, is_async=True)
             if tok.value == "class":
                 return self.parse_class(parent_indent)
@@ -57,7 +91,7 @@ class Parser:
         return self.parse_expr()
 
     # ------------------------ IMPORT ------------------------
-    def parse_import(self) -> ASTNode:
+    def parse_import(self) -> Import:
         if self.current().type == "NAME" and self.current().value == "import":
             self.eat("NAME")
             parts = [self.eat("NAME").value]
@@ -73,21 +107,22 @@ class Parser:
 
             if self.current().type == "NEWLINE":
                 self.eat("NEWLINE")
-            return ASTNode("Import", value={"module": module, "symbols": [], "alias": alias})
+            return Import(module, alias=alias)
 
         if self.current().type == "NAME" and self.current().value == "from":
             self.eat("NAME")
             parts = []
             while self.current().type == "OP" and self.current().value == ".":
                 parts.append(self.eat("OP").value)
-            if self.current().type == "NAME":
+            # `se_laao . laao x` — dots ke baad seedha laao, module naam nahi
+            if self.current().type == "NAME" and self.current().value != "import":
                 parts.append(self.eat("NAME").value)
                 while self.current().type == "OP" and self.current().value == ".":
-                    self.eat("OP", ".")
+                    parts.append(self.eat("OP", ".").value)
                     parts.append(self.eat("NAME").value)
             module = "".join(parts)
 
-            self.eat("NAME")  # import
+            self.eat("NAME", "import")
             symbols = []
             while self.current().type not in ("NEWLINE", "EOF"):
                 name = self.eat("NAME").value
@@ -100,39 +135,46 @@ class Parser:
                     self.eat("OP", ",")
             if self.current().type == "NEWLINE":
                 self.eat("NEWLINE")
-            return ASTNode("Import", value={"module": module, "symbols": symbols})
+            return Import(module, symbols)
 
     # ------------------------ PRINT ------------------------
-    def parse_print(self) -> ASTNode:
+    def parse_print(self) -> Print:
         self.eat("NAME")
         content = self._collect_paren_or_string()
         if self.current().type == "NEWLINE":
             self.eat("NEWLINE")
-        return ASTNode("Print", value=content)
+        return Print(content)
 
     def _collect_paren_or_string(self) -> str:
         if self.current().type == "OP" and self.current().value == "(":
             self.eat("OP", "(")
             parts = []
-            while not (self.current().type == "OP" and self.current().value == ")"):
-                parts.append(self.eat().value)
+            depth = 0  # nested (), [], {} inside the print call
+            while depth or not (self.current().type == "OP" and self.current().value == ")"):
+                tok = self.eat()
+                if tok.type == "OP":
+                    if tok.value in ("(", "[", "{"):
+                        depth += 1
+                    elif tok.value in (")", "]", "}"):
+                        depth -= 1
+                parts.append(tok.value)
             self.eat("OP", ")")
             return " ".join(parts).strip()
         if self.current().type == "STRING":
             return self.eat("STRING").value
-        raise SyntaxError("Invalid print content")
+        raise _error("Invalid print content", self.current())
 
     # ------------------------ EXPRESSION ------------------------
-    def parse_expr(self) -> ASTNode:
+    def parse_expr(self) -> Expr:
         parts = []
         while self.current().type not in ("NEWLINE", "EOF"):
             parts.append(self.eat().value)
         if self.current().type == "NEWLINE":
             self.eat("NEWLINE")
-        return ASTNode("Expr", value=" ".join(parts).strip())
+        return Expr(" ".join(parts).strip())
 
     # ------------------------ FUNCTION ------------------------
-    def parse_function(self, parent_indent: int, is_async: bool = False) -> ASTNode:
+    def parse_function(self, parent_indent: int, is_async: bool = False) -> Function:
         self.eat("NAME")
         name = self.eat("NAME").value
         params = ""
@@ -147,32 +189,38 @@ class Parser:
             self.eat("OP", ":")
         if self.current().type == "NEWLINE":
             self.eat("NEWLINE")
-        children = self._parse_body(self.current().col)
-        return ASTNode("Function", value={"name": name, "params": params, "async": is_async}, children=children)
+        children = self._parse_body(self._body_indent())
+        return Function(name, params, is_async, children)
 
     # ------------------------ CLASS ------------------------
-    def parse_class(self, parent_indent: int) -> ASTNode:
+    def parse_class(self, parent_indent: int) -> Class:
         self.eat("NAME")
         name = self.eat("NAME").value
         if self.current().type == "OP" and self.current().value == ":":
             self.eat("OP", ":")
         if self.current().type == "NEWLINE":
             self.eat("NEWLINE")
-        children = self._parse_body(self.current().col)
-        return ASTNode("Class", value={"name": name}, children=children)
+        children = self._parse_body(self._body_indent())
+        return Class(name, children)
 
     # ------------------------ BLOCK ------------------------
-    def parse_block(self, parent_indent: int) -> ASTNode:
+    def parse_block(self, parent_indent: int) -> Block:
         header_parts = []
         while self.current().type not in ("NEWLINE", "EOF"):
             header_parts.append(self.eat().value)
         if self.current().type == "NEWLINE":
             self.eat("NEWLINE")
         header = " ".join(header_parts).strip()
-        children = self._parse_body(self.current().col)
-        return ASTNode("Block", value={"header": header}, children=children)
+        children = self._parse_body(self._body_indent())
+        return Block(header, children)
 
     # ------------------------ BODY ------------------------
+    def _body_indent(self) -> int:
+        """Skip blank/comment-only lines after a header; the next token's col is the body indent."""
+        while self.current().type == "NEWLINE":
+            self.eat("NEWLINE")
+        return self.current().col
+
     def _parse_body(self, body_indent: int):
         children = []
         while self.current().type != "EOF":
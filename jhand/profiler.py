@@ -0,0 +1,282 @@
+"""
+``jhand --profile`` — time kahan ja raha hai: JHAND tooling ya tumhara script?
+
+Do hisse:
+
+1. Front-end phases (read, lex, parse, transpile, compile) alag alag time
+   hote hain — cache ko bypass karke, taaki har phase sach mein chale.
+2. Program ``cProfile`` ke neeche chalta hai; har function ki position
+   source map se .jhand file/line par map hoti hai.
+
+``--profile-out`` se raw data bhi milta hai: ``*.json`` → speedscope
+(https://www.speedscope.app) ka evented format, baaki sab → pstats file
+(``python -m pstats file.prof``). Speedscope ko call tree chahiye jo
+cProfile nahi deta, isliye us mode mein ek chhota ``sys.setprofile``
+tracer chalta hai.
+"""
+import cProfile
+import functools
+import json
+import os
+import pstats
+import sys
+import time
+from ast import PyCF_ALLOW_TOP_LEVEL_AWAIT
+
+from . import runtime
+from . import sourcemap
+from .lexer import Lexer
+from .parser import Parser
+from .transpiler import Transpiler
+
+TOP_N = 15
+
+
+# -------------------------
+# Front-end phases
+# -------------------------
+def time_phases(path: str, source: str = None, optimize: int = 0, lazy_imports: bool = False,
+                top_level_await: bool = False):
+    """Run the front end once, phase by phase, with the same options as a real run.
+
+    Returns ``(phases, code, n_tokens, n_lines)`` where ``phases`` is a list
+    of ``(name, seconds)``. Raises ``SyntaxError``.
+    """
+    phases = []
+    clock = time.perf_counter
+
+    t0 = clock()
+    if source is None:
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+    t1 = clock()
+    tokens = Lexer(source).tokenize()
+    t2 = clock()
+    ast = Parser(tokens).parse()
+    t3 = clock()
+    phases.extend([("read", t1 - t0), ("lex", t2 - t1), ("parse", t3 - t2)])
+    if optimize:
+        from .optimizer import optimize as run_optimizer
+        run_optimizer(ast, optimize)
+        t4 = clock()
+        phases.append(("optimize", t4 - t3))
+        t3 = t4
+    t = Transpiler(ast, source_path=path, preserve_lines=True, lazy_imports=lazy_imports)
+    py_code = t.transpile()
+    t4 = clock()
+    code = compile(py_code, path, "exec", PyCF_ALLOW_TOP_LEVEL_AWAIT if top_level_await else 0)
+    t5 = clock()
+
+    sourcemap.register(path, t.source_map)
+    phases.extend([("transpile", t4 - t3), ("compile", t5 - t4)])
+    return phases, code, len(tokens), source.count("\n") + 1
+
+
+# -------------------------
+# Hotspot rows: (file, line, name, ncalls, self_s, cum_s)
+# -------------------------
+def _location(filename: str, line: int):
+    mapped = sourcemap.map_position(filename, line) if line else None
+    if mapped is not None:
+        return mapped[0], mapped[1]
+    return filename, line
+
+
+def rows_from_pstats(stats: pstats.Stats):
+    rows = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        filename, line = _location(filename, line)
+        rows.append((filename, line, name, ncalls, tottime, cumtime))
+    return rows
+
+
+class EventTracer:
+    """``sys.setprofile`` hook recording open/close events for speedscope."""
+
+    def __init__(self):
+        self.frames = []       # [(name, file, line)]
+        self.index = {}        # key -> frame index
+        self.events = []       # [(is_open, frame_index, t)]
+        self.depth = 0
+        self.start = 0.0
+
+    def _frame(self, key, name, filename, line):
+        idx = self.index.get(key)
+        if idx is None:
+            idx = self.index[key] = len(self.frames)
+            filename, line = _location(filename, line)
+            self.frames.append((name, filename, line))
+        return idx
+
+    def __call__(self, frame, event, arg):
+        now = time.perf_counter() - self.start
+        if event == "call":
+            code = frame.f_code
+            idx = self._frame(code, code.co_name, code.co_filename, code.co_firstlineno)
+            self.events.append((True, idx, now))
+            self.depth += 1
+        elif event == "c_call":
+            name = getattr(arg, "__qualname__", None) or getattr(arg, "__name__", "?")
+            module = getattr(arg, "__module__", None) or "builtins"
+            idx = self._frame(("c", module, name), f"{module}.{name}", "~", 0)
+            self.events.append((True, idx, now))
+            self.depth += 1
+        elif self.depth:
+            # return / c_return / c_exception: sabse upar wala frame band
+            self.depth -= 1
+            self.events.append((False, None, now))
+
+    def run(self, func, *args):
+        self.start = time.perf_counter()
+        sys.setprofile(self)
+        try:
+            return func(*args)
+        finally:
+            sys.setprofile(None)
+            self.end = time.perf_counter() - self.start
+
+    def _closed_events(self):
+        """Events with close-frame indices filled in and open frames closed at the end."""
+        stack = []
+        for is_open, idx, at in self.events:
+            if is_open:
+                stack.append(idx)
+                yield True, idx, at
+            elif stack:
+                yield False, stack.pop(), at
+        while stack:
+            yield False, stack.pop(), self.end
+
+    def rows(self):
+        ncalls = [0] * len(self.frames)
+        self_t = [0.0] * len(self.frames)
+        cum_t = [0.0] * len(self.frames)
+        active = [0] * len(self.frames)
+        stack = []  # [idx, start, child_time]
+        for is_open, idx, at in self._closed_events():
+            if is_open:
+                ncalls[idx] += 1
+                active[idx] += 1
+                stack.append([idx, at, 0.0])
+                continue
+            _, start, child = stack.pop()
+            total = at - start
+            self_t[idx] += total - child
+            active[idx] -= 1
+            if not active[idx]:
+                cum_t[idx] += total  # recursion mein sirf outermost call gino
+            if stack:
+                stack[-1][2] += total
+        return [(f, line, name, ncalls[i], self_t[i], cum_t[i])
+                for i, (name, f, line) in enumerate(self.frames) if ncalls[i]]
+
+    def to_speedscope(self, name: str) -> dict:
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "jhand --profile",
+            "shared": {"frames": [{"name": n, "file": f, "line": line}
+                                  for n, f, line in self.frames]},
+            "profiles": [{
+                "type": "evented",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.end,
+                "events": [{"type": "O" if is_open else "C", "frame": idx, "at": at}
+                           for is_open, idx, at in self._closed_events()],
+            }],
+        }
+
+
+# -------------------------
+# Report
+# -------------------------
+def _short(filename: str) -> str:
+    try:
+        rel = os.path.relpath(filename)
+    except ValueError:
+        return filename
+    return filename if rel.startswith(".." + os.sep + "..") else rel
+
+
+def format_report(phases, rows, run_time, n_tokens=0, n_lines=0, top=TOP_N):
+    out = ["", "⏱️ [ JHAND PROFILE ]", "🧰 Front-end phases:"]
+    front = sum(s for _, s in phases)
+    for name, secs in phases:
+        out.append(f"   {name:<10} {secs * 1000:10.2f} ms")
+    out.append(f"   {'total':<10} {front * 1000:10.2f} ms"
+               f"   ({n_tokens} tokens, {n_lines} lines)")
+    out.append(f"🏃 Program run: {run_time * 1000:.2f} ms")
+
+    jhand_rows = sorted((r for r in rows if r[0].endswith(".jhand")),
+                        key=lambda r: r[5], reverse=True)[:top]
+    if jhand_rows:
+        out.append("🔥 JHAND functions (by cumulative time):")
+        out.append(f"   {'ncalls':>8} {'self(s)':>9} {'cum(s)':>9}  location")
+        for f, line, name, ncalls, self_s, cum_s in jhand_rows:
+            out.append(f"   {ncalls:>8} {self_s:9.4f} {cum_s:9.4f}  {_short(f)}:{line}({name})")
+
+    out.append(f"🐍 Top {top} overall (by self time):")
+    out.append(f"   {'ncalls':>8} {'self(s)':>9} {'cum(s)':>9}  location")
+    for f, line, name, ncalls, self_s, cum_s in sorted(rows, key=lambda r: r[4], reverse=True)[:top]:
+        where = f"{_short(f)}:{line}({name})" if f != "~" else name
+        out.append(f"   {ncalls:>8} {self_s:9.4f} {cum_s:9.4f}  {where}")
+
+    if front > run_time:
+        out.append("💡 Zyada time JHAND front end mein gaya — 'jhand build' / cache se warm run karo.")
+    else:
+        out.append("💡 Zyada time tumhare script mein gaya — upar ke hotspots dekho.")
+    return "\n".join(out) + "\n"
+
+
+def profile_file(path: str, source: str = None, out: str = None, top: int = TOP_N,
+                 optimize: int = 0, lazy_imports: bool = False, async_mode: bool = False,
+                 **async_options) -> bool:
+    """Profile the .jhand program at ``path``; report to stderr.
+
+    ``optimize`` / ``lazy_imports`` / ``async_mode`` are the ``jhand -O`` /
+    ``--lazy-imports`` / ``--async`` options, so the profiled code is the
+    code that runs; ``async_options`` go to ``aio.run_program``. Returns
+    False on a syntax error or if the program raised.
+    """
+    path = os.path.abspath(path)
+    try:
+        phases, code, n_tokens, n_lines = time_phases(path, source, optimize, lazy_imports,
+                                                      async_mode)
+    except SyntaxError as se:
+        runtime.report_syntax_error(se)
+        return False
+    if async_mode:
+        from . import aio
+        run = functools.partial(aio.run_program, **async_options)
+    else:
+        run = runtime.run_compiled
+
+    speedscope = out is not None and out.endswith(".json")
+    ok = False
+    t0 = time.perf_counter()
+    try:
+        if speedscope:
+            tracer = EventTracer()
+            ok = tracer.run(run, code)
+        else:
+            prof = cProfile.Profile()
+            ok = prof.runcall(run, code)
+    finally:
+        run_time = time.perf_counter() - t0
+        if speedscope:
+            rows = tracer.rows()
+            with open(out, "w", encoding="utf-8") as f:
+                json.dump(tracer.to_speedscope(os.path.basename(path)), f)
+        else:
+            prof.create_stats()
+            stats = pstats.Stats(prof)
+            rows = rows_from_pstats(stats)
+            if out is not None:
+                stats.dump_stats(out)
+        sys.stdout.flush()
+        sys.stderr.write(format_report(phases, rows, run_time, n_tokens, n_lines, top))
+        if out is not None:
+            sys.stderr.write(f"💾 Profile saved: {out}\n")
+    return ok
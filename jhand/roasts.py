@@ -0,0 +1,97 @@
+"""
+Roast messages for JHAND errors. Sirf error aane par import hota hai —
+normal runs yeh tables kabhi nahi banate.
+"""
+import random
+
+# -------------------------
+# Syntax Roasts
+# -------------------------
+ROAST_SYNTAX = [
+    "BSDK! Syntax aise likhta hai? JHAND ne ulti kar di 🤮",
+    "Abe chutiye, indentation dekh... tabs aur spaces ki shaadi 💔",
+    "Ye code hai ya chhapr phaad ke bakwaas daal di 🫠",
+    "Oye ullu ke pathe! Beghairat tarike se likha hai... compiler bhi roya 🥲",
+]
+
+# -------------------------
+# Runtime Roasts (Generic)
+# -------------------------
+ROAST_RUNTIME = [
+    "Program phat gaya BC 💥 CPU bhi bola: 'Band kar iski maa ka' 💻🔥",
+    "Ye error dekh ke debugger bhi roya 😭",
+    "Stack trace itna lamba jaise kisi ne galiyon ki lambi ladi chala di ho 🚨📜",
+    "Code aise chala jaise brake fail truck 🛻💨",
+]
+
+# -------------------------
+# Specific Exception Roasts + Fixes
+# -------------------------
+EXCEPTION_HANDLERS = {
+    "NameError": (
+        [
+            "Naam likhna bhi nahi aata? Variable declare kiya tha ya hawa mein uda diya? 🤡",
+            "Bhai! Yeh variable to kahin bana hi nahi… fir bhi use kar liya 😭",
+        ],
+        "Check karo variable/function ka naam sahi likha hai ya define kiya hai ya nahi."
+    ),
+    "TypeError": (
+        [
+            "BSDK types mila diye jaise chai mein mirchi daal di 🫡☕",
+            "Yeh operation allowed nahi hai… int ko string se shadi nahi karwa sakte 💔",
+        ],
+        "Data types check karo — type conversion (int(), str(), float()) sahi jagah karo."
+    ),
+    "ZeroDivisionError": (
+        [
+            "Bhai ne math ka rape kar diya — zero se divide 🧮💥",
+            "Zero se divide? Arey bhagwan bhi nahi kar sakta yeh 😤",
+        ],
+        "Denominator ko check karo, zero aane pe divide mat karo ya condition daal do."
+    ),
+    "FileNotFoundError": (
+        [
+            "File dhund raha jaise girlfriend ka pichla message 😭📁",
+            "File ka path galat hai ya file gayab ho gayi 🫠",
+        ],
+        "File ka path verify karo ya file exist karti hai ya nahi check karo."
+    ),
+    "ImportError": (
+        [
+            "Library import mein error? PIP install bhool gaya kya bhai? 🧠📦",
+            "Yeh module mil nahi raha... system ne bhi haath utha diye 👐",
+        ],
+        "Library install hai ya nahi check karo: 'pip install <library>' ya spelling sahi karo."
+    ),
+    "ValueError": (
+        [
+            "Value aisi di jaise biryani mein rubber daal diya 🍚🤢",
+            "Input ya conversion mein gadbad hai bhai 😤",
+        ],
+        "Input ya value ko sahi format mein do — int/float conversion check karo."
+    ),
+    "KeyError": (
+        [
+            "Dictionary mein yeh key to exist hi nahi karti 🤦‍♂️🔑",
+            "KeyError aaya... matlab dict ko random thappad maar diya 😭",
+        ],
+        "Check karo key exist karti hai ya nahi ya dict.get() use karo."
+    ),
+    "IndexError": (
+        [
+            "Index aise nikaal raha jaise khali fridge mein doodh dhund raha ho 🥶",
+            "List ka index range se bahar chala gaya 🚪👻",
+        ],
+        "List/array ki length check karo before indexing."
+    ),
+    "AttributeError": (
+        [
+            "Bhai attribute hi galat likh diya… object ne kaha 'yeh mera field hi nahi' 😡",
+            "Aisi attribute maang raha jaise aadmi se 'fly()' kehna 🪽",
+        ],
+        "Object ke attributes check karo ya dir(object) use karo debugging ke liye."
+    ),
+}
+
+def roast(choice_list):
+    return random.choice(choice_list)
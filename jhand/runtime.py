@@ -1,12 +1,11 @@
-import traceback
-import random
+import contextlib
+import io
 import sys
 import builtins
-import subprocess
-import re
+import types
 
 # -------------------------
-# UTF-8 Console & File patch
+# UTF-8 Console & File defaults
 # -------------------------
 try:
     sys.stdout.reconfigure(encoding='utf-8')
@@ -15,120 +14,121 @@ except Exception:
     # Kuch environments mein reconfigure nahi hota (e.g. Windows old PowerShell)
     pass
 
-_builtin_open = open
+_io_open = io.open
 
-def utf8_open(*args, **kwargs):
-    """Globally patch open() to default to UTF-8 encoding (non-binary)."""
-    mode = kwargs.get("mode", args[1] if len(args) > 1 else "r")
-    if "b" not in mode and "encoding" not in kwargs:
-        kwargs["encoding"] = "utf-8"
-    return _builtin_open(*args, **kwargs)
 
-builtins.open = utf8_open
+def utf8_open(file, mode="r", buffering=-1, encoding=None, *args, **kwargs):
+    """open() that defaults to UTF-8 in text mode.
 
-# -------------------------
-# Syntax Roasts
-# -------------------------
-ROAST_SYNTAX = [
-    "BSDK! Syntax aise likhta hai? JHAND ne ulti kar di 🤮",
-    "Abe chutiye, indentation dekh... tabs aur spaces ki shaadi 💔",
-    "Ye code hai ya chhapr phaad ke bakwaas daal di 🫠",
-    "Oye ullu ke pathe! Beghairat tarike se likha hai... compiler bhi roya 🥲",
-]
+    Sirf JHAND program (aur uske .jhand modules) ke globals mein rehta hai —
+    ``builtins.open`` patch nahi hota, to libraries ke ``open()`` par koi wrapper nahi.
+    """
+    if encoding is None and "b" not in mode:
+        encoding = "utf-8"
+    return _io_open(file, mode, buffering, encoding, *args, **kwargs)
 
-# -------------------------
-# Runtime Roasts (Generic)
-# -------------------------
-ROAST_RUNTIME = [
-    "Program phat gaya BC 💥 CPU bhi bola: 'Band kar iski maa ka' 💻🔥",
-    "Ye error dekh ke debugger bhi roya 😭",
-    "Stack trace itna lamba jaise kisi ne galiyon ki lambi ladi chala di ho 🚨📜",
-    "Code aise chala jaise brake fail truck 🛻💨",
-]
 
-# -------------------------
-# Specific Exception Roasts + Fixes
-# -------------------------
-EXCEPTION_HANDLERS = {
-    "NameError": (
-        [
-            "Naam likhna bhi nahi aata? Variable declare kiya tha ya hawa mein uda diya? 🤡",
-            "Bhai! Yeh variable to kahin bana hi nahi… fir bhi use kar liya 😭",
-        ],
-        "Check karo variable/function ka naam sahi likha hai ya define kiya hai ya nahi."
-    ),
-    "TypeError": (
-        [
-            "BSDK types mila diye jaise chai mein mirchi daal di 🫡☕",
-            "Yeh operation allowed nahi hai… int ko string se shadi nahi karwa sakte 💔",
-        ],
-        "Data types check karo — type conversion (int(), str(), float()) sahi jagah karo."
-    ),
-    "ZeroDivisionError": (
-        [
-            "Bhai ne math ka rape kar diya — zero se divide 🧮💥",
-            "Zero se divide? Arey bhagwan bhi nahi kar sakta yeh 😤",
-        ],
-        "Denominator ko check karo, zero aane pe divide mat karo ya condition daal do."
-    ),
-    "FileNotFoundError": (
-        [
-            "File dhund raha jaise girlfriend ka pichla message 😭📁",
-            "File ka path galat hai ya file gayab ho gayi 🫠",
-        ],
-        "File ka path verify karo ya file exist karti hai ya nahi check karo."
-    ),
-    "ImportError": (
-        [
-            "Library import mein error? PIP install bhool gaya kya bhai? 🧠📦",
-            "Yeh module mil nahi raha... system ne bhi haath utha diye 👐",
-        ],
-        "Library install hai ya nahi check karo: 'pip install <library>' ya spelling sahi karo."
-    ),
-    "ValueError": (
-        [
-            "Value aisi di jaise biryani mein rubber daal diya 🍚🤢",
-            "Input ya conversion mein gadbad hai bhai 😤",
-        ],
-        "Input ya value ko sahi format mein do — int/float conversion check karo."
-    ),
-    "KeyError": (
-        [
-            "Dictionary mein yeh key to exist hi nahi karti 🤦‍♂️🔑",
-            "KeyError aaya... matlab dict ko random thappad maar diya 😭",
-        ],
-        "Check karo key exist karti hai ya nahi ya dict.get() use karo."
-    ),
-    "IndexError": (
-        [
-            "Index aise nikaal raha jaise khali fridge mein doodh dhund raha ho 🥶",
-            "List ka index range se bahar chala gaya 🚪👻",
-        ],
-        "List/array ki length check karo before indexing."
-    ),
-    "AttributeError": (
-        [
-            "Bhai attribute hi galat likh diya… object ne kaha 'yeh mera field hi nahi' 😡",
-            "Aisi attribute maang raha jaise aadmi se 'fly()' kehna 🪽",
-        ],
-        "Object ke attributes check karo ya dir(object) use karo debugging ke liye."
-    ),
-}
-
-def roast(choice_list):
-    return random.choice(choice_list)
+def program_globals(name: str = "__main__") -> dict:
+    """Fresh globals for running a JHAND program (or module) in."""
+    env = {"__name__": name}
+    if not sys.flags.utf8_mode:
+        # PYTHONUTF8=1 / -X utf8 mein open() pehle se UTF-8 hai — wrapper ki zaroorat nahi
+        env["open"] = utf8_open
+    return env
+
+
+# True jab poora process isi program ka hai (CLI, bundle, fork kiye children) —
+# tab program ka ``__main__`` wapas nahi hatta. Embed karne wale host ka apna
+# ``__main__`` har run ke baad lauta diya jata hai.
+OWN_MAIN = False
+
+
+@contextlib.contextmanager
+def main_module():
+    """
+    Globals of a fresh ``__main__`` module for the program, registered in
+    ``sys.modules`` like ``python script.py`` does — so program functions
+    pickle as ``__main__.naam`` (``milke_karo(..., processes=haaan)``).
+    Unless ``OWN_MAIN``, the previous ``__main__`` is restored afterwards.
+    """
+    module = types.ModuleType("__main__")
+    module.__dict__.update(program_globals())
+    previous = sys.modules.get("__main__")
+    sys.modules["__main__"] = module
+    try:
+        yield module.__dict__
+    finally:
+        if not OWN_MAIN and sys.modules.get("__main__") is module:
+            if previous is None:
+                del sys.modules["__main__"]
+            else:
+                sys.modules["__main__"] = previous
+
+
+def install_global_open():
+    """Purana behaviour: poore interpreter ka ``open()`` UTF-8 default (sab par wrapper)."""
+    builtins.open = utf8_open
+
+
+# Roast tables (roasts.py) sirf error par load hote hain
+_ROAST_NAMES = ("ROAST_SYNTAX", "ROAST_RUNTIME", "EXCEPTION_HANDLERS", "roast")
+
+
+def __getattr__(name):
+    if name in _ROAST_NAMES:
+        from . import roasts
+        return getattr(roasts, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # -------------------------
 # Auto Package Installer
 # -------------------------
-def try_auto_install(module_name: str):
-    """Try to install a missing module using pip."""
-    print(f"📦 Auto-Installer: '{module_name}' dhoond liya. Installing via pip... 🚀")
+# False (``jhand --no-auto-install`` / JHAND_AUTO_INSTALL=0) par missing module
+# ke liye pip nahi chalta — production mein deps ``jhand deps`` se deploy par hi aayein.
+AUTO_INSTALL = True
+# pip itni der mein na nipte (network hi nahi) to chhod do
+PIP_TIMEOUT = 300
+
+
+def auto_install_enabled() -> bool:
+    import os
+    env = os.environ.get("JHAND_AUTO_INSTALL", "1").strip().lower()
+    return AUTO_INSTALL and env not in ("0", "false", "no", "off")
+
+
+def pip_install(packages, wheelhouse: str = None, timeout: float = PIP_TIMEOUT) -> bool:
+    """
+    ``pip install`` ``packages`` in one go; True on success. With a
+    ``wheelhouse`` folder (or JHAND_WHEELHOUSE) only its wheels are used (no index).
+    """
+    import os
+    import subprocess
+    wheelhouse = wheelhouse or os.environ.get("JHAND_WHEELHOUSE")
+    cmd = [sys.executable, "-m", "pip", "install"]
+    if wheelhouse:
+        cmd += ["--no-index", "--find-links", wheelhouse]
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", module_name])
-        print(f"✅ '{module_name}' install ho gaya bhai! Code dobara chala ke dekh 😎")
+        subprocess.run(cmd + list(packages), check=True, timeout=timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        print(f"❌ pip {timeout:.0f}s mein bhi nahi nipta — network/wheelhouse check karo 🐌")
     except Exception as e:
-        print(f"❌ Auto install fail ho gaya for '{module_name}' 😭 — {e}")
+        print(f"❌ pip install fail ho gaya 😭 — {e}")
+    return False
+
+
+def try_auto_install(module_name: str):
+    """Try to install a missing module using pip (unless auto-install is off)."""
+    from .deps import pip_name
+    package = pip_name(module_name)
+    if not auto_install_enabled():
+        print(f"🛑 Auto-install band hai — '{package}' khud install karo "
+              f"(ya deploy par: jhand deps <file> --install)")
+        return
+    print(f"📦 Auto-Installer: '{module_name}' dhoond liya. Installing '{package}' via pip... 🚀")
+    if pip_install([package]):
+        print(f"✅ '{package}' install ho gaya bhai! Code dobara chala ke dekh 😎")
 
 # -------------------------
 # Builtins for JHAND
@@ -137,57 +137,113 @@ def bol(*args, **kwargs):
     """JHAND's desi print()"""
     print(*args, **kwargs)
 
+
+def pmap(fn, iterable, **kwargs):
+    """JHAND's desi parallel map (``milke_karo``) — see ``jhand.parallel``."""
+    from .parallel import pmap as _pmap
+    return _pmap(fn, iterable, **kwargs)
+
+
+def pimap(fn, iterable, **kwargs):
+    """Lazy parallel map (``milke_karte_jao``) — see ``jhand.parallel``."""
+    from .parallel import pimap as _pimap
+    return _pimap(fn, iterable, **kwargs)
+
 builtins.bol = bol
+builtins.pmap = pmap
+builtins.pimap = pimap
 
 # -------------------------
 # Main JHAND runner
 # -------------------------
-def run_jhand(source_code: str, filename="<jhand>"):
-    """Run JHAND code with trolling + proper debug info"""
-    # 🧠 Syntax Error Roast
-    try:
-        compiled = compile(source_code, filename, "exec")
-    except SyntaxError as se:
-        print("\n🔴 [ JHAND SYNTAX ERROR ]")
-        print("💬 " + roast(ROAST_SYNTAX))
-        print(f"📍 Line: {se.lineno}, Char: {se.offset}")
-        print(f"📝 Text: {se.text.strip() if se.text else 'Empty'}")
-        print(f"⚠️ Python Error: {se.msg}")
-        print("💡 Possible Fix: Check indentation, missing colons, ya galat likhi expression.")
-        return
+def report_syntax_error(se: SyntaxError):
+    """Roast a SyntaxError raised while compiling JHAND code"""
+    import linecache
+    from . import sourcemap
+    from .roasts import ROAST_SYNTAX, roast
+    lineno, offset, text = se.lineno, se.offset, se.text
+    mapped = sourcemap.map_position(se.filename, lineno)
+    if mapped is not None:
+        # transpiled Python ki position → asli .jhand line
+        source, lineno, col = mapped
+        offset = col + 1
+        text = linecache.getline(source, lineno) or text
+    print("\n🔴 [ JHAND SYNTAX ERROR ]")
+    print("💬 " + roast(ROAST_SYNTAX))
+    print(f"📍 Line: {lineno}, Char: {offset}")
+    print(f"📝 Text: {text.strip() if text else 'Empty'}")
+    print(f"⚠️ Python Error: {se.msg}")
+    print("💡 Possible Fix: Check indentation, missing colons, ya galat likhi expression.")
 
+
+def execute(compiled):
+    """Run a compiled JHAND program as ``__main__``; exceptions propagate."""
+    with main_module() as env:
+        exec(compiled, env, env)
+
+
+def run_compiled(compiled) -> bool:
+    """Execute an already compiled JHAND code object with runtime roasting.
+    Returns False if the program raised (after roasting it), True otherwise."""
     # 🧠 Runtime Error Roast (Detailed)
     try:
-        env = {"__name__": "__main__"}
-        exec(compiled, env, env)
+        execute(compiled)
+        return True
     except Exception as e:
-        exc_type, exc_value, exc_tb = sys.exc_info()
-        etype_name = exc_type.__name__
-        print("\n💥 [ JHAND RUNTIME ERROR ]")
-        print("💬 " + roast(ROAST_RUNTIME))
-        print("📍 Python Traceback (most recent call last):")
-        traceback.print_exception(exc_type, exc_value, exc_tb)
+        report_runtime_error(e)
+        return False
 
-        print(f"⚠️ Error Type: {etype_name}")
-        print(f"💡 Likely Cause: {str(exc_value)}")
-
-        # Special handling for ImportError to extract module name
-        if etype_name == "ImportError":
-            match = re.search(r"named '([^']+)'", str(exc_value))
-            if match:
-                module_name = match.group(1)
-                print(f"🧠 Roast: {roast(EXCEPTION_HANDLERS['ImportError'][0])}")
-                print(f"🛠️ Fix: pip install {module_name}")
-                try_auto_install(module_name)
-            else:
-                print("🧠 Roast: ImportError aaya lekin module naam pakad nahi paya 😅")
-        elif etype_name in EXCEPTION_HANDLERS:
-            roast_msg, fix_msg = EXCEPTION_HANDLERS[etype_name]
-            print("🧠 Roast: " + roast(roast_msg))
-            print("🛠️ Fix: " + fix_msg)
+
+def report_runtime_error(exc: BaseException):
+    """Roast an exception raised by a running JHAND program (traceback on .jhand lines)."""
+    import re
+    from . import sourcemap
+    from .roasts import EXCEPTION_HANDLERS, ROAST_RUNTIME, roast
+    exc_type, exc_value, exc_tb = type(exc), exc, exc.__traceback__
+    etype_name = exc_type.__name__
+    print("\n💥 [ JHAND RUNTIME ERROR ]")
+    print("💬 " + roast(ROAST_RUNTIME))
+    print("📍 Python Traceback (most recent call last):")
+    # --buffered-output mein stdout pehle likho, warna traceback upar aa jayega
+    sys.stdout.flush()
+    sys.stderr.write("".join(sourcemap.format_exception(exc_type, exc_value, exc_tb)))
+
+    print(f"⚠️ Error Type: {etype_name}")
+    print(f"💡 Likely Cause: {str(exc_value)}")
+
+    # Special handling for ImportError (aur ModuleNotFoundError) to extract module name
+    if isinstance(exc_value, ImportError):
+        match = re.search(r"named '([^']+)'", str(exc_value))
+        if match:
+            from .deps import pip_name
+            module_name = match.group(1)
+            print(f"🧠 Roast: {roast(EXCEPTION_HANDLERS['ImportError'][0])}")
+            print(f"🛠️ Fix: pip install {pip_name(module_name)}")
+            try_auto_install(module_name)
         else:
-            print("🧠 Roast: Is exception ka bhi jawab nahi hai bhai... generic error 🥲")
-            print("🛠️ Fix: Traceback padh ke debugging shuru kar 😎")
+            print("🧠 Roast: ImportError aaya lekin module naam pakad nahi paya 😅")
+    elif etype_name in EXCEPTION_HANDLERS:
+        roast_msg, fix_msg = EXCEPTION_HANDLERS[etype_name]
+        print("🧠 Roast: " + roast(roast_msg))
+        print("🛠️ Fix: " + fix_msg)
+    else:
+        print("🧠 Roast: Is exception ka bhi jawab nahi hai bhai... generic error 🥲")
+        print("🛠️ Fix: Traceback padh ke debugging shuru kar 😎")
+
+
+def run_jhand(source_code: str, filename="<jhand>", source_map=None):
+    """Run JHAND code with trolling + proper debug info"""
+    if source_map is not None:
+        # errors ko .jhand positions par map karne ke liye
+        from . import sourcemap
+        sourcemap.register(filename, source_map)
+    # 🧠 Syntax Error Roast
+    try:
+        compiled = compile(source_code, filename, "exec")
+    except SyntaxError as se:
+        report_syntax_error(se)
+        return
+    run_compiled(compiled)
 
 # -------------------------
 # Simple run_code (no trolling)
@@ -195,9 +251,10 @@ def run_jhand(source_code: str, filename="<jhand>"):
 def run_code(source_code: str, filename="<jhand>"):
     try:
         compiled = compile(source_code, filename, "exec")
-        env = {"__name__": "__main__"}
-        exec(compiled, env, env)
+        with main_module() as env:
+            exec(compiled, env, env)
     except Exception:
+        import traceback
         exc_type, exc_value, exc_tb = sys.exc_info()
         print("\n💥 [ JHAND RUNTIME ERROR ]")
         traceback.print_exception(exc_type, exc_value, exc_tb)
@@ -0,0 +1,248 @@
+"""
+``jhand serve`` — long-lived daemon jo front end warm rakhta hai.
+
+Master process Unix socket banata hai, jhand runtime/transpiler ek baar
+import karta hai, aur N pre-forked workers chalata hai (mare to dobara
+fork). Har worker same socket par ``accept`` karta hai:
+
+1. client se request + uske stdin/stdout/stderr fds (``SCM_RIGHTS``) lo;
+2. script ka code apni in-memory cache se lo (mtime/size badle to
+   ``cache.get_code`` se dobara, jo khud ``__jhandcache__`` use karta hai);
+3. ek child fork karo jo client ke fds, cwd, argv aur env ke saath code
+   chalata hai — har run ko saaf process milta hai, par imports warm;
+4. child ka exit status client ko wapas bhejo.
+
+Sirf Unix (AF_UNIX + fork) par chalta hai.
+"""
+import argparse
+import array
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+
+from . import cache
+from . import importer
+from . import runtime
+from .client import default_socket_path, read_line
+
+_MAX_FDS = 3
+
+
+class Worker:
+    """One pre-forked worker: accepts requests and runs them in forked children."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.codes = {}  # path -> (mtime_ns, size, code)
+
+    def get_code(self, path: str):
+        st = os.stat(path)
+        cached = self.codes.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        code = cache.get_code(path)
+        self.codes[path] = (st.st_mtime_ns, st.st_size, code)
+        return code
+
+    def serve_forever(self):
+        while True:
+            conn, _ = self.sock.accept()
+            try:
+                self.handle(conn)
+            except Exception as e:
+                # ek request ki galti se worker nahi marna chahiye
+                try:
+                    conn.sendall(json.dumps({"status": 2, "error": str(e)}).encode("utf-8") + b"\n")
+                except OSError:
+                    pass
+            finally:
+                conn.close()
+
+    def _receive(self, conn: socket.socket):
+        fd_size = array.array("i").itemsize
+        data, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_SPACE(_MAX_FDS * fd_size))
+        fds = array.array("i")
+        for level, kind, payload in ancdata:
+            if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+                fds.frombytes(payload[:len(payload) - (len(payload) % fd_size)])
+        return json.loads(read_line(conn, data).decode("utf-8")), list(fds)
+
+    def handle(self, conn: socket.socket):
+        request, fds = self._receive(conn)
+        try:
+            path = request["file"]
+            try:
+                code = self.get_code(path)
+            except SyntaxError as se:
+                code = se
+            except OSError as e:
+                code = e
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                self._run_child(request, fds, code)  # never returns
+            _, status = os.waitpid(pid, 0)
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+        if os.WIFEXITED(status):
+            code = os.WEXITSTATUS(status)
+        else:
+            code = 128 + os.WTERMSIG(status)
+        conn.sendall(json.dumps({"status": code}).encode("utf-8") + b"\n")
+
+    def _run_child(self, request, fds, code):
+        status = 1
+        try:
+            self.sock.close()
+            for target, fd in enumerate(fds[:3]):
+                os.dup2(fd, target)
+            os.chdir(request.get("cwd") or "/")
+            os.environ.clear()
+            os.environ.update(request.get("env") or {})
+            path = request["file"]
+            sys.argv = [path] + list(request.get("argv") or [])
+            sys.path[0] = os.path.dirname(path)
+            runtime.OWN_MAIN = True
+
+            if isinstance(code, SyntaxError):
+                runtime.report_syntax_error(code)
+            elif isinstance(code, OSError):
+                print(f"❌ File nahi mili: {path}")
+            else:
+                status = 0 if runtime.run_compiled(code) else 1
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except BaseException:
+            status = 1
+        finally:
+            try:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(status)
+
+
+_STOP_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+
+def _spawn(sock: socket.socket, pids: set):
+    """Fork one worker and add its pid to ``pids``."""
+    # Fork ke aas paas SIGTERM aaye to naya worker master ka ``_stop`` na
+    # chalaye (fork ke andar wala KeyboardInterrupt ignore ho jata hai aur
+    # worker zinda reh jata hai), aur master pid note karne se pehle na ruke —
+    # default handler lagne / pid note hone tak signals rok ke rakho.
+    blocked = signal.pthread_sigmask(signal.SIG_BLOCK, _STOP_SIGNALS)
+    pid = os.fork()
+    if pid == 0:
+        try:
+            for signum in _STOP_SIGNALS:
+                signal.signal(signum, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_SETMASK, blocked)
+            Worker(sock).serve_forever()
+        finally:
+            os._exit(0)
+    pids.add(pid)
+    signal.pthread_sigmask(signal.SIG_SETMASK, blocked)
+
+
+def _in_use(socket_path: str) -> bool:
+    """True if a server is already accepting on ``socket_path``."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        # ECONNREFUSED: purana socket, koi sun nahi raha
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def serve(socket_path: str = None, workers: int = None) -> bool:
+    """Run the daemon until SIGINT/SIGTERM; False if ``socket_path`` is taken."""
+    socket_path = socket_path or default_socket_path()
+    workers = workers or os.cpu_count() or 2
+    if os.path.lexists(socket_path):
+        if _in_use(socket_path):
+            print(f"❌ {socket_path} par jhand server pehle se chal raha hai")
+            return False
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            print(f"❌ {socket_path} socket nahi hai — hatao ya --socket se doosra path do")
+            return False
+        os.unlink(socket_path)  # pichle server ka bacha hua socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)  # sirf isi user ke liye
+    try:
+        sock.bind(socket_path)
+    finally:
+        os.umask(old_umask)
+    sock.listen(128)
+
+    # script ka folder workers mein har request par sys.path[0] banta hai
+    sys.path.insert(0, os.getcwd())
+    importer.install()
+
+    stopping = False
+
+    def _stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    pids = set()
+    try:
+        # startup bhi try ke andar: SIGTERM kabhi bhi aaye, workers saaf hon
+        for _ in range(workers):
+            _spawn(sock, pids)
+        print(f"🚀 jhand server chalu: {socket_path} ({workers} workers)")
+        sys.stdout.flush()
+        while pids:
+            pid, _ = os.wait()
+            pids.discard(pid)
+            if not stopping:
+                _spawn(sock, pids)  # worker mar gaya — naya fork karo
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        sock.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+        print("👋 jhand server band")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="jhand serve",
+        description="🚀 Warm jhand daemon — scripts 'jhand-client file.jhand' se chalao"
+    )
+    parser.add_argument("--socket", default=None,
+                        help=f"Unix socket path (default: {default_socket_path()})")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Pre-forked workers (default: CPU count)")
+    args = parser.parse_args(argv)
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        print("❌ jhand serve sirf Unix par chalta hai")
+        return 1
+    return 0 if serve(args.socket, args.workers) else 1
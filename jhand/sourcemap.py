@@ -0,0 +1,167 @@
+"""
+Source maps: transpiled Python line → original .jhand line/column.
+
+``Transpiler`` har emitted physical line ke liye ek entry record karta hai.
+Map ``__jhandcache__`` mein ``.py`` ke saath ``.map`` file ban kar store hota
+hai (zlib-compressed ``array`` deltas), aur runtime ka error path isse
+traceback frames ko .jhand positions par wapas le aata hai.
+"""
+import linecache
+import marshal
+import os
+import traceback
+import zlib
+from array import array
+
+_FORMAT = 1
+
+
+class SourceMap:
+    """Per generated line: ``(jhand_line, jhand_col)``; line 0 means "no source"."""
+
+    __slots__ = ("source", "lines", "cols")
+
+    def __init__(self, source: str = None, lines=None, cols=None):
+        self.source = source                  # path of the .jhand file, if known
+        self.lines = lines if lines is not None else array("I")
+        self.cols = cols if cols is not None else array("I")
+
+    def add(self, line: int, col: int = 0):
+        """Record the origin of the next generated line."""
+        self.lines.append(line)
+        self.cols.append(col)
+
+    def lookup(self, py_line: int):
+        """``(jhand_line, jhand_col)`` for 1-based ``py_line``, or None."""
+        if 1 <= py_line <= len(self.lines):
+            line = self.lines[py_line - 1]
+            if line:
+                return line, self.cols[py_line - 1]
+        return None
+
+    def __len__(self):
+        return len(self.lines)
+
+    # ---------------- (de)serialisation ----------------
+    def to_bytes(self) -> bytes:
+        return zlib.compress(marshal.dumps((
+            _FORMAT, self.source, _delta(self.lines).tobytes(), self.cols.tobytes()
+        )))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SourceMap":
+        fmt, source, lines, cols = marshal.loads(zlib.decompress(data))
+        if fmt != _FORMAT:
+            raise ValueError(f"unknown source map format {fmt}")
+        return cls(source, _undelta(array("i", lines)), array("I", cols))
+
+
+def _delta(values) -> array:
+    out = array("i")
+    prev = 0
+    for v in values:
+        out.append(v - prev)
+        prev = v
+    return out
+
+
+def _undelta(deltas) -> array:
+    out = array("I")
+    total = 0
+    for d in deltas:
+        total += d
+        out.append(total)
+    return out
+
+
+# -------------------------
+# Registry: generated filename → SourceMap
+# -------------------------
+_registry = {}
+# filename → us variant ki cached ``.map`` jiska code chala (``-O`` / ``--lazy-imports`` /
+# ``--async`` entries alag hain); file sirf error path par padhi jati hai
+_cached = {}
+
+
+def register(filename: str, smap: SourceMap):
+    _cached.pop(filename, None)
+    _registry[filename] = smap
+
+
+def register_cached(filename: str, map_path: str):
+    """Note that ``filename``'s code was loaded from the cache entry whose map is ``map_path``."""
+    if _cached.get(filename) != map_path:
+        _cached[filename] = map_path
+        _registry.pop(filename, None)
+
+
+def for_file(filename: str):
+    """Registered map for ``filename``, else the one cached in ``__jhandcache__``."""
+    smap = _registry.get(filename)
+    if smap is None and filename.endswith(".jhand") and os.path.isfile(filename):
+        # sirf error path mein load hota hai — warm runs par koi cost nahi
+        map_path = _cached.get(filename)
+        if map_path is None:
+            from .cache import cache_paths
+            map_path = cache_paths(filename)[2]
+        try:
+            with open(map_path, "rb") as f:
+                smap = SourceMap.from_bytes(f.read())
+        except (OSError, ValueError, EOFError, TypeError, zlib.error):
+            return None
+        if smap.source is None:
+            smap.source = filename
+        _registry[filename] = smap
+    return smap
+
+
+def map_position(filename: str, lineno: int):
+    """``(source_path, line, col)`` for a generated position, or None."""
+    smap = for_file(filename) if filename else None
+    if smap is None or lineno is None:
+        return None
+    pos = smap.lookup(lineno)
+    if pos is None:
+        return None
+    return (smap.source or filename,) + pos
+
+
+def remap_stack(stack: traceback.StackSummary) -> traceback.StackSummary:
+    """Rewrite frames of transpiled code to their .jhand file/line/text."""
+    frames = []
+    for fs in stack:
+        mapped = map_position(fs.filename, fs.lineno)
+        if mapped is None:
+            frames.append(fs)
+            continue
+        source, line, _ = mapped
+        text = linecache.getline(source, line).strip()
+        frames.append(traceback.FrameSummary(source, line, fs.name, line=text or None))
+    return traceback.StackSummary.from_list(frames)
+
+
+def format_exception(exc_type, exc_value, exc_tb):
+    """Like ``traceback.format_exception`` but with .jhand positions."""
+    te = traceback.TracebackException(exc_type, exc_value, exc_tb)
+    _remap_te(te, exc_value, set())
+    return list(te.format())
+
+
+def _remap_te(te, exc, seen):
+    # ``exc`` is the exception ``te`` was built from: TracebackException.exc_type
+    # 3.13 mein deprecated hai, to SyntaxError ka check asli exception se
+    if id(te) in seen:
+        return
+    seen.add(id(te))
+    te.stack = remap_stack(te.stack)
+    if isinstance(exc, SyntaxError):
+        mapped = map_position(te.filename, int(te.lineno)) if te.lineno else None
+        if mapped is not None:
+            te.filename, line, col = mapped
+            te.lineno = str(line) if isinstance(te.lineno, str) else line
+            te.text = linecache.getline(te.filename, line) or te.text
+            te.offset = col + 1
+    for chained, chained_exc in ((te.__cause__, getattr(exc, "__cause__", None)),
+                                 (te.__context__, getattr(exc, "__context__", None))):
+        if chained is not None:
+            _remap_te(chained, chained_exc, seen)
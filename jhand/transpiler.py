@@ -1,63 +1,87 @@
+import hashlib
 import os
-import sys
-from .parser import Parser, ASTNode
+import threading
+from collections import OrderedDict
+
+from .parser import Parser
+from .astnode import NODE_TYPES, ASTNode, Block, Class, Expr, Function, Import, Print, Program
 from .lexer import Lexer
+from .sourcemap import SourceMap
 
 
 class Transpiler:
-    def __init__(self, ast: ASTNode, source_path=None):
+    """
+    Emits Python source for a JHAND AST. With ``preserve_lines=True`` every
+    statement is padded onto its original .jhand line, so ``compile()`` of the
+    output reports .jhand line numbers in tracebacks without any mapping.
+    With ``lazy_imports=True`` plain ``laao x [as y]`` becomes a ``jhand.lazy``
+    proxy that imports on first attribute access.
+
+    An instance holds the output being built (``lines``, ``indent``, ...), so
+    use one per transpile; the module-level functions below do that and are
+    safe to call from many threads at once.
+    """
+    def __init__(self, ast: ASTNode, source_path=None, preserve_lines: bool = False,
+                 lazy_imports: bool = False):
         self.ast = ast
         self.lines = []
         self.indent = 0
         self.source_path = source_path
+        self.preserve_lines = preserve_lines
+        self.lazy_imports = lazy_imports
+        self.line_count = 0  # physical lines emitted so far (an entry may contain newlines)
+        self.source_map = SourceMap(source_path)
+        self._origin = (0, 0)  # .jhand (line, col) of the statement being emitted
+        self.jhand_imports = []  # paths of .jhand files imported by this module
 
     def transpile(self) -> str:
         self.visit(self.ast)
         return "\n".join(self.lines)
 
     def emit(self, line: str):
+        src_line, src_col = self._origin
         if line.strip():
             self.lines.append("    " * self.indent + line.strip())
+            extra = line.strip().count("\n")
+            self.source_map.add(src_line, src_col)
+            for i in range(1, extra + 1):
+                self.source_map.add(src_line + i if src_line else 0, 0)
+            self.line_count += extra + 1
         else:
             self.lines.append("")
+            self.source_map.add(src_line, src_col)
+            self.line_count += 1
 
     def visit(self, node: ASTNode):
         if node is None:
             return
-        method = getattr(self, f"visit_{node.nodetype.lower()}", None)
-        if method:
-            return method(node)
+        if self.preserve_lines and node.line:
+            # blank lines tak pad karo taaki statement apni .jhand line par aaye
+            missing = node.line - 1 - self.line_count
+            if missing > 0:
+                self.lines.extend([""] * missing)
+                for _ in range(missing):
+                    self.source_map.add(0)
+                self.line_count += missing
+        if node.line:
+            self._origin = (node.line, node.col)
+        method = self._dispatch.get(node.__class__)
+        if method is not None:
+            return method(self, node)
         for c in node.children:
             self.visit(c)
 
     # ---------------- IMPORT ----------------
-    def visit_import(self, node: ASTNode):
-        module = node.value.get("module")
-        symbols = node.value.get("symbols", [])
-        alias = node.value.get("alias", None)
-
-        def transpile_and_add(py_module_name, jhand_path):
-            build_dir = "__jhand_build__"
-            os.makedirs(build_dir, exist_ok=True)
-            py_out = os.path.join(build_dir, py_module_name + ".py")
-
-            jhand_mtime = os.path.getmtime(jhand_path)
-            if not os.path.exists(py_out) or os.path.getmtime(py_out) < jhand_mtime:
-                with open(jhand_path, "r", encoding="utf-8") as f:
-                    s = f.read()
-                py_code = transpile(s, source_path=jhand_path)
-                with open(py_out, "w", encoding="utf-8") as f:
-                    f.write(py_code)
-            if build_dir not in sys.path:
-                sys.path.insert(0, build_dir)
-
-        maybe_path = module.replace(".", os.sep) + ".jhand"
+    def visit_import(self, node: Import):
+        module = node.module
+        symbols = node.symbols
+        alias = node.alias
+
+        # .jhand imports ka record rakho; inhe import hook lazily compile karega
         if self.source_path:
-            base_dir = os.path.dirname(self.source_path)
-            candidate = os.path.join(base_dir, maybe_path)
-            if os.path.isfile(candidate):
-                py_module_name = (module.replace(".", "_")).lstrip(".")
-                transpile_and_add(py_module_name, candidate)
+            for candidate in import_targets(node, self.source_path):
+                if candidate not in self.jhand_imports:
+                    self.jhand_imports.append(candidate)
 
         if symbols:
             parts = []
@@ -68,29 +92,29 @@ class Transpiler:
                 else:
                     parts.append(entry)
             self.emit(f"from {module} import {', '.join(parts)}")
+        elif self.lazy_imports and "." not in module:
+            # dotted import parent package ko chalaye bina nahi ho sakta — wo eager hi
+            self.emit(f'{alias or module} = __import__("jhand.lazy", fromlist=["_"]).module("{module}")')
         else:
             if alias:
                 self.emit(f"import {module} as {alias}")
             else:
                 self.emit(f"import {module}")
 
-    def visit_program(self, node: ASTNode):
+    def visit_program(self, node: Program):
         for c in node.children:
             self.visit(c)
 
-    def visit_print(self, node: ASTNode):
-        self.emit(f"print({node.value})")
+    def visit_print(self, node: Print):
+        self.emit(f"print({node.content})")
 
-    def visit_expr(self, node: ASTNode):
-        if node.value:
-            self.emit(node.value)
+    def visit_expr(self, node: Expr):
+        if node.text:
+            self.emit(node.text)
 
-    def visit_function(self, node: ASTNode):
-        name = node.value.get("name", "")
-        params = node.value.get("params", "")
-        is_async = node.value.get("async", False)
-        prefix = "async " if is_async else ""
-        self.emit(f"{prefix}def {name}({params}):")
+    def visit_function(self, node: Function):
+        prefix = "async " if node.is_async else ""
+        self.emit(f"{prefix}def {node.name}({node.params}):")
         self.indent += 1
         if node.children:
             for c in node.children:
@@ -99,9 +123,8 @@ class Transpiler:
             self.emit("pass")
         self.indent -= 1
 
-    def visit_class(self, node: ASTNode):
-        name = node.value.get("name", "")
-        self.emit(f"class {name}:")
+    def visit_class(self, node: Class):
+        self.emit(f"class {node.name}:")
         self.indent += 1
         if node.children:
             for c in node.children:
@@ -110,8 +133,8 @@ class Transpiler:
             self.emit("pass")
         self.indent -= 1
 
-    def visit_block(self, node: ASTNode):
-        header = node.value.get("header", "").strip()
+    def visit_block(self, node: Block):
+        header = node.header.strip()
         if not header.endswith(":"):
             header += ":"
         self.emit(header)
@@ -120,12 +143,133 @@ class Transpiler:
             self.visit(c)
         self.indent -= 1
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = _dispatch_table(cls)
+
+
+def _dispatch_table(cls) -> dict:
+    """node class → ``visit_*`` function of ``cls``; per node sirf ek dict lookup."""
+    table = {}
+    for node_cls in NODE_TYPES:
+        method = getattr(cls, "visit_" + node_cls.nodetype.lower(), None)
+        if method is not None:
+            table[node_cls] = method
+    return table
+
+
+Transpiler._dispatch = _dispatch_table(Transpiler)
+
+
+# ✅ Import statement se .jhand files dhoondo (relative imports bhi)
+def resolve_jhand_import(module: str, source_path: str, symbols=()):
+    """
+    Return the .jhand files an import of ``module`` (and, for ``from``
+    imports, its ``symbols`` as submodules) refers to, relative to the
+    directory of ``source_path``.
+    """
+    level = len(module) - len(module.lstrip("."))
+    base_dir = os.path.dirname(os.path.abspath(source_path))
+    for _ in range(max(level - 1, 0)):
+        base_dir = os.path.dirname(base_dir)
+    parts = [p for p in module.lstrip(".").split(".") if p]
+
+    found = []
+    target = os.path.join(base_dir, *parts)
+    if parts:
+        for candidate in (target + ".jhand", os.path.join(target, "__init__.jhand")):
+            if os.path.isfile(candidate):
+                found.append(candidate)
+                break
+    for name in symbols:
+        candidate = os.path.join(target, name + ".jhand")
+        if os.path.isfile(candidate):
+            found.append(candidate)
+    return found
+
+
+def import_targets(node: Import, source_path: str):
+    """The .jhand files an ``Import`` node of ``source_path`` refers to."""
+    names = [entry[0] if isinstance(entry, tuple) else entry for entry in node.symbols]
+    return resolve_jhand_import(node.module, source_path, names)
+
+
+# -------------------------
+# In-process result cache
+# -------------------------
+# sha256(options + source) → transpiled Python. Output source_path par depend
+# nahi karta, to same snippet har request/thread mein ek hi baar transpile hota hai.
+TRANSPILE_CACHE_SIZE = 256
+
+_results = OrderedDict()
+_results_lock = threading.Lock()
+
+
+def _result_key(source_code: str, preserve_lines: bool, optimize: int, lazy_imports: bool) -> bytes:
+    h = hashlib.sha256(f"{int(preserve_lines)}:{optimize}:{int(lazy_imports)}:".encode("ascii"))
+    h.update(source_code.encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def clear_cache():
+    """Drop every cached ``transpile()`` result."""
+    with _results_lock:
+        _results.clear()
+
 
 # ✅ Module-level transpile function
-def transpile(source_code: str, source_path=None) -> str:
+def transpile(source_code: str, source_path=None, preserve_lines: bool = False,
+              optimize: int = 0, lazy_imports: bool = False) -> str:
+    """
+    Transpile ``source_code`` to Python. Thread-safe; results are kept in a
+    shared LRU (``TRANSPILE_CACHE_SIZE`` entries) keyed by the source hash.
+    """
+    key = _result_key(source_code, preserve_lines, optimize, lazy_imports)
+    with _results_lock:
+        py_code = _results.get(key)
+        if py_code is not None:
+            _results.move_to_end(key)
+            return py_code
+    # lock ke bahar transpile — doosre threads wait nahi karte; do threads ek
+    # hi miss saath mein karein to dono same string banate hain, koi harm nahi
+    py_code = _transpile(source_code, source_path, preserve_lines, optimize, lazy_imports)
+    with _results_lock:
+        _results[key] = py_code
+        _results.move_to_end(key)
+        while len(_results) > TRANSPILE_CACHE_SIZE:
+            _results.popitem(last=False)
+    return py_code
+
+
+def _transpile(source_code: str, source_path, preserve_lines: bool, optimize: int,
+               lazy_imports: bool) -> str:
     lexer = Lexer(source_code)
     tokens = lexer.tokenize()
     parser = Parser(tokens)
     ast = parser.parse()
-    t = Transpiler(ast, source_path=source_path)
+    if optimize:
+        from .optimizer import optimize as run_optimizer
+        run_optimizer(ast, optimize)
+    t = Transpiler(ast, source_path=source_path, preserve_lines=preserve_lines,
+                   lazy_imports=lazy_imports)
     return t.transpile()
+
+
+def transpile_with_map(source_code: str, source_path=None, preserve_lines: bool = False):
+    """Like ``transpile`` but also return the ``SourceMap`` of the output."""
+    ast = Parser(Lexer(source_code).iter_tokens()).parse()
+    t = Transpiler(ast, source_path=source_path, preserve_lines=preserve_lines)
+    return t.transpile(), t.source_map
+
+
+def iter_transpile(source, source_path=None, lazy_imports: bool = False):
+    """
+    Yield transpiled Python one top-level statement at a time. ``source`` can
+    be a string or a file object; tokens and AST are never held for the whole file.
+    """
+    parser = Parser(Lexer(source).iter_tokens())
+    t = Transpiler(None, source_path=source_path, lazy_imports=lazy_imports)
+    for node in parser.iter_statements():
+        t.lines = []
+        t.visit(node)
+        yield "\n".join(t.lines) + "\n"
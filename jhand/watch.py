@@ -0,0 +1,336 @@
+"""
+``jhand watch file.jhand [args...]`` — edit karo, save karo, program khud
+dobara chalega.
+
+Watcher process ek baar garam hota hai (runtime, transpiler import) aur
+har tracked file ke liye ``IncrementalTranspiler`` rakhta hai, to save par
+sirf badle hue modules — aur unme bhi sirf badle statements — dobara
+transpile hote hain. Imported .jhand modules (``laao`` / ``se_laao``,
+transitively) bhi watch hote hain; unka compiled code ``__jhandcache__``
+mein likha jata hai jahan se import hook uthata hai.
+
+Har run watcher ka ek fresh fork hota hai — interpreter startup ka kharcha
+nahi, aur purani run ki state (globals, imported modules) saaf. File badli
+aur program abhi chal raha hai (server, GUI loop) to use SIGTERM karke
+naya chalaya jata hai. Linux par inotify (ctypes se), baaki jagah polling.
+"""
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import signal
+import struct
+import subprocess
+import sys
+import time
+
+from . import cache
+from . import importer
+from . import runtime
+from .incremental import IncrementalTranspiler
+
+JHAND_SUFFIX = ".jhand"
+
+# save ke baad editors kai events bhejte hain (temp file, rename, chmod) — itna ruk ke sab ek saath
+_DEBOUNCE = 0.05
+_STOP_GRACE = 2.0
+
+
+def _stamp(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+# -------------------------
+# Watchers
+# -------------------------
+class PollingWatcher:
+    """Stat-based watcher: tracked files + the .jhand listing of their folders."""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self._stamps = {}
+
+    @staticmethod
+    def _check(path: str):
+        if path.endswith(JHAND_SUFFIX):
+            return _stamp(path)
+        # folder: sirf nayi/hati .jhand files se fark padta hai (program ke output files se nahi)
+        try:
+            return frozenset(n for n in os.listdir(path) if n.endswith(JHAND_SUFFIX))
+        except OSError:
+            return None
+
+    def set_paths(self, files):
+        paths = set(files) | {os.path.dirname(f) for f in files}
+        self._stamps = {p: self._check(p) for p in paths}
+
+    def wait(self, timeout: float):
+        """Block up to ``timeout`` seconds; return the set of changed paths."""
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = {p for p, st in self._stamps.items() if self._check(p) != st}
+            if changed:
+                for p in changed:
+                    self._stamps[p] = self._check(p)
+                return changed
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return set()
+            time.sleep(min(self.interval, left))
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify on the folders of tracked files (editors save via rename bhi karte hain)."""
+
+    _MASK = (0x00000004 | 0x00000008 | 0x00000040 | 0x00000080 | 0x00000100 | 0x00000200)
+    # IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+        self._dirs = {}   # wd -> directory
+        self._files = set()
+
+    def set_paths(self, files):
+        self._files = set(files)
+        wanted = {os.path.dirname(f) for f in files}
+        for directory in wanted - set(self._dirs.values()):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self._MASK)
+            if wd >= 0:
+                self._dirs[wd] = directory
+
+    def _read(self):
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        pos = 0
+        size = self._EVENT.size
+        while pos + size <= len(data):
+            wd, _, _, length = self._EVENT.unpack_from(data, pos)
+            name = data[pos + size:pos + size + length].rstrip(b"\0")
+            pos += size + length
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if path in self._files or path.endswith(JHAND_SUFFIX):
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout: float):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = self._read()
+        while select.select([self.fd], [], [], _DEBOUNCE)[0]:
+            changed |= self._read()
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def make_watcher(poll: bool = False, interval: float = 0.25):
+    """inotify if available (Linux), else the polling watcher."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher()
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(interval)
+
+
+# -------------------------
+# Build + run
+# -------------------------
+class Session:
+    """One watched program: per-file incremental transpilers + the running child."""
+
+    def __init__(self, path: str, args=()):
+        self.path = os.path.abspath(path)
+        self.args = list(args)
+        self._transpilers = {}  # path -> IncrementalTranspiler
+        self._built = {}        # path -> (stamp, Compiled)
+        self.files = {self.path}
+        self.child = None
+
+    def _compile(self, path: str):
+        stamp = _stamp(path)
+        prev = self._built.get(path)
+        if prev is not None and prev[0] == stamp:
+            return prev[1]
+        with open(path, "r", encoding="utf-8") as f:
+            source = f.read()
+        inc = self._transpilers.get(path)
+        if inc is None:
+            inc = self._transpilers[path] = IncrementalTranspiler(path, preserve_lines=True)
+        compiled = inc.compile(source)
+        # import hook + traceback mapping dono __jhandcache__ se padhte hain
+        cache.store(path, cache.source_key(source), compiled)
+        self._built[path] = (stamp, compiled)
+        return compiled
+
+    def build(self):
+        """Compile the program and its .jhand imports; return the main code or None."""
+        files = set()
+        todo = [self.path]
+        main = None
+        ok = True
+        while todo:
+            path = todo.pop()
+            if path in files:
+                continue
+            files.add(path)
+            try:
+                compiled = self._compile(path)
+            except SyntaxError as se:
+                runtime.report_syntax_error(se)
+                ok = False
+                continue
+            except OSError as e:
+                print(f"❌ File read nahi hui: {path} ({e})")
+                ok = False
+                continue
+            if path == self.path:
+                main = compiled.code
+            todo.extend(compiled.jhand_imports)
+        if not ok:
+            # toota build imports nahi batata — purane files bhi watch karte raho
+            files |= self.files
+        self.files = files
+        return main if ok else None
+
+    def start(self, code):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        if not hasattr(os, "fork"):
+            # fork nahi (Windows) — normal jhand process, cache garam hai
+            self.child = subprocess.Popen([sys.executable, "-m", "jhand.cli", self.path] + self.args)
+            return
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+                sys.argv = [self.path] + self.args
+                runtime.OWN_MAIN = True
+                status = 0 if runtime.run_compiled(code) else 1
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except KeyboardInterrupt:
+                status = 130
+            finally:
+                try:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                finally:
+                    os._exit(status)
+        self.child = pid
+
+    def poll_child(self):
+        """Exit status if the child finished (and forget it), else None."""
+        if self.child is None:
+            return None
+        if isinstance(self.child, subprocess.Popen):
+            status = self.child.poll()
+        else:
+            pid, raw = os.waitpid(self.child, os.WNOHANG)
+            if pid == 0:
+                return None
+            status = os.WEXITSTATUS(raw) if os.WIFEXITED(raw) else 128 + os.WTERMSIG(raw)
+        if status is not None:
+            self.child = None
+        return status
+
+    def stop(self):
+        if self.child is None:
+            return
+        if isinstance(self.child, subprocess.Popen):
+            self.child.terminate()
+            try:
+                self.child.wait(_STOP_GRACE)
+            except subprocess.TimeoutExpired:
+                self.child.kill()
+                self.child.wait()
+        else:
+            try:
+                os.kill(self.child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            deadline = time.monotonic() + _STOP_GRACE
+            while self.poll_child() is None and self.child is not None:
+                if time.monotonic() > deadline:
+                    os.kill(self.child, signal.SIGKILL)
+                    os.waitpid(self.child, 0)
+                    break
+                time.sleep(0.01)
+        self.child = None
+
+
+def watch(path: str, args=(), poll: bool = False, interval: float = 0.25):
+    """Run ``path``, then re-run it on every change until Ctrl+C."""
+    session = Session(path, args)
+    script_dir = os.path.dirname(session.path)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    importer.install()
+    watcher = make_watcher(poll, interval)
+    kind = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+
+    try:
+        while True:
+            code = session.build()
+            watcher.set_paths(session.files)
+            if code is not None:
+                session.start(code)
+            print(f"👀 Watching {len(session.files)} file(s) [{kind}] — Ctrl+C se band")
+            sys.stdout.flush()
+
+            changed = set()
+            while not changed:
+                changed = watcher.wait(0.2)
+                status = session.poll_child()
+                if status is not None:
+                    mark = "✅" if status == 0 else "💥"
+                    print(f"{mark} Program khatam (exit {status}) — save karo, dobara chalega 💤")
+                    sys.stdout.flush()
+            session.stop()
+            names = ", ".join(sorted(os.path.relpath(p) for p in changed))
+            print(f"\n🔁 Badla: {names} — dobara chala rahe hain...")
+    except KeyboardInterrupt:
+        session.stop()
+        print("\n👋 Watch band")
+    finally:
+        watcher.close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="jhand watch",
+        description="👀 File (aur uske .jhand imports) save hote hi program dobara chalao"
+    )
+    parser.add_argument("file", help="Path to the .jhand file")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Program ke arguments")
+    parser.add_argument("--poll", action="store_true", help="inotify ke bajaye polling use karo")
+    parser.add_argument("--interval", type=float, default=0.25, help="Polling interval (seconds)")
+    args = parser.parse_args(argv)
+    if not os.path.isfile(args.file):
+        print(f"❌ File nahi mili: {args.file}")
+        return 1
+    return watch(args.file, args.args, poll=args.poll, interval=args.interval)
@@ -10,7 +10,7 @@ setup(
     long_description=open("README.md", encoding="utf-8").read(),
     long_description_content_type="text/markdown",
     url="https://github.com/asaad2691/jhand_lang",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     include_package_data=True,
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -23,6 +23,7 @@ setup(
     entry_points={
         "console_scripts": [
             "jhand=jhand.cli:main",
+            "jhand-client=jhand.client:main",
         ],
     },
     install_requires=[],
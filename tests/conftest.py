@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def run_cli(tmp_path):
+    """Run ``jhand <args>`` in a fresh interpreter (cwd = ``tmp_path``); return the CompletedProcess."""
+    def run(*args, timeout=60, env=None, **kwargs):
+        full_env = dict(os.environ, PYTHONPATH=ROOT, **(env or {}))
+        return subprocess.run([sys.executable, "-m", "jhand.cli", *map(str, args)], cwd=tmp_path,
+                              capture_output=True, text=True, timeout=timeout, env=full_env,
+                              **kwargs)
+    return run
@@ -0,0 +1,61 @@
+from jhand import aio, cache
+
+PROGRAM = ('laao asyncio\n'
+           'tez_bhenchod bhenchod main():\n'
+           '    await asyncio.sleep(0)\n'
+           '    bol("main chala")\n'
+           'await asyncio.sleep(0)\n'
+           'bol("body")\n')
+
+
+def compiled(tmp_path, source):
+    path = tmp_path / "prog.jhand"
+    path.write_text(source, encoding="utf-8")
+    return cache.compile_source(source, str(path), top_level_await=True).code
+
+
+def test_top_level_await_then_main(tmp_path, capsys):
+    code = compiled(tmp_path, PROGRAM)
+    assert aio.is_async_body(code)
+    aio.execute(code, slow_callback=0)
+    assert capsys.readouterr().out == "body\nmain chala\n"
+
+
+def test_main_not_run_twice(tmp_path, capsys):
+    source = PROGRAM.replace('bol("body")\n', 'await main()\n')
+    code = compiled(tmp_path, source)
+
+    async def main():
+        pass
+
+    assert aio.find_entry(compiled(tmp_path, PROGRAM), {"main": main}) is main
+    # body khud main() await karti hai — runner dobara nahi chalata
+    assert aio.find_entry(code, {"main": main}) is None
+    aio.execute(code, slow_callback=0)
+    assert capsys.readouterr().out == "main chala\n"
+
+
+def test_sync_program_with_async_main(tmp_path, capsys):
+    code = compiled(tmp_path, PROGRAM.replace("await asyncio.sleep(0)\nbol", "bol"))
+    assert not aio.is_async_body(code)
+    aio.execute(code, slow_callback=0)
+    assert capsys.readouterr().out == "body\nmain chala\n"
+
+
+def test_slow_callback_names_jhand_line(tmp_path, capsys):
+    source = ('laao asyncio\nlaao time\n'
+              'tez_bhenchod bhenchod main():\n'
+              '    time.sleep(0.08)\n'
+              '    await asyncio.sleep(0)\n')
+    aio.execute(compiled(tmp_path, source), slow_callback=0.05)
+    err = capsys.readouterr().err
+    assert "Loop" in err and "prog.jhand:5" in err
+
+
+def test_cli_async(run_cli, tmp_path):
+    (tmp_path / "prog.jhand").write_text(PROGRAM, encoding="utf-8")
+    result = run_cli("--async", "prog.jhand")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["body", "main", "chala"]
+    # bina --async top-level await SyntaxError hai — aur flag ka hint milta hai
+    assert "jhand --async prog.jhand" in run_cli("prog.jhand").stdout
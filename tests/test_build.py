@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+from jhand import build, cache
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "main.jhand").write_text("laao helper\nbol(helper.x)\n", encoding="utf-8")
+    (tmp_path / "helper.jhand").write_text("x = 6 * 7\n", encoding="utf-8")
+    (tmp_path / "pkg" / "util.jhand").write_text("y = 1\n", encoding="utf-8")
+    (tmp_path / "broken.jhand").write_text("bhenchod f(:\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_parallel_build_writes_entries_and_manifest(tree, monkeypatch):
+    data = build.build_tree(str(tree), jobs=2)
+    assert set(data["files"]) == {"main.jhand", "helper.jhand", "pkg/util.jhand"}
+    assert list(data["errors"]) == ["broken.jhand"]
+    with open(tree / build.MANIFEST_NAME, encoding="utf-8") as f:
+        assert json.load(f)["files"] == data["files"]
+
+    for rel, entry in data["files"].items():
+        assert entry["status"] == "built"
+        jhc = tree / entry["cache"]
+        assert jhc.is_file() and jhc.name.endswith(".jhc")
+        source = (tree / rel).read_text(encoding="utf-8")
+        assert entry["hash"] == cache.source_key(source)
+        assert cache._read_entry(str(jhc), entry["hash"]) is not None
+
+    again = build.build_tree(str(tree), jobs=2)
+    assert {entry["status"] for entry in again["files"].values()} == {"fresh"}
+    # workers ki likhi entries hi use hoti hain — dobara compile nahi
+    monkeypatch.setattr(cache, "compile_source", lambda *a, **k: pytest.fail("recompiled"))
+    env = {}
+    exec(cache.get_code(str(tree / "helper.jhand")), env)
+    assert env["x"] == 42
+
+
+def test_optimized_build_records_every_level(tree):
+    data = build.build_tree(str(tree), jobs=1, optimize=1)
+    entry = data["files"]["helper.jhand"]
+    assert entry["cache"].endswith(".opt-1.jhc") and entry["entry_cache"].endswith(".opt-2.jhc")
+    assert entry["hash"] != entry["entry_hash"]
+    assert cache._read_entry(str(tree / entry["cache"]), entry["hash"]) is not None
+    assert cache._read_entry(str(tree / entry["entry_cache"]), entry["entry_hash"]) is not None
+
+
+def test_cli_build(run_cli, tree):
+    result = run_cli("build", ".", "-j", "2")
+    assert result.returncode == 1  # broken.jhand
+    assert "4 files" in result.stdout and "3 compiled" in result.stdout
+    assert "broken.jhand" in result.stderr
+    os.remove(tree / "broken.jhand")
+    result = run_cli("build", ".")
+    assert result.returncode == 0 and "3 already fresh" in result.stdout
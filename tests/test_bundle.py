@@ -0,0 +1,71 @@
+import importlib.util
+import marshal
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from jhand import bundle
+
+
+@pytest.fixture
+def program(tmp_path):
+    src = tmp_path / "src"
+    (src / "pkg").mkdir(parents=True)
+    (src / "main.jhand").write_text(
+        "laao sys\nlaao helper\nse_laao pkg.util laao dbl\n"
+        "bol(helper.naam(), dbl(21), sys.argv[1:])\n", encoding="utf-8")
+    (src / "helper.jhand").write_text('bhenchod naam():\n    leja "helper"\n', encoding="utf-8")
+    (src / "pkg" / "__init__.jhand").write_text('bol("pkg init")\n', encoding="utf-8")
+    (src / "pkg" / "util.jhand").write_text("bhenchod dbl(x):\n    leja x * 2\n", encoding="utf-8")
+    return src
+
+
+def test_archive_contents_and_pyc_headers(program, tmp_path):
+    output, count = bundle.bundle(str(program / "main.jhand"), str(tmp_path / "app.pyz"))
+    assert count == 4
+    with zipfile.ZipFile(output) as zf:
+        names = set(zf.namelist())
+        pycs = {name: zf.read(name) for name in names if name.endswith(".pyc")}
+    assert {"__main__.py", "__jhand_main__.pyc", "helper.pyc", "pkg/__init__.pyc",
+            "pkg/util.pyc", "jhand/runtime.pyc"} <= names
+    assert not [name for name in names if name.endswith((".jhand", ".py")) and name != "__main__.py"]
+
+    with open(program / "helper.jhand", "rb") as f:
+        helper_source = f.read()
+    for name, data in pycs.items():
+        # PEP 552: magic, flags=0b01 (hash-based, unchecked), source hash, marshalled code
+        assert data[:4] == importlib.util.MAGIC_NUMBER, name
+        assert int.from_bytes(data[4:8], "little") == 1, name
+        assert marshal.loads(data[16:]).co_filename, name
+    assert pycs["helper.pyc"][8:16] == importlib.util.source_hash(helper_source)
+
+
+def test_bundle_runs_without_sources(program, tmp_path):
+    output, _ = bundle.bundle(str(program / "main.jhand"), str(tmp_path / "app.pyz"))
+    for path in sorted(program.rglob("*"), reverse=True):
+        path.unlink() if path.is_file() else path.rmdir()
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    result = subprocess.run([sys.executable, output, "a", "b"], cwd=tmp_path, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert result.stdout.splitlines() == ["pkg init", "helper 42 ['a', 'b']"]
+    assert not list(tmp_path.rglob("__jhandcache__"))
+
+
+def test_bundle_is_reproducible(program, tmp_path):
+    first, _ = bundle.bundle(str(program / "main.jhand"), str(tmp_path / "one.pyz"))
+    second, _ = bundle.bundle(str(program / "main.jhand"), str(tmp_path / "two.pyz"))
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+
+
+def test_every_broken_module_reported(program):
+    (program / "helper.jhand").write_text("bhenchod naam(:\n", encoding="utf-8")
+    (program / "pkg" / "util.jhand").write_text("x = (\n", encoding="utf-8")
+    with pytest.raises(bundle.BundleError) as info:
+        bundle.collect(str(program / "main.jhand"))
+    message = str(info.value)
+    assert "helper.jhand" in message and os.path.join("pkg", "util.jhand") in message
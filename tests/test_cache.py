@@ -0,0 +1,83 @@
+import inspect
+import threading
+
+import pytest
+
+from jhand import cache
+
+
+def race(n, fn):
+    errors = []
+    barrier = threading.Barrier(n)
+
+    def worker(index):
+        try:
+            barrier.wait()
+            fn(index)
+        except Exception as e:  # thread ki exception test tak pahunche
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+
+
+def test_concurrent_get_code_builds_once(tmp_path, monkeypatch):
+    path = tmp_path / "prog.jhand"
+    path.write_text("x = 6 * 7\n", encoding="utf-8")
+    builds = []
+    real = cache.compile_source
+
+    def counting(*args, **kwargs):
+        builds.append(args[1])
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(cache, "compile_source", counting)
+    results = []
+
+    def run(_):
+        env = {}
+        exec(cache.get_code(str(path)), env)
+        results.append(env["x"])
+
+    race(8, run)
+    assert results == [42] * 8
+    # entry lock: baaki threads pehle wale ki likhi entry padhte hain
+    assert len(builds) == 1
+
+
+def test_concurrent_versions_never_mix(tmp_path):
+    path = tmp_path / "prog.jhand"
+    path.write_text("", encoding="utf-8")
+    sources = [f"x = {n}\n" for n in range(4)]
+
+    def run(index):
+        for k in range(25):
+            n = (index + k) % len(sources)
+            env = {}
+            exec(cache.get_code(str(path), sources[n]), env)
+            assert env["x"] == n
+
+    race(6, run)
+    key = cache.source_key(sources[1])
+    code = cache.get_code(str(path), sources[1])
+    assert cache._read_entry(cache.cache_paths(str(path))[0], key)[1] == code
+
+
+def test_store_top_level_await_entry(tmp_path, monkeypatch):
+    path = tmp_path / "prog.jhand"
+    source = "laao asyncio\nawait asyncio.sleep(0)\nx = 42\n"
+    path.write_text(source, encoding="utf-8")
+    key = cache.source_key(source, top_level_await=True)
+    cache.store(str(path), key, cache.compile_source(source, str(path), top_level_await=True),
+                top_level_await=True)
+
+    # entry --async wale path par gayi, plain entry par nahi
+    assert cache._read_entry(cache.cache_paths(str(path), top_level_await=True)[0], key)
+    assert cache._read_entry(cache.cache_paths(str(path))[0], key) is None
+    monkeypatch.setattr(cache, "compile_source", lambda *a, **k: pytest.fail("recompiled"))
+    code = cache.get_code(str(path), top_level_await=True)
+    assert code.co_flags & inspect.CO_COROUTINE
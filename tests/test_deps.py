@@ -0,0 +1,67 @@
+import importlib
+import io
+
+import pytest
+
+from jhand import deps, importer, runtime
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "main.jhand").write_text(
+        "laao os\nlaao helper\nlaao localpy\nlaao cv2\n"
+        "koshish:\n    laao jhand_optional_nahi\nphaansi ImportError:\n    pass\n",
+        encoding="utf-8")
+    (tmp_path / "helper.jhand").write_text("laao os.path\nlaao jhand_missing_mod.sub\n",
+                                           encoding="utf-8")
+    (tmp_path / "localpy.py").write_text("", encoding="utf-8")
+    installed = importer._hook is not None
+    yield tmp_path
+    if not installed:
+        importer.uninstall()
+    importlib.invalidate_caches()
+
+
+def test_scan_follows_jhand_modules(project):
+    requirements, errors = deps.scan(str(project / "main.jhand"))
+    assert errors == []
+    found = {(r.module, r.path, r.line, r.optional) for r in requirements}
+    assert ("jhand_optional_nahi", "main.jhand", 6, True) in found
+    assert ("jhand_missing_mod.sub", "helper.jhand", 2, False) in found
+    assert ("helper", "main.jhand", 2, False) in found
+
+
+def test_missing_finds_only_absent_modules(project, monkeypatch):
+    monkeypatch.setattr(importer.JhandLoader, "optimize", 1)
+    requirements, _ = deps.scan(str(project / "main.jhand"))
+    absent = {r.module for r in deps.missing(requirements, str(project))}
+    assert {"jhand_optional_nahi", "jhand_missing_mod.sub"} <= absent
+    # helper.jhand aur localpy.py entry ke folder se milte hain
+    assert not absent & {"os", "os.path", "helper", "localpy"}
+    # hook ke options waise hi rahe (jhand -O ke saath deps check)
+    assert importer.JhandLoader.optimize == 1
+
+
+def test_install_makes_one_pip_call(project, monkeypatch):
+    calls = []
+    monkeypatch.setattr(runtime, "pip_install", lambda packages, wheelhouse=None:
+                        calls.append((packages, wheelhouse)))
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *a: None
+                        if name in ("cv2", "jhand_missing_mod", "jhand_optional_nahi") else True)
+    out = io.StringIO()
+    assert not deps.check(str(project / "main.jhand"), install=True, wheelhouse="wheels", out=out)
+    # optional import install nahi hota; cv2 ka pip naam alag hai
+    assert calls == [(["jhand_missing_mod", "opencv-python"], "wheels")]
+    report = out.getvalue()
+    assert "❌ cv2  (pip: opencv-python)  — main.jhand:4" in report
+    assert "⚠️ jhand_optional_nahi  (optional" in report
+
+
+def test_cli_reports_everything_at_once(run_cli, project):
+    (project / "broken.jhand").write_text("bhenchod f(:\n", encoding="utf-8")
+    (project / "main.jhand").write_text("laao broken\nlaao jhand_missing_a\nlaao jhand_missing_b\n",
+                                        encoding="utf-8")
+    result = run_cli("deps", "main.jhand")
+    assert result.returncode == 1
+    assert "🔴 broken.jhand" in result.stdout
+    assert "jhand_missing_a" in result.stdout and "jhand_missing_b" in result.stdout
@@ -0,0 +1,71 @@
+import gc
+import importlib
+import linecache
+import sys
+
+import pytest
+
+from jhand import embed, importer, sourcemap
+
+
+@pytest.fixture
+def hook():
+    """Leave the import hook (and ``sys.modules``) the way the test found them."""
+    installed = importer._hook is not None
+    before = set(sys.modules)
+    yield
+    for name in set(sys.modules) - before:
+        del sys.modules[name]
+    if not installed:
+        importer.uninstall()
+    importlib.invalidate_caches()
+
+
+def test_compile_and_run():
+    total = embed.compile("c = a + b\nc * 2")
+    assert total(a=1, b=2) == 6
+    assert total.run({"a": 5, "b": 5}) == 20
+
+    ns = {}
+    embed.compile("jama = x + 1").run({"x": 1}, namespace=ns)
+    assert ns["jama"] == 2
+
+
+def test_runtime_error_has_jhand_position():
+    snippet = embed.compile("x = 1\nagar x:\n    y = x / 0\n")
+    with pytest.raises(embed.JhandRuntimeError) as info:
+        snippet()
+    assert info.value.type_name == "ZeroDivisionError"
+    assert (info.value.line, info.value.col) == (3, 4)
+    assert isinstance(info.value.__cause__, ZeroDivisionError)
+
+
+def test_syntax_error_keeps_python_column():
+    with pytest.raises(embed.JhandSyntaxError) as info:
+        embed.compile("x = 1\nagar x:\n        z = 1 2\n")
+    # generated code 4 spaces par hai, .jhand mein 8 — caret "2" par hi rahe
+    assert info.value.lineno == 3
+    assert info.value.text[info.value.offset - 1] == "2"
+
+
+def test_sibling_modules_resolve_against_filename(tmp_path, hook):
+    (tmp_path / "helper_emb.jhand").write_text("bhenchod dbl(x):\n    leja x * 2\n",
+                                               encoding="utf-8")
+    snippet = embed.compile("laao helper_emb\nhelper_emb.dbl(21)\n",
+                            filename=str(tmp_path / "main.jhand"))
+    assert snippet() == 42
+    # folder sirf run ke dauraan sys.path par tha
+    assert str(tmp_path) not in sys.path
+
+
+def test_old_snippet_gc_keeps_newer_entries():
+    old = embed.compile("1 + 1", filename="<shared>")
+    new = embed.compile("2 + 2", filename="<shared>")
+    del old
+    gc.collect()
+    assert sourcemap._registry.get("<shared>") is new.source_map
+    assert linecache.getline("<shared>", 1) == "2 + 2"
+
+    del new
+    gc.collect()
+    assert "<shared>" not in sourcemap._registry
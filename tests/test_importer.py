@@ -0,0 +1,67 @@
+import importlib
+import sys
+
+import pytest
+
+from jhand import importer, transpiler
+from jhand.lexer import Lexer
+from jhand.parser import Parser
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """``tmp_path`` on ``sys.path`` with the .jhand hook; modules imported from it are dropped."""
+    installed = importer._hook is not None
+    importer.install()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    before = set(sys.modules)
+    yield tmp_path
+    for name in set(sys.modules) - before:
+        del sys.modules[name]
+    if not installed:
+        importer.uninstall()
+    importlib.invalidate_caches()
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_relative_imports_dots_only(project):
+    write(project / "jpkg" / "helper.jhand", 'bhenchod naam():\n    leja "helper"\n')
+    write(project / "jpkg" / "__init__.jhand", "se_laao . laao helper\n")
+    deep = write(project / "jpkg" / "sub" / "deep.jhand",
+                 "se_laao .. laao helper\nse_laao ..helper laao naam\n"
+                 "bhenchod dono():\n    leja helper.naam() + naam()\n")
+    write(project / "jpkg" / "sub" / "__init__.jhand", "")
+
+    assert "from .. import helper" in transpiler.transpile(deep.read_text(encoding="utf-8"))
+    assert importlib.import_module("jpkg").helper.naam() == "helper"
+    assert importlib.import_module("jpkg.sub.deep").dono() == "helperhelper"
+
+    node = Parser(Lexer("se_laao .. laao helper\n").iter_tokens()).parse().children[0]
+    assert node.module == ".."
+    assert transpiler.import_targets(node, str(deep)) == [str(project / "jpkg" / "helper.jhand")]
+
+
+def test_path_order_is_respected(project, tmp_path_factory, monkeypatch):
+    early = tmp_path_factory.mktemp("early")
+    write(early / "jhand_shadow.py", "WHO = 'py'\n")
+    write(project / "jhand_shadow.jhand", 'WHO = "jhand"\n')
+    write(project / "jhand_first.jhand", 'WHO = "jhand"\n')
+    late = tmp_path_factory.mktemp("late")
+    write(late / "jhand_first.py", "WHO = 'py'\n")
+    monkeypatch.syspath_prepend(str(early))
+    monkeypatch.setattr(sys, "path", sys.path + [str(late)])
+
+    assert importlib.import_module("jhand_shadow").WHO == "py"
+    assert importlib.import_module("jhand_first").WHO == "jhand"
+
+
+def test_jhand_does_not_shadow_stdlib(project, monkeypatch):
+    write(project / "textwrap.jhand", 'WHO = "jhand"\n')
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if p != str(project)] + [str(project)])
+    monkeypatch.delitem(sys.modules, "textwrap", raising=False)
+    assert not hasattr(importlib.import_module("textwrap"), "WHO")
@@ -0,0 +1,69 @@
+import glob
+import os
+import random
+
+from jhand.incremental import IncrementalTranspiler
+from jhand.lexer import Lexer
+from jhand.parser import Parser
+from jhand.transpiler import Transpiler
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "examples")
+
+
+def whole(source):
+    """Output of a plain whole-file transpile — what incremental must match."""
+    try:
+        t = Transpiler(Parser(Lexer(source).iter_tokens()).parse(), preserve_lines=True)
+        return t.transpile(), list(t.source_map.lines), list(t.source_map.cols)
+    except SyntaxError:
+        return None
+
+
+def incremental(inc, source):
+    try:
+        py = inc.transpile(source)
+        return py, list(inc.source_map.lines), list(inc.source_map.cols)
+    except SyntaxError:
+        return None
+
+
+def test_reuses_unchanged_statements():
+    inc = IncrementalTranspiler(preserve_lines=True)
+    inc.transpile("x = 1\nbol(x)\n\nbhenchod f():\n    leja x\nf()\n")
+    edited = "x = 2\nbol(x)\n\nbhenchod f():\n    leja x\nf()\n"
+    py = inc.transpile(edited)
+    # badla hua "x = 2" aur EOF wala aakhri unit (kabhi cache nahi hota) hi dobara
+    assert inc.stats == {"units": 4, "reused": 2, "rebuilt": 2}
+    assert (py, list(inc.source_map.lines)) == whole(edited)[:2]
+
+
+def test_padding_after_a_unit_that_overflows():
+    # pehli line do Python lines banti hai — baad ke unit ki blank padding utni kam
+    source = "bol(1)    c = 5\nagar x:\n    y = 1\n\n    z = 2\n"
+    assert incremental(IncrementalTranspiler(preserve_lines=True), source) == whole(source)
+
+    inc = IncrementalTranspiler(preserve_lines=True)
+    inc.transpile("bol(1)\nagar x:\n    y = 1\n\n    z = 2\n")
+    assert incremental(inc, source) == whole(source)
+
+
+def test_random_edits_match_whole_file():
+    rng = random.Random(12)
+    sources = []
+    for path in sorted(glob.glob(os.path.join(EXAMPLES, "*.jhand"))):
+        with open(path, encoding="utf-8") as f:
+            sources.append(f.read())
+    snippets = ["\n", "\n\n", "# c\n", "    ", "    c = 5", ":", "\nwarna:\n", "bol(\n", ")\n", '"""\n']
+    for _ in range(150):
+        source = rng.choice(sources)
+        inc = IncrementalTranspiler(preserve_lines=True)
+        incremental(inc, source)
+        for _ in range(3):
+            p = rng.randrange(len(source) + 1)
+            if rng.random() < 0.3:
+                source = source[:p] + source[p + 1:]
+            else:
+                source = source[:p] + rng.choice(snippets) + source[p:]
+            expected = whole(source)
+            assert incremental(inc, source) == expected, source
+            assert incremental(IncrementalTranspiler(preserve_lines=True), source) == expected, source
@@ -0,0 +1,67 @@
+import json
+import time
+
+import pytest
+
+from jhand import cache, isolate
+
+pytestmark = pytest.mark.skipif(not isolate.supported(), reason="needs fork + resource")
+
+
+def compiled(tmp_path, source):
+    path = tmp_path / "prog.jhand"
+    path.write_text(source, encoding="utf-8")
+    return cache.compile_source(source, str(path)).code
+
+
+def test_ok_run_report(tmp_path):
+    report = isolate.run_isolated(compiled(tmp_path, "x = sum(range(1000))\n"))
+    assert (report.status, report.exit_code, report.signal, report.exception) == ("ok", 0, None, None)
+    assert report.wall_time > 0 and report.cpu_time >= 0 and report.peak_rss > 0
+
+    isolate.write_report(report, str(tmp_path / "run.json"))
+    data = json.loads((tmp_path / "run.json").read_text(encoding="utf-8"))
+    assert set(data) == set(isolate.RunReport._fields)
+    assert "📊 wall" in isolate.summary(report)
+
+
+def test_error_report_has_jhand_line(tmp_path):
+    report = isolate.run_isolated(compiled(tmp_path, "x = 1\ny = x / 0\n"), roast=False)
+    assert report.status == "error" and report.exit_code == 1
+    assert report.exception["type"] == "ZeroDivisionError"
+    assert report.exception["file"].endswith("prog.jhand") and report.exception["line"] == 2
+
+
+def test_exit_code_passes_through(tmp_path):
+    report = isolate.run_isolated(compiled(tmp_path, "laao sys\nsys.exit(3)\n"))
+    assert (report.status, report.exit_code) == ("exit", 3)
+
+
+def test_wall_limit_kills_group(tmp_path):
+    marker = tmp_path / "worker-alive"
+    source = (f"laao os\nlaao time\n"
+              f"agar os.fork() == 0:\n"
+              f"    time.sleep(2)\n"
+              f"    open({str(marker)!r}, 'w').close()\n"
+              f"    os.kill(os.getpid(), 9)\n"
+              f"time.sleep(30)\n")
+    report = isolate.run_isolated(compiled(tmp_path, source), wall=0.5)
+    assert report.status == "timeout"
+    assert report.wall_time < 10
+    assert "Wall limit (0.5s)" in isolate.summary(report, wall=0.5)
+    # forked worker bhi mara — 2 second baad marker nahi bana
+    time.sleep(2.5)
+    assert not marker.exists()
+
+
+def test_cpu_limit(tmp_path):
+    report = isolate.run_isolated(compiled(tmp_path, "jabtak haaan:\n    pass\n"), cpu=1, wall=30)
+    assert report.status == "cpu_limit"
+    assert report.cpu_time >= 0.9  # rusage ki granularity
+
+
+def test_memory_limit(tmp_path):
+    report = isolate.run_isolated(compiled(tmp_path, "x = bytearray(4 * 1024 ** 3)\n"),
+                                  memory=1 << 30, roast=False)
+    assert report.status == "memory"
+    assert report.exception["type"] == "MemoryError"
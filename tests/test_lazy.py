@@ -0,0 +1,49 @@
+import sys
+
+import pytest
+
+from jhand import lazy
+
+
+@pytest.fixture
+def lazymod(tmp_path, monkeypatch):
+    """A module ``jhand_lazymod`` that prints when its body runs."""
+    (tmp_path / "jhand_lazymod.py").write_text('print("lazymod chala")\nVALUE = 42\n',
+                                               encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "jhand_lazymod"
+    sys.modules.pop("jhand_lazymod", None)
+
+
+def test_module_runs_on_first_attribute_access(lazymod, capsys):
+    mod = lazy.module(lazymod)
+    assert sys.modules[lazymod] is mod
+    assert capsys.readouterr().out == ""
+    assert mod.VALUE == 42
+    assert capsys.readouterr().out == "lazymod chala\n"
+    # dobara maango to wahi module
+    assert lazy.module(lazymod) is mod
+
+
+def test_missing_module_fails_at_the_import_line():
+    with pytest.raises(ModuleNotFoundError):
+        lazy.module("jhand_nahi_hai_koi")
+
+
+def test_eager_modules_import_at_once(lazymod, monkeypatch, capsys):
+    monkeypatch.setattr(lazy, "EAGER", lazy.EAGER | {lazymod})
+    lazy.module(lazymod)
+    assert capsys.readouterr().out == "lazymod chala\n"
+
+
+def test_cli_lazy_and_eager(run_cli, tmp_path):
+    (tmp_path / "lazymod.py").write_text('print("lazymod chala")\nVALUE = 42\n', encoding="utf-8")
+    (tmp_path / "main.jhand").write_text('laao lazymod\nbol("pehle")\nbol(lazymod.VALUE)\n',
+                                         encoding="utf-8")
+
+    normal = run_cli("main.jhand")
+    assert normal.stdout.split() == ["lazymod", "chala", "pehle", "42"]
+    lazy_run = run_cli("--lazy-imports", "main.jhand")
+    assert lazy_run.stdout.split() == ["pehle", "lazymod", "chala", "42"], lazy_run.stderr
+    eager = run_cli("--lazy-imports", "--eager", "lazymod", "main.jhand")
+    assert eager.stdout.split() == normal.stdout.split()
@@ -0,0 +1,55 @@
+import glob
+import io
+import os
+
+import pytest
+
+from conftest import ROOT
+from jhand import cache
+from jhand.lexer import Lexer
+
+
+@pytest.mark.parametrize("source, lineno, offset, text", [
+    ("x = 1\nnaya_kutta __init__(self):\n", 2, 12, "naya_kutta __init__(self):"),
+    ("tez_bhenchod x = 1\n", 1, 14, "tez_bhenchod x = 1"),
+])
+def test_frontend_errors_have_positions(source, lineno, offset, text):
+    with pytest.raises(SyntaxError) as info:
+        cache.compile_source(source, "<test>")
+    assert (info.value.lineno, info.value.offset, info.value.text) == (lineno, offset, text)
+
+
+def lex(source):
+    """Tokens as tuples, or the SyntaxError's (msg, lineno, offset)."""
+    try:
+        return [(t.type, t.value, t.line, t.col) for t in Lexer(source).tokenize()]
+    except SyntaxError as se:
+        return (se.msg, se.lineno, se.offset)
+
+
+def lex_stream(source, chunk_size):
+    try:
+        return [(t.type, t.value, t.line, t.col)
+                for t in Lexer(io.StringIO(source), chunk_size=chunk_size).tokenize()]
+    except SyntaxError as se:
+        return (se.msg, se.lineno, se.offset)
+
+
+EXAMPLES = sorted(glob.glob(os.path.join(ROOT, "examples", "*.jhand")))
+TRICKY = [
+    'x = 1.5 ** 2\ny **= 3\nz = .5e-3 // 2\n',
+    's = """ek\ndo "" teen\n"""\nt = f"{s!r}" + rb\'\\x00\' + \'\'\n',
+    'bol(x)  # comment "quote\nagar x >= 10 aur y != 2:\n    pass\n',
+    'x = 1\ny = 2 $ 3\n',
+]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_stream_matches_string(chunk_size):
+    assert EXAMPLES
+    for path in EXAMPLES:
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        assert lex_stream(source, chunk_size) == lex(source), path
+    for source in TRICKY:
+        assert lex_stream(source, chunk_size) == lex(source), source
@@ -0,0 +1,75 @@
+import pytest
+
+from jhand import optimizer, transpiler
+from jhand.lexer import Lexer
+from jhand.parser import Parser
+
+
+def run(source: str, optimize: int = 1) -> dict:
+    env = {"__name__": "__jhand_test__"}
+    exec(compile(transpiler.transpile(source, optimize=optimize), "<jhand>", "exec"), env)
+    return env
+
+
+def test_folds_constants():
+    assert "x = 86400" in transpiler.transpile("x = 60 * 60 * 24\n", optimize=1)
+
+
+def test_drops_harmless_dead_code():
+    py = transpiler.transpile(
+        'bhenchod f():\n    leja 1\n    bol("dead")\nagar naaa:\n    bol("dead")\n', optimize=1)
+    assert "dead" not in py
+
+
+def test_unreachable_yield_keeps_generator():
+    source = "bhenchod gen():\n    leja\n    yield 1\nresult = list(gen())\n"
+    assert run(source, 0)["result"] == run(source)["result"] == []
+
+
+def test_dead_branch_keeps_local_binding():
+    source = "x = 5\nbhenchod f():\n    agar naaa:\n        x = 1\n    leja x\n"
+    for level in (0, 1):
+        with pytest.raises(UnboundLocalError):
+            run(source, level)["f"]()
+
+
+def test_dead_else_branch_keeps_global():
+    source = ("x = 5\nbhenchod f():\n    agar haaan:\n        pass\n    warna:\n"
+              "        global x\n    x = 7\nf()\n")
+    assert run(source, 0)["x"] == run(source)["x"] == 7
+
+
+def test_while_false_keeps_binding():
+    source = "x = 5\nbhenchod f():\n    jabtak naaa:\n        x = 1\n    leja x\n"
+    with pytest.raises(UnboundLocalError):
+        run(source)["f"]()
+
+
+def test_unreachable_after_if_chain():
+    source = ("bhenchod f(a):\n    agar a:\n        leja 1\n    warna:\n        leja 2\n"
+              "    yield 3\nresult = list(f(1))\n")
+    assert run(source)["result"] == []
+
+
+def mapped(source: str, optimize: int):
+    tree = Parser(Lexer(source).iter_tokens()).parse()
+    if optimize:
+        optimizer.optimize(tree, optimize)
+    t = transpiler.Transpiler(tree, preserve_lines=True)
+    py = t.transpile()
+    return py, list(t.source_map.lines)
+
+
+def test_dead_block_keeps_lines():
+    sources = [
+        "x = 5\nbhenchod f():\n    agar naaa:\n        x = 1\n        y = 2\n    z = x\n    leja z\n",
+        "x = 5\nbhenchod f():\n    jabtak naaa:\n        x = 1\n    z = x\n    leja z\n",
+        "bhenchod f():\n\n    leja 1\n\n    yield 2\n    z = 3\nf()\n",
+    ]
+    for source in sources:
+        py, lines = mapped(source, 1)
+        assert "if False:" in py
+        # har line apni hi .jhand line par — dead block ke baad koi drift nahi
+        plain = mapped(source, 0)[1]
+        assert len(lines) == len(plain)
+        assert [line for line in plain if line] == [lines[k] for k, line in enumerate(plain) if line]
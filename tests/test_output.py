@@ -0,0 +1,95 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from conftest import ROOT
+
+unix = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork/SIGTERM flush is Unix-only")
+
+
+def python(tmp_path, script: str, **kwargs):
+    """Start ``script`` (with stdout buffered by jhand) in a fresh interpreter."""
+    code = "from jhand import output\n" + textwrap.dedent(script)
+    return subprocess.Popen([sys.executable, "-c", code], cwd=tmp_path, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True,
+                            env=dict(os.environ, PYTHONPATH=ROOT), **kwargs)
+
+
+def test_flushed_on_exit(tmp_path):
+    proc = python(tmp_path, """
+        output.buffer_stdout(interval=0)
+        for i in range(20000):
+            print(i)
+    """)
+    out, err = proc.communicate(timeout=60)
+    assert proc.returncode == 0, err
+    assert out.split() == [str(i) for i in range(20000)]
+
+
+@unix
+def test_flushed_on_sigterm(tmp_path):
+    marker = tmp_path / "ready"
+    proc = python(tmp_path, f"""
+        import time
+        output.buffer_stdout(interval=0)
+        print("marne se pehle")
+        open({str(marker)!r}, "w").close()
+        time.sleep(60)
+    """)
+    deadline = time.monotonic() + 30
+    while not marker.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+    proc.send_signal(signal.SIGTERM)
+    out, _ = proc.communicate(timeout=30)
+    # default handler jaisa SIGTERM se hi mara, lekin buffer likh ke
+    assert proc.returncode == -signal.SIGTERM
+    assert out == "marne se pehle\n"
+
+
+@unix
+def test_fork_does_not_duplicate_buffer(tmp_path):
+    proc = python(tmp_path, """
+        import os, sys
+        output.buffer_stdout(interval=0)
+        print("parent pehle")
+        pid = os.fork()
+        if pid == 0:
+            print("child")
+            sys.stdout.flush()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        print("parent baad")
+    """)
+    out, err = proc.communicate(timeout=60)
+    assert proc.returncode == 0, err
+    assert out.splitlines() == ["parent pehle", "child", "parent baad"]
+
+
+def test_interval_flush_reaches_pipe_while_running(tmp_path):
+    proc = python(tmp_path, """
+        import time
+        output.buffer_stdout(interval=0.1)
+        print("tick")
+        time.sleep(30)
+    """)
+    try:
+        start = time.monotonic()
+        assert proc.stdout.readline() == "tick\n"
+        assert time.monotonic() - start < 10
+    finally:
+        proc.kill()
+        proc.communicate()
+
+
+def test_cli_output_before_error_report(run_cli, tmp_path):
+    (tmp_path / "prog.jhand").write_text(
+        "haramkhor i in range(3000):\n    bol(i)\nx = 1 / 0\n", encoding="utf-8")
+    result = run_cli("--buffered-output", "prog.jhand")
+    lines = result.stdout.splitlines()
+    assert lines[:3000] == [str(i) for i in range(3000)]
+    assert "ZeroDivisionError" in result.stdout + result.stderr
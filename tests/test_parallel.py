@@ -0,0 +1,31 @@
+import pytest
+
+from jhand import parallel
+
+
+def square(n):
+    return n * n
+
+
+def test_pmap_threads_keeps_order():
+    assert parallel.pmap(square, range(50)) == [n * n for n in range(50)]
+
+
+def test_pimap_unordered_yields_everything():
+    assert sorted(parallel.pimap(square, range(50), ordered=False, chunksize=3)) == \
+        [n * n for n in range(50)]
+
+
+def test_worker_error_propagates():
+    with pytest.raises(ZeroDivisionError):
+        parallel.pmap(lambda n: 1 // n, [1, 0, 2])
+
+
+def test_process_mode_sees_functions_defined_later(tmp_path, run_cli):
+    (tmp_path / "two.jhand").write_text(
+        "bhenchod sq(n):\n    leja n * n\n"
+        "bol(milke_karo(sq, range(5), processes=haaan))\n"
+        "bhenchod cube(n):\n    leja n * n * n\n"
+        "bol(milke_karo(cube, range(5), processes=haaan))\n", encoding="utf-8")
+    result = run_cli("two.jhand")
+    assert result.stdout.splitlines() == ["[0, 1, 4, 9, 16]", "[0, 1, 8, 27, 64]"]
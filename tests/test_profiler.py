@@ -0,0 +1,71 @@
+import json
+import pstats
+
+from jhand import profiler
+
+PROG = ("bhenchod fib(n):\n"
+        "    agar n < 2:\n"
+        "        return n\n"
+        "    return fib(n - 1) + fib(n - 2)\n"
+        "\n"
+        "bol(fib(15))\n")
+
+
+def write_prog(tmp_path):
+    (tmp_path / "prog.jhand").write_text(PROG, encoding="utf-8")
+
+
+def test_time_phases(tmp_path):
+    write_prog(tmp_path)
+    phases, code, n_tokens, n_lines = profiler.time_phases(str(tmp_path / "prog.jhand"))
+    assert [name for name, _ in phases] == ["read", "lex", "parse", "transpile", "compile"]
+    assert all(secs >= 0 for _, secs in phases)
+    assert n_tokens > 0 and n_lines == 7
+    env = {}
+    exec(code, env)
+    assert env["fib"](10) == 55
+
+    phases, *_ = profiler.time_phases(str(tmp_path / "prog.jhand"), optimize=1)
+    assert "optimize" in [name for name, _ in phases]
+
+
+def test_cli_profile_report(run_cli, tmp_path):
+    write_prog(tmp_path)
+    result = run_cli("--profile", "prog.jhand")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("610\n")
+    report = result.stderr
+    assert "🧰 Front-end phases:" in report and "🏃 Program run:" in report
+    for name in ("read", "lex", "parse", "transpile", "compile", "total"):
+        assert f"   {name} " in report
+    # hotspot .jhand file/line par map hota hai, generated Python par nahi
+    assert "🔥 JHAND functions" in report
+    assert "prog.jhand:1(fib)" in report
+
+
+def test_cli_profile_out_pstats(run_cli, tmp_path):
+    write_prog(tmp_path)
+    result = run_cli("--profile-out", "run.prof", "prog.jhand")
+    assert result.returncode == 0, result.stderr
+    assert "💾 Profile saved: run.prof" in result.stderr
+    stats = pstats.Stats(str(tmp_path / "run.prof"))
+    assert any(name == "fib" for _, _, name in stats.stats)
+
+
+def test_cli_profile_out_speedscope(run_cli, tmp_path):
+    write_prog(tmp_path)
+    result = run_cli("--profile-out", "run.json", "prog.jhand")
+    assert result.returncode == 0, result.stderr
+    assert "prog.jhand:1(fib)" in result.stderr
+    data = json.loads((tmp_path / "run.json").read_text(encoding="utf-8"))
+    frames = data["shared"]["frames"]
+    fib = [i for i, f in enumerate(frames) if f["name"] == "fib"]
+    assert len(fib) == 1 and frames[fib[0]]["file"].endswith("prog.jhand")
+    assert frames[fib[0]]["line"] == 1
+
+    events = data["profiles"][0]["events"]
+    opens = [e for e in events if e["type"] == "O"]
+    closes = [e for e in events if e["type"] == "C"]
+    assert len(opens) == len(closes)
+    assert sum(e["frame"] == fib[0] for e in opens) == 1973  # fib(15) ke calls
+    assert [e["at"] for e in events] == sorted(e["at"] for e in events)
@@ -0,0 +1,25 @@
+import sys
+
+from jhand import runtime
+
+
+def test_run_restores_host_main():
+    host = sys.modules["__main__"]
+    seen = {}
+    runtime.builtins.jhand_test_seen = seen
+    try:
+        runtime.run_jhand('import sys\njhand_test_seen["main"] = sys.modules["__main__"]')
+    finally:
+        del runtime.builtins.jhand_test_seen
+    assert seen["main"] is not host
+    assert sys.modules["__main__"] is host
+
+
+def test_own_main_keeps_program_main(monkeypatch):
+    host = sys.modules["__main__"]
+    monkeypatch.setattr(runtime, "OWN_MAIN", True)
+    try:
+        runtime.execute(compile("marker = 42", "<jhand>", "exec"))
+        assert sys.modules["__main__"].marker == 42
+    finally:
+        sys.modules["__main__"] = host
@@ -0,0 +1,99 @@
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"),
+                                reason="jhand serve is Unix-only")
+
+
+def env(socket_path):
+    return dict(os.environ, PYTHONPATH=ROOT, JHAND_SOCKET=str(socket_path))
+
+
+@pytest.fixture
+def server(tmp_path):
+    """A running ``jhand serve -w 1`` on a socket in ``tmp_path``; yields the socket path."""
+    socket_path = tmp_path / "jhand.sock"
+    proc = subprocess.Popen([sys.executable, "-m", "jhand.cli", "serve", "-w", "1"],
+                            cwd=tmp_path, env=env(socket_path), stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT, text=True)
+    try:
+        assert "server chalu" in proc.stdout.readline()
+        yield socket_path
+    finally:
+        proc.terminate()
+        proc.communicate(timeout=30)
+    assert not socket_path.exists()
+
+
+def client(tmp_path, socket_path, *args):
+    return subprocess.run([sys.executable, "-m", "jhand.client", *map(str, args)], cwd=tmp_path,
+                          env=env(socket_path), capture_output=True, text=True, timeout=60)
+
+
+def test_round_trip(server, tmp_path):
+    script = tmp_path / "prog.jhand"
+    script.write_text('laao os\nlaao sys\nbol("args", sys.argv[1:], os.getcwd())\nsys.exit(3)\n',
+                      encoding="utf-8")
+    result = client(tmp_path, server, "prog.jhand", "a", "b")
+    assert result.returncode == 3, result.stderr
+    assert result.stdout == f"args ['a', 'b'] {tmp_path}\n"
+
+    # file badli — worker naya code chalata hai
+    script.write_text('bol("doosra version")\n', encoding="utf-8")
+    result = client(tmp_path, server, "prog.jhand")
+    assert (result.returncode, result.stdout) == (0, "doosra version\n")
+
+
+def test_refuses_live_socket(server, tmp_path):
+    second = subprocess.run([sys.executable, "-m", "jhand.cli", "serve", "-w", "1"],
+                            cwd=tmp_path, env=env(server), capture_output=True, text=True,
+                            timeout=30)
+    assert second.returncode == 1
+    assert "pehle se chal raha hai" in second.stdout
+    # pehla server abhi bhi kaam kar raha hai
+    (tmp_path / "prog.jhand").write_text('bol("zinda")\n', encoding="utf-8")
+    assert client(tmp_path, server, "prog.jhand").stdout == "zinda\n"
+
+
+def test_stale_socket_replaced_other_files_kept(tmp_path):
+    stale = tmp_path / "jhand.sock"
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(stale))
+    sock.close()  # file bachi, sunne wala koi nahi
+    proc = subprocess.Popen([sys.executable, "-m", "jhand.cli", "serve", "-w", "1"],
+                            cwd=tmp_path, env=env(stale), stdout=subprocess.PIPE, text=True)
+    try:
+        assert "server chalu" in proc.stdout.readline()
+    finally:
+        proc.terminate()
+        proc.communicate(timeout=30)
+
+    not_socket = tmp_path / "data.sock"
+    not_socket.write_text("mera data", encoding="utf-8")
+    result = subprocess.run([sys.executable, "-m", "jhand.cli", "serve", "-w", "1"],
+                            cwd=tmp_path, env=env(not_socket), capture_output=True, text=True,
+                            timeout=30)
+    assert result.returncode == 1 and "socket nahi hai" in result.stdout
+    assert not_socket.read_text(encoding="utf-8") == "mera data"
+
+
+def test_sigterm_right_after_start(tmp_path):
+    # naye workers abhi fork se nikle bhi na hon tab bhi server band hona chahiye
+    for i in range(10):
+        socket_path = tmp_path / f"jhand-{i}.sock"
+        proc = subprocess.Popen([sys.executable, "-m", "jhand.cli", "serve", "-w", "32"],
+                                cwd=tmp_path, env=env(socket_path), stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True)
+        try:
+            assert "server chalu" in proc.stdout.readline()
+        finally:
+            proc.terminate()
+            out, _ = proc.communicate(timeout=30)
+        assert "server band" in out and "Traceback" not in out, out
+        assert not socket_path.exists()
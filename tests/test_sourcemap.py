@@ -0,0 +1,48 @@
+import warnings
+
+from jhand import cache, sourcemap
+
+
+def test_cached_variant_map_is_used(tmp_path):
+    path = tmp_path / "prog.jhand"
+    path.write_text('x = 1\nutha ValueError("x")\nbol("dead")\nbol("dead")\n', encoding="utf-8")
+    path = str(path)
+    cache.get_code(path)                 # default variant ka entry + map
+    cache.get_code(path, optimize=2)     # -O wala, alag map
+    sourcemap._registry.pop(path, None)
+
+    cache.get_code(path, optimize=2)     # warm: cache se
+    opt_py = cache.cache_paths(path, 2)[1]
+    with open(opt_py, encoding="utf-8") as f:
+        opt_lines = f.read().count("\n") + 1
+    plain_map = sourcemap.SourceMap.from_bytes(open(cache.cache_paths(path)[2], "rb").read())
+    assert len(plain_map) != opt_lines
+    assert len(sourcemap.for_file(path)) == opt_lines
+
+
+def test_fresh_compile_registers_its_map(tmp_path):
+    path = str(tmp_path / "prog.jhand")
+    compiled = cache.compile_source("a = 1\nb = 2\n", path, optimize=1)
+    assert sourcemap.for_file(path) is compiled.source_map
+
+
+def test_chained_syntax_error_is_mapped(tmp_path):
+    path = str(tmp_path / "prog.jhand")
+    source = "x = 1\nagar x:\n    y = 2\n"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    cache.compile_source(source, path)  # map register
+    generated = "PY" * 3  # traceback mein test ki apni line bhi dikhti hai
+    try:
+        try:
+            raise SyntaxError("nahi chala", (path, 3, 1, generated))
+        except SyntaxError as se:
+            raise RuntimeError("upar wala") from se
+    except RuntimeError as e:
+        exc = e
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # 3.13: TracebackException.exc_type deprecated hai
+        text = "".join(sourcemap.format_exception(type(exc), exc, exc.__traceback__))
+    assert "RuntimeError: upar wala" in text
+    assert "y = 2" in text and generated not in text
@@ -0,0 +1,44 @@
+import threading
+
+from jhand import transpiler
+
+
+def test_lru_shared_between_threads(monkeypatch):
+    monkeypatch.setattr(transpiler, "TRANSPILE_CACHE_SIZE", 8)
+    transpiler.clear_cache()
+    sources = [f"x = {n}\nagar x > 3:\n    bol(x * {n})\n" for n in range(20)]
+    expected = [transpiler._transpile(s, None, False, 0, False) for s in sources]
+    errors = []
+
+    def worker(offset):
+        try:
+            for k in range(400):
+                n = (k * 7 + offset) % len(sources)
+                if transpiler.transpile(sources[n]) != expected[n]:
+                    errors.append(n)
+        except Exception as e:  # thread ki exception test tak pahunche
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(transpiler._results) <= 8
+    transpiler.clear_cache()
+
+
+def test_lru_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(transpiler, "TRANSPILE_CACHE_SIZE", 2)
+    transpiler.clear_cache()
+    a, b, c = "a = 1\n", "b = 2\n", "c = 3\n"
+    transpiler.transpile(a)
+    transpiler.transpile(b)
+    transpiler.transpile(a)  # a ab sabse naya
+    transpiler.transpile(c)  # b nikla
+    keys = [transpiler._result_key(s, False, 0, False) for s in (a, b, c)]
+    assert list(transpiler._results) == [keys[0], keys[2]]
+    # options bhi key ka hissa hain
+    assert transpiler._result_key(a, True, 0, False) != keys[0]
+    transpiler.clear_cache()
@@ -0,0 +1,75 @@
+import os
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from conftest import ROOT
+from jhand import watch
+
+
+def test_session_tracks_imports_and_reuses_statements(tmp_path):
+    main = tmp_path / "main.jhand"
+    helper = tmp_path / "helper.jhand"
+    main.write_text("laao helper\nx = 1\nbol(helper.naam())\n", encoding="utf-8")
+    helper.write_text('bhenchod naam():\n    leja "pehla"\n', encoding="utf-8")
+
+    session = watch.Session(str(main))
+    assert session.build() is not None
+    assert session.files == {str(main), str(helper)}
+
+    main.write_text("laao helper\nx = 2\nbol(helper.naam())\n", encoding="utf-8")
+    assert session.build() is not None
+    # sirf "x = 2" aur aakhri statement dobara; helper.jhand chhua hi nahi
+    assert session._transpilers[str(main)].stats["reused"] == 1
+    assert session._transpilers[str(helper)].stats["units"] == 1
+
+    main.write_text("laao helper\nx = (\n", encoding="utf-8")
+    assert session.build() is None
+    # toota build — purani files watch mein rehti hain
+    assert str(helper) in session.files
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="watch children are forked")
+def test_rerun_on_module_change(tmp_path):
+    (tmp_path / "main.jhand").write_text("laao helper\nbol(helper.naam())\n", encoding="utf-8")
+    helper = tmp_path / "helper.jhand"
+    helper.write_text('bhenchod naam():\n    leja "pehla run"\n', encoding="utf-8")
+
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "jhand.cli", "watch", "--poll", "--interval", "0.05", "main.jhand"],
+        cwd=tmp_path, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        env=dict(os.environ, PYTHONPATH=ROOT))
+    lines = queue.Queue()
+    threading.Thread(target=lambda: [lines.put(line) for line in proc.stdout], daemon=True).start()
+
+    def wait_for(text, timeout=30):
+        deadline = time.monotonic() + timeout
+        seen = []
+        while time.monotonic() < deadline:
+            try:
+                line = lines.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            seen.append(line)
+            if text in line:
+                return
+        pytest.fail(f"{text!r} nahi aaya: {''.join(seen)}")
+
+    try:
+        wait_for("pehla run")
+        wait_for("Program khatam (exit 0)")
+        helper.write_text('bhenchod naam():\n    leja "doosra run!"\n', encoding="utf-8")
+        wait_for("Badla: helper.jhand")
+        wait_for("doosra run!")
+    finally:
+        proc.send_signal(signal.SIGINT)
+        try:
+            proc.wait(10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()